@@ -6,6 +6,9 @@ dflux_InteractiveAnalyzer - 핵심 베이스 클래스
 import os
 import sys
 import glob
+import time
+import logging
+from collections import deque
 from typing import Optional, Dict, Set, List, Tuple, Any
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -19,8 +22,14 @@ from PIL import Image
 
 from src.touch_analyzer.utils.path_manager import path_manager, get_resource_path
 from src.touch_analyzer.core.data_manager import DataManager
+from src.touch_analyzer.core.cache_manager import CacheManager
+from src.touch_analyzer.core.prefetcher import PrefetchScheduler
+from src.touch_analyzer.core.warm_start import WarmStartStore
+from src.touch_analyzer.utils.memory_utils import MemoryMonitor, MemoryPressureController, enable_copy_on_write
 from src.touch_analyzer.core.config import Config
 
+logger = logging.getLogger(__name__)
+
 
 # 한글 폰트 설정 (간소화)
 plt.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS']
@@ -42,10 +51,51 @@ class BaseVisualizer:
         self.root.title(title)
         self.root.geometry("1200x800")
         
-        # 설정 및 데이터 관리자 초기화
-        self.config = Config.default()
+        # 설정 및 데이터 관리자 초기화 (config/settings.py 우선)
+        try:
+            from config.settings import get_config
+            self.config = Config.from_dict(get_config())
+        except ImportError:
+            self.config = Config.default()
+        
+        # 캐시된 데이터프레임을 복사 없이 공유하기 위한 전제 조건 (앱 시작 시 한 번)
+        enable_copy_on_write()
         self.data_manager = DataManager(self.config)
         
+        # 프로세스 메모리 측정 (미리 읽기 상한, 메모리 압박 대응에 공용)
+        self.memory_monitor = MemoryMonitor(threshold_mb=self.config.memory_threshold_mb)
+        
+        # 다음 선택 후보 미리 읽기 (Task 이동, 최근 토글한 사용자)
+        self.prefetcher: Optional[PrefetchScheduler] = None
+        if self.config.prefetch_enabled:
+            self.prefetcher = PrefetchScheduler(
+                self.data_manager, self.config.prefetch_memory_mb,
+                memory_monitor=self.memory_monitor
+            )
+        
+        # 메모리 압박 시 해제 순서: 미리 읽기 중단 → (하위 클래스의 파생 데이터) → 데이터 캐시
+        self.memory_pressure = MemoryPressureController(
+            self.memory_monitor,
+            high_watermark_mb=self.config.memory_threshold_mb,
+            low_watermark_mb=self.config.memory_low_watermark_mb,
+            cooldown_seconds=self.config.memory_release_cooldown_seconds
+        )
+        
+        # 파생 결과 캐시 (필터 결과, 이벤트 수, 플리킹 단위 - 선택 지문 + 필터 상태 키)
+        self.derived_cache = CacheManager(
+            max_size=None, max_bytes=int(self.config.derived_cache_mb * 1024 * 1024)
+        )
+        self.selection_key: Optional[str] = None  # 현재 로드된 선택의 지문
+        
+        # 재시작 시 마지막 선택 복원 (설정으로 켠 경우에만)
+        self.warm_start = (WarmStartStore(self.config.cache_dir)
+                           if self.config.warm_start_enabled else None)
+        
+        self.memory_pressure.add_releaser("prefetch", self._release_prefetch, priority=0)
+        self.memory_pressure.add_releaser("derived", self.derived_cache.release, priority=20)
+        self.memory_pressure.add_releaser("data_cache", self.data_manager.release_memory, priority=50)
+        self._recent_user_toggles = deque(maxlen=3)
+        
         # 데이터 저장소
         self.data: Dict[str, pd.DataFrame] = {}
         self.filtered_data: Optional[pd.DataFrame] = None
@@ -84,11 +134,157 @@ class BaseVisualizer:
         if not self.selected_files:
             return None
         
-        file_paths = list(self.selected_files)
-        return self.data_manager.load_and_combine_data(file_paths)
+        # 사용자 조작으로 인한 로드가 우선 (진행 중인 미리 읽기 중단)
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+        
+        # 결합 순서를 결정적으로 유지
+        file_paths = sorted(self.selected_files)
+        combined_data = self.data_manager.load_and_combine_data(file_paths)
+        self.selection_key = (self.data_manager.get_selection_key(file_paths)
+                              if combined_data is not None else None)
+        
+        if self.prefetcher is not None and combined_data is not None:
+            self.root.after_idle(self.schedule_prefetch)
+        return combined_data
+    
+    def memoize_derived(self, key: str, compute):
+        """
+        파생 결과를 캐시에서 찾고, 없으면 계산하여 저장
+        
+        Args:
+            key: 선택 지문을 포함한 파생 결과 키
+            compute: 결과를 계산하는 함수 (None을 반환하면 저장하지 않음)
+            
+        Returns:
+            계산되었거나 캐시된 결과
+        """
+        cached = self.derived_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        start = time.perf_counter()
+        value = compute()
+        if value is not None:
+            self.derived_cache.put(key, value, cost=time.perf_counter() - start)
+        return value
+    
+    def save_warm_start(self) -> bool:
+        """
+        마지막 선택과 그 파생 결과를 저장 (종료 시 호출)
+        
+        결합 데이터는 디스크 계층에 남겨 다음 실행에서 파싱 없이 복원합니다.
+        
+        Returns:
+            bool: 저장 여부
+        """
+        if self.warm_start is None or not self.selected_files or not self.selection_key:
+            return False
+        
+        file_paths = sorted(self.selected_files)
+        self.data_manager.persist_selection(file_paths)
+        
+        selection_key = self.selection_key
+        derived = [(key, value) for key, value
+                   in self.derived_cache.export_entries(lambda key: selection_key in key)
+                   if not isinstance(value, (pd.DataFrame, pd.Series))]
+        return self.warm_start.save({
+            'users': sorted(self.selected_users),
+            'tasks': sorted(self.get_selected_tasks()),
+            'files': file_paths,
+            'selection_key': selection_key
+        }, derived)
+    
+    def restore_warm_start(self) -> bool:
+        """
+        저장된 마지막 선택을 복원하여 표시 (시작 후 유휴 시간에 호출)
+        
+        파일 지문이 저장 시점과 같을 때만 파생 결과를 캐시에 채웁니다.
+        
+        Returns:
+            bool: 복원 여부
+        """
+        if self.warm_start is None:
+            return False
+        state = self.warm_start.load_selection()
+        if state is None:
+            return False
+        
+        users = set(state.get('users', [])) & set(self.get_user_list())
+        tasks = set(state.get('tasks', [])) & set(self.task_buttons)
+        if not users or not tasks:
+            return False
+        
+        saved_files = state.get('files', [])
+        if saved_files and all(os.path.exists(path) for path in saved_files):
+            selection_key = self.data_manager.get_selection_key(saved_files)
+            if selection_key == state.get('selection_key'):
+                for key, value in self.warm_start.load_derived(selection_key):
+                    self.derived_cache.put(key, value)
+        
+        self.selected_users = users
+        for user in users:
+            if user in self.user_buttons:
+                self.user_buttons[user].configure(style='SelectedData.TButton')
+        if "all_users" in self.user_buttons:
+            self.update_all_users_button()
+        for task_num in tasks:
+            self.task_buttons[task_num].configure(style='SelectedData.TButton')
+        
+        logger.info(f"마지막 선택 복원: 사용자 {len(users)}명, Task {sorted(tasks)}")
+        self.update_selected_files()
+        return True
+    
+    def get_prefetch_candidates(self) -> List[List[str]]:
+        """
+        다음에 선택될 가능성이 높은 파일 선택 목록 (우선순위 순)
+        
+        같은 사용자들의 다음/이전 Task, 그리고 최근 토글한 사용자를 되돌린 선택을 후보로 합니다.
+        
+        Returns:
+            List[List[str]]: 정렬된 파일 경로 목록들
+        """
+        selected_tasks = self.get_selected_tasks()
+        if not self.selected_users or not selected_tasks:
+            return []
+        
+        users = sorted(self.selected_users)
+        max_tasks = self.get_max_task_count()
+        candidates = []
+        
+        for task_num in sorted(selected_tasks):
+            for adjacent in (task_num + 1, task_num - 1):
+                if 1 <= adjacent <= max_tasks and adjacent not in selected_tasks:
+                    candidates.append(sorted(self.get_task_files_for_users(adjacent, users)))
+        
+        for user in reversed(self._recent_user_toggles):
+            toggled_users = sorted(set(users) ^ {user})
+            if not toggled_users:
+                continue
+            files = set()
+            for task_num in selected_tasks:
+                files.update(self.get_task_files_for_users(task_num, toggled_users))
+            candidates.append(sorted(files))
+        
+        current = sorted(self.selected_files)
+        unique = []
+        for file_paths in candidates:
+            if file_paths and file_paths != current and file_paths not in unique:
+                unique.append(file_paths)
+        return unique
+    
+    def schedule_prefetch(self) -> None:
+        """유휴 시간에 후보 선택 미리 읽기 예약 (root.after_idle 콜백)"""
+        if self.prefetcher is None:
+            return
+        try:
+            self.prefetcher.schedule(self.get_prefetch_candidates())
+        except Exception as e:
+            logger.debug(f"미리 읽기 예약 실패: {str(e)}")
     
     def create_user_buttons(self, parent):
         """사용자 선택 버튼들 생성"""
+        self.user_buttons_frame = parent
         users = self.get_user_list()
         
         # "모든 사용자" 토글 버튼 추가
@@ -154,6 +350,10 @@ class BaseVisualizer:
     
     def toggle_user(self, user_name):
         """사용자 선택/해제 토글"""
+        if user_name in self._recent_user_toggles:
+            self._recent_user_toggles.remove(user_name)
+        self._recent_user_toggles.append(user_name)
+        
         if user_name in self.selected_users:
             self.selected_users.discard(user_name)
             try:
@@ -185,6 +385,7 @@ class BaseVisualizer:
     
     def create_task_buttons(self, parent):
         """Task 선택 버튼들 생성"""
+        self.task_buttons_frame = parent
         max_tasks = self.get_max_task_count()
         
         for i in range(1, max_tasks + 1):
@@ -224,8 +425,8 @@ class BaseVisualizer:
         
         self.show_all_data()
     
-    def update_selected_files(self):
-        """선택된 사용자들에 따라 파일들을 업데이트"""
+    def get_selected_tasks(self) -> set:
+        """현재 선택된 Task 번호들 (버튼 스타일 기준)"""
         selected_tasks = set()
         for task_num, btn in self.task_buttons.items():
             try:
@@ -234,6 +435,116 @@ class BaseVisualizer:
             except tk.TclError:
                 # 버튼이 이미 삭제된 경우 무시
                 continue
+        return selected_tasks
+    
+    def rebuild_selection_buttons(self) -> None:
+        """사용자/Task 버튼을 다시 생성하고 기존 선택 상태를 복원"""
+        selected_tasks = self.get_selected_tasks()
+        users = set(self.get_user_list())
+        self.selected_users &= users
+        
+        for frame_attr, buttons in (('user_buttons_frame', self.user_buttons),
+                                    ('task_buttons_frame', self.task_buttons)):
+            frame = getattr(self, frame_attr, None)
+            if frame is None:
+                continue
+            for child in frame.winfo_children():
+                child.destroy()
+            buttons.clear()
+        
+        if getattr(self, 'user_buttons_frame', None) is not None:
+            self.create_user_buttons(self.user_buttons_frame)
+        if getattr(self, 'task_buttons_frame', None) is not None:
+            self.create_task_buttons(self.task_buttons_frame)
+        
+        for user in self.selected_users:
+            if user in self.user_buttons:
+                self.user_buttons[user].configure(style='SelectedData.TButton')
+        for task_num in selected_tasks:
+            if task_num in self.task_buttons:
+                self.task_buttons[task_num].configure(style='SelectedData.TButton')
+        if "all_users" in self.user_buttons:
+            self.update_all_users_button()
+    
+    def start_data_watch(self) -> None:
+        """data_log 폴더 변경 감시 시작 (설정 간격으로 폴링)"""
+        interval = getattr(self.config, 'data_watch_interval', 0)
+        if interval <= 0:
+            return
+        self.data_manager.watcher.min_interval_seconds = interval / 1000 / 2
+        self.root.after(interval, self._poll_data_changes)
+    
+    def _poll_data_changes(self) -> None:
+        """주기적 변경 확인 (root.after 콜백)"""
+        try:
+            self.check_data_changes()
+        except Exception as e:
+            logger.error(f"데이터 변경 감시 오류: {str(e)}")
+        finally:
+            self.root.after(self.config.data_watch_interval, self._poll_data_changes)
+    
+    def start_memory_pressure_watch(self) -> None:
+        """메모리 압박 감시 시작 (memory_monitor_interval 간격으로 RSS 측정)"""
+        interval = self.config.memory_monitor_interval
+        if interval <= 0 or self.memory_monitor.get_memory_usage() is None:
+            return
+        self.root.after(interval, self._poll_memory_pressure)
+    
+    def _poll_memory_pressure(self) -> None:
+        """주기적 메모리 압박 확인 (root.after 콜백)"""
+        try:
+            self.memory_pressure.check()
+        except Exception as e:
+            logger.error(f"메모리 압박 감시 오류: {str(e)}")
+        finally:
+            self.root.after(self.config.memory_monitor_interval, self._poll_memory_pressure)
+    
+    def _release_prefetch(self, target_bytes: int) -> int:
+        """메모리 압박 시 미리 읽기 중단 (캐시를 더 채우지 않도록)"""
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+        return 0
+    
+    def check_data_changes(self, force: bool = False):
+        """
+        data_log 변경 사항을 확인하여 UI와 현재 화면에 반영
+        
+        Args:
+            force: 폴링 최소 간격을 무시하고 즉시 확인할지 여부
+            
+        Returns:
+            Optional[CatalogChanges]: 반영된 변경 사항 (없으면 None)
+        """
+        previous_task_count = len(self.task_buttons)
+        changes = self.data_manager.poll_changes(force=force)
+        if not changes:
+            return None
+        
+        # 사용자 폴더 또는 사용자별 파일 수가 바뀌면 버튼 재구성
+        if (changes.users_changed or changes.added or changes.removed
+                or self.get_max_task_count() != previous_task_count):
+            self.rebuild_selection_buttons()
+        
+        # 현재 선택에 해당하는 파일 목록이 바뀌었거나 선택된 파일이 수정되었으면 다시 표시
+        previous_files = set(self.selected_files)
+        if self.selected_users:
+            current_files = set()
+            for task_num in self.get_selected_tasks():
+                current_files.update(self.get_task_files_for_users(task_num, sorted(self.selected_users)))
+            # 실시간 추적 중인 파일의 수정은 테일 읽기 경로가 증분 반영하므로 다시 불러오지 않음
+            modified = {path for path in changes.modified
+                        if not self.data_manager.is_following(path)}
+            if current_files != previous_files or previous_files & modified:
+                logger.info(f"선택된 데이터 변경 감지: {len(changes.changed_paths)}개 파일")
+                self.update_selected_files()
+        elif previous_files:
+            self.update_selected_files()
+        
+        return changes
+    
+    def update_selected_files(self):
+        """선택된 사용자들에 따라 파일들을 업데이트"""
+        selected_tasks = self.get_selected_tasks()
         
         selected_users = list(self.selected_users)
         
@@ -389,4 +700,7 @@ class BaseVisualizer:
     
     def clear_cache(self) -> None:
         """캐시 클리어"""
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+        self.derived_cache.clear()
         self.data_manager.clear_cache()
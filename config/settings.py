@@ -16,6 +16,7 @@ try:
     OUTPUT_DIR = path_manager.output_dir
     BACKGROUND_IMAGES_DIR = path_manager.background_images_dir
     BACKUP_DIR = path_manager.backup_dir
+    CACHE_DIR = path_manager.cache_dir
 except ImportError:
     # 백업용 직접 경로 설정 (PathManager를 사용할 수 없는 경우)
     BASE_DIR = Path(__file__).parent.parent
@@ -23,6 +24,7 @@ except ImportError:
     OUTPUT_DIR = BASE_DIR / "data_results"
     BACKGROUND_IMAGES_DIR = BASE_DIR / "data_bg"
     BACKUP_DIR = BASE_DIR / "backup"
+    CACHE_DIR = BASE_DIR / "data_cache"
 
 # 화면 설정
 SCREEN_WIDTH = 3840
@@ -35,8 +37,15 @@ MAIN_WINDOW_TITLE = "dflux_InteractiveAnalyzer"
 
 # 데이터 처리 설정
 REQUIRED_COLUMNS = ['Time(ms)', 'TouchX', 'TouchY', 'Layer Name']
-MAX_CACHE_SIZE = 15  # 캐시 크기 증가
+MAX_CACHE_SIZE = 15  # 캐시 크기 증가 (CACHE_BUDGET_MB가 0일 때 항목 수 제한으로 사용)
+CACHE_BUDGET_MB = 512  # 메모리 캐시 바이트 예산 (MB, 0이면 항목 수 기반 LRU)
+SPILL_CACHE_MB = 1024  # 메모리에서 밀려난 결합 데이터를 보관할 디스크 용량 (MB, 0이면 비활성화)
+DERIVED_CACHE_MB = 128  # 필터 결과/이벤트 수/플리킹 단위 등 파생 결과 캐시 예산 (MB)
+WARM_START_ENABLED = False  # True면 종료 시 마지막 선택을 저장하고 다음 실행에서 복원
 MEMORY_MONITOR_INTERVAL = 3000  # 모니터링 간격 단축 (3초)
+ENABLE_COLUMN_CACHE = True  # 파싱 결과를 data_cache/에 컬럼 단위로 저장
+DATA_WATCH_INTERVAL = 2000  # data_log 변경 감시 폴링 간격 (ms, 0이면 비활성화)
+LIVE_FOLLOW_INTERVAL = 1000  # 실시간 추적(F6) 시 추가 행 확인 간격 (ms)
 
 # 시각화 설정
 DEFAULT_HEATMAP_BINS_X = 50
@@ -59,7 +68,9 @@ LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 DATA_DENSITY_THRESHOLD = 800  # 적응적 bins 조정 기준 감소
 BINS_MULTIPLIER_X = 8  # 배수 감소
 BINS_MULTIPLIER_Y = 3  # 배수 감소
-MEMORY_THRESHOLD_MB = 800.0  # 메모리 임계값 설정
+MEMORY_THRESHOLD_MB = 800.0  # 메모리 임계값 설정 (넘으면 캐시/그림 해제 시작)
+MEMORY_LOW_WATERMARK_MB = 600.0  # 이 아래로 내려가면 해제 중단 (임계값과의 차이가 히스테리시스)
+MEMORY_RELEASE_COOLDOWN_SECONDS = 10.0  # 연속 해제 사이의 최소 간격 (초)
 CACHE_TTL_SECONDS = 1800  # 캐시 수명 30분
 
 # UI 텍스트
@@ -86,14 +97,53 @@ COLORS = {
     'optimized': '#28A745'  # 최적화 상태 표시용
 }
 
+# 이벤트 분류 규칙 (레이어 이름에 대해 대소문자 구분 없는 부분 문자열 매칭)
+# - 축마다 위에서부터 처음 일치한 규칙의 label을 사용하고, 없으면 default
+# - applies_to가 있는 축은 그 문자열 중 하나를 포함한 레이어만 분류 (나머지는 해당 없음)
+# 새 게임 모드 레이어는 여기에 규칙만 추가하면 됨 (바뀌면 캐시된 분류 컬럼은 자동 재계산)
+EVENT_CLASSIFICATION_RULES = {
+    'event_type': {
+        'default': 'OTHER',
+        'rules': [
+            {'label': 'HWK', 'contains': ['hwk']},
+            {'label': 'SWIPE', 'contains': ['swipe']},
+            {'label': 'AREA', 'contains': ['area']},
+            {'label': 'BTN', 'contains': ['btn', 'button']},
+        ],
+    },
+    'hwk_subtype': {
+        'applies_to': ['hwk'],
+        'default': 'HWK_unknown',
+        'rules': [
+            {'label': 'HWK_boost', 'contains': ['boost']},
+            {'label': 'HWK_magma', 'contains': ['magma']},
+            {'label': 'HWK_drive', 'contains': ['drive']},
+        ],
+    },
+    'swipe_direction': {
+        'applies_to': ['swipe'],
+        'default': 'SWIPE_UNKNOWN',
+        'rules': [
+            {'label': 'SWIPE_UP', 'contains': ['swipe_up']},
+            {'label': 'SWIPE_DOWN', 'contains': ['swipe_down']},
+            {'label': 'SWIPE_LEFT', 'contains': ['swipe_left']},
+            {'label': 'SWIPE_RIGHT', 'contains': ['swipe_right']},
+        ],
+    },
+}
+
 # 성능 최적화 설정
 PERFORMANCE_OPTIONS = {
     'enable_lazy_loading': True,  # 지연 로딩 활성화
     'enable_adaptive_bins': True,  # 적응적 bins 활성화
     'enable_memory_monitoring': True,  # 메모리 모니터링 활성화
     'enable_cache_optimization': True,  # 캐시 최적화 활성화
-    'max_concurrent_loads': 3,  # 최대 동시 로드 수
-    'chunk_size': 10000,  # 청크 단위 처리 크기
+    'max_concurrent_loads': 3,  # 최대 동시 로드 수 (파일 로드 워커 수)
+    'use_process_pool': False,  # True면 스레드 대신 프로세스 풀로 CSV 파싱
+    'chunk_size': 10000,  # 청크 단위 처리 크기 (행 수)
+    'chunked_load_threshold_mb': 32,  # 이 크기(MB) 이상인 CSV는 청크 단위로 파싱 (0이면 비활성화)
+    'enable_prefetch': True,  # 유휴 시간에 인접 Task/최근 토글 사용자 조합을 미리 읽기
+    'prefetch_memory_mb': 256,  # 미리 읽기가 메모리 캐시를 채울 수 있는 상한 (MB)
 }
 
 def get_config():
@@ -103,7 +153,8 @@ def get_config():
             'data_dir': str(DATA_DIR),
             'output_dir': str(OUTPUT_DIR),
             'background_images_dir': str(BACKGROUND_IMAGES_DIR),
-            'backup_dir': str(BACKUP_DIR)
+            'backup_dir': str(BACKUP_DIR),
+            'cache_dir': str(CACHE_DIR)
         },
         'screen': {
             'width': SCREEN_WIDTH,
@@ -119,8 +170,16 @@ def get_config():
         'data': {
             'required_columns': REQUIRED_COLUMNS,
             'max_cache_size': MAX_CACHE_SIZE,
+            'cache_budget_mb': CACHE_BUDGET_MB,
+            'spill_cache_mb': SPILL_CACHE_MB,
+            'derived_cache_mb': DERIVED_CACHE_MB,
+            'warm_start_enabled': WARM_START_ENABLED,
             'memory_monitor_interval': MEMORY_MONITOR_INTERVAL,
-            'cache_ttl_seconds': CACHE_TTL_SECONDS
+            'cache_ttl_seconds': CACHE_TTL_SECONDS,
+            'enable_column_cache': ENABLE_COLUMN_CACHE,
+            'data_watch_interval': DATA_WATCH_INTERVAL,
+            'live_follow_interval': LIVE_FOLLOW_INTERVAL,
+            'event_rules': EVENT_CLASSIFICATION_RULES
         },
         'visualization': {
             'heatmap': {
@@ -141,6 +200,8 @@ def get_config():
             'bins_multiplier_x': BINS_MULTIPLIER_X,
             'bins_multiplier_y': BINS_MULTIPLIER_Y,
             'memory_threshold_mb': MEMORY_THRESHOLD_MB,
+            'memory_low_watermark_mb': MEMORY_LOW_WATERMARK_MB,
+            'memory_release_cooldown_seconds': MEMORY_RELEASE_COOLDOWN_SECONDS,
             'options': PERFORMANCE_OPTIONS
         },
         'logging': {
@@ -19,6 +19,10 @@ from PIL import Image, ImageTk
 
 from base_visualizer import BaseVisualizer
 from src.touch_analyzer.utils.path_manager import path_manager, ensure_output_dir
+from src.touch_analyzer.core.layer_filter import LayerExcludeFilter
+from src.touch_analyzer.core.event_types import NOT_APPLICABLE, hwk_mask, swipe_mask, touch_mask
+from src.touch_analyzer.core.flick_units import FlickIndex, session_codes, session_time_order
+from src.touch_analyzer.core.event_store import SessionTimeIndex
 
 
 # 로깅 설정
@@ -331,6 +335,9 @@ class InteractiveVisualizer(BaseVisualizer):
             # 데이터 관리 변수 초기화
             self.current_data = None
             self.current_task_files = []
+            self._combined_data = None  # 현재 선택의 결합 데이터 (필터 적용 전)
+            self._filter_key = None  # 현재 필터 상태 키 (선택 지문 + 시간 구간 + 제외 키워드)
+            self.layer_exclude_filter = LayerExcludeFilter()  # 키워드별 레이어 이름 일치 결과 캐시
             
             # matplotlib 객체 초기화
             self.fig = None
@@ -359,6 +366,17 @@ class InteractiveVisualizer(BaseVisualizer):
             # 키보드 단축키 설정
             self.setup_keyboard_shortcuts()
             
+            # data_log 폴더 변경 감시 (새 세션/사용자 자동 반영)
+            self.start_data_watch()
+            
+            # 메모리 압박 감시 (보이지 않는 탭의 그림부터 해제)
+            self.memory_pressure.add_releaser("figures", self._release_hidden_figures, priority=10)
+            self.start_memory_pressure_watch()
+            
+            # 마지막 선택 복원 (웜 스타트를 켠 경우, 창이 뜬 뒤 유휴 시간에)
+            if self.warm_start is not None:
+                self.root.after_idle(self.restore_warm_start)
+            
             # 메모리 사용량 모니터링 (개발용)
             if logger.level == logging.DEBUG:
                 self._setup_memory_monitoring()
@@ -877,27 +895,26 @@ class InteractiveVisualizer(BaseVisualizer):
             combined_data = self.load_and_combine_data()
             if combined_data is None:
                 return
-            
-            filtered_data = self._apply_time_and_layer_filters(combined_data)
+            self._combined_data = combined_data
+            
+            # 시간 구간은 세션별 이진 탐색으로 바로 잘라냄 (행 수와 무관, 구간이 연속이면 뷰)
+            # 같은 선택/시간 구간/제외 키워드 조합이면 파생 결과(개수, 터치 데이터) 재사용
+            start_time, end_time = self.start_time_var.get(), self.end_time_var.get()
+            self._filter_key = (f"{self.selection_key}:{start_time}-{end_time}:"
+                                f"{','.join(self._exclude_keywords())}")
+            filtered_data = self._apply_time_and_layer_filters(combined_data, start_time, end_time)
             self.filtered_data = filtered_data
             
             # HWK 이벤트 추출 및 슬라이더에 설정
             self._extract_and_set_hwk_events(combined_data)
             
             # 필터링된 데이터에서 이벤트 타입별로 구분
-            filtered_hwk = filtered_data[
-                filtered_data['Layer Name'].str.contains('HWK', case=False, na=False)
-            ]
-            filtered_swipe = filtered_data[
-                filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
-            ]
             # 터치 이벤트는 HWK와 SWIPE를 제외한 나머지 (플리킹 시작점 제외)
             # 원본 데이터를 전달하여 정확한 플리킹 단위 계산
-            filtered_touch = self._get_filtered_touch_data_without_flick_starts(filtered_data, combined_data)
-            
-            hwk_count = len(filtered_hwk)
-            flick_count = self._count_flick_events(filtered_data, combined_data)  # 원본 데이터 기준으로 플리킹 단위 카운트
-            touch_count = len(filtered_touch)
+            counts = self._get_event_counts(filtered_data, combined_data)
+            hwk_count = counts['hwk']
+            flick_count = counts['flick']
+            touch_count = counts['touch']
             total_filtered = len(filtered_data)
             
             if total_filtered == 0:
@@ -924,35 +941,41 @@ class InteractiveVisualizer(BaseVisualizer):
         except Exception as e:
             logger.error(f"자동 필터 적용 중 오류: {str(e)}")
     
-    def _apply_time_and_layer_filters(self, combined_data):
-        """시간 및 레이어 필터를 적용하는 공통 로직"""
+    def _apply_time_and_layer_filters(self, combined_data, start_time, end_time):
+        """
+        시간 및 레이어 필터를 적용하는 공통 로직
+        
+        Args:
+            combined_data: 결합 데이터
+            start_time: 구간 시작 (ms)
+            end_time: 구간 끝 (ms)
+            
+        Returns:
+            pd.DataFrame: 필터된 데이터 (실패 시 결합 데이터)
+        """
         try:
-            start_time = self.start_time_var.get()
-            end_time = self.end_time_var.get()
-            
-            filtered_data = combined_data[
-                (combined_data['Time(ms)'] >= start_time) & 
-                (combined_data['Time(ms)'] <= end_time)
-            ]
-            
             # HWK 이벤트는 시각화에서 표시되어야 하므로 제외하지 않음
             # (이전에는 HWK 이벤트를 제외했지만, 사용자가 볼 수 있도록 유지)
             
-            # 레이어 필터링 (제외 필터)
+            # 레이어 필터링 (제외 필터): 콤마로 구분된 키워드들을 입력한 그대로 분리
             layer_filter = self.layer_filter.get().strip()
-            if layer_filter:
-                try:
-                    # 콤마로 구분된 키워드들을 분리
-                    exclude_keywords = [keyword.strip() for keyword in layer_filter.split(',') if keyword.strip()]
-                    
-                    if exclude_keywords:
-                        # 각 키워드가 포함된 이벤트를 제외
-                        for keyword in exclude_keywords:
-                            filtered_data = filtered_data[
-                                ~filtered_data['Layer Name'].str.contains(keyword, case=False, na=False)
-                            ]
-                except Exception as e:
-                    logger.error(f"레이어 필터링 오류: {str(e)}")
+            exclude_keywords = [keyword.strip() for keyword in layer_filter.split(',')
+                                if keyword.strip()]
+            
+            def keep_layers(part):
+                # 키워드가 포함된 레이어 이름을 범주 단위로 찾아 한 번에 제외
+                return self.layer_exclude_filter.keep_mask(part['Layer Name'], exclude_keywords)
+            
+            # (세션, 시각) 순 결합 데이터를 세션마다 이진 탐색으로 잘라내면서 제외 필터 적용
+            time_index = self._get_time_index(combined_data)
+            try:
+                filtered_data = time_index.window(combined_data, start_time, end_time,
+                                                  keep_layers if exclude_keywords else None)
+            except Exception as e:
+                if not exclude_keywords:
+                    raise
+                logger.error(f"레이어 필터링 오류: {str(e)}")
+                filtered_data = time_index.window(combined_data, start_time, end_time)
             
             return filtered_data
                 
@@ -960,397 +983,182 @@ class InteractiveVisualizer(BaseVisualizer):
             logger.error(f"필터 적용 중 오류: {str(e)}")
             return combined_data
     
-    def _get_flick_start_points(self, filtered_data, original_data=None):
-        """플리킹 시작점들을 찾아서 반환 - 플리킹 단위로 그룹화"""
-        try:
-            # 원본 데이터가 제공된 경우 원본에서 플리킹 단위를 계산
-            if original_data is not None:
-                data_to_analyze = original_data
-                logger.info(f"원본 데이터에서 플리킹 단위 계산: {len(original_data)} 행")
-            else:
-                data_to_analyze = filtered_data
-                logger.info(f"필터된 데이터에서 플리킹 단위 계산: {len(filtered_data)} 행")
-            
-            # SWIPE 이벤트들을 시간순으로 정렬
-            swipe_events = data_to_analyze[
-                data_to_analyze['Layer Name'].str.contains('SWIPE', case=False, na=False)
-            ].sort_values('Time(ms)')
-            
-            logger.info(f"SWIPE 이벤트 발견: {len(swipe_events)}개")
-            
-            flick_start_points = set()
-            flick_end_points = set()  # 플리킹 종료점 (SWIPE 이벤트)
-            flick_units_info = []  # 플리킹 단위 상세 정보
-            
-            for _, swipe_row in swipe_events.iterrows():
-                current_time = swipe_row['Time(ms)']
-                
-                # 현재 SWIPE 이벤트보다 이전의 가장 가까운 터치 이벤트 찾기
-                prev_touch = data_to_analyze[
-                    (data_to_analyze['Time(ms)'] < current_time) & 
-                    (~data_to_analyze['Layer Name'].str.contains('SWIPE', case=False, na=False))
-                ].sort_values('Time(ms)', ascending=False)
-                
-                if len(prev_touch) > 0:
-                    start_point = prev_touch.iloc[0]
-                    # 플리킹 시작점의 인덱스를 저장
-                    flick_start_points.add(start_point.name)
-                    # 플리킹 종료점(SWIPE 이벤트)의 인덱스도 저장
-                    flick_end_points.add(swipe_row.name)
-                    
-                    # 플리킹 단위 정보 저장 (시간 범위 포함)
-                    flick_units_info.append({
-                        'start_time': start_point['Time(ms)'],
-                        'end_time': swipe_row['Time(ms)'],
-                        'start_index': start_point.name,
-                        'end_index': swipe_row.name,
-                        'start_layer': start_point['Layer Name'],
-                        'end_layer': swipe_row['Layer Name']
-                    })
-                    
-                    logger.info(f"플리킹 단위 발견: 시작점 {start_point['Layer Name']} ({start_point['Time(ms)']}ms) -> 종료점 {swipe_row['Layer Name']} ({swipe_row['Time(ms)']}ms)")
-            
-            # 플리킹 단위 정보를 저장 (시작점과 종료점을 매핑)
-            self.flick_units = {
-                'start_points': flick_start_points,
-                'end_points': flick_end_points,
-                'total_flicks': len(flick_start_points),
-                'units_info': flick_units_info
-            }
-            
-            logger.info(f"총 {len(flick_start_points)}개의 플리킹 단위 계산 완료")
-            return flick_start_points
-            
-        except Exception as e:
-            logger.error(f"플리킹 시작점 찾기 실패: {str(e)}")
-            return set()
+    def _get_time_index(self, combined_data) -> SessionTimeIndex:
+        """결합 데이터의 세션별 시간 색인 (선택마다 한 번 생성, 선택 지문으로 캐시)"""
+        if not self.selection_key:
+            return SessionTimeIndex(combined_data)
+        return self.memoize_derived(f"time_index:{self.selection_key}",
+                                    lambda: SessionTimeIndex(combined_data))
     
-    def _get_filtered_touch_data(self, filtered_data, original_data=None):
-        """플리킹 시작점과 SWIPE 이벤트를 제외한 터치 데이터 반환 - 플리킹 단위로 처리"""
-        try:
-            # 원본 데이터에서 플리킹 단위를 먼저 계산
-            if original_data is not None:
-                self._get_flick_start_points(filtered_data, original_data)
-            
-            # 플리킹 시작점들 찾기
-            flick_start_points = self._get_flick_start_points(filtered_data, original_data)
-            
-            # 일반 터치 데이터 (HWK, SWIPE 제외)
-            touch_data = filtered_data[
-                ~(filtered_data['Layer Name'].str.contains('HWK', case=False, na=False) |
-                  filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False))
-            ]
-            
-            # 플리킹 시작점들을 제외 (원본 데이터 기준으로 계산된 시작점들)
-            if flick_start_points:
-                touch_data = touch_data[~touch_data.index.isin(flick_start_points)]
-            
-            return touch_data
-            
-        except Exception as e:
-            logger.error(f"터치 데이터 필터링 실패: {str(e)}")
-            # 오류 발생 시 기존 방식으로 반환
-            return filtered_data[
-                ~(filtered_data['Layer Name'].str.contains('HWK', case=False, na=False) |
-                  filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False))
+    def _exclude_keywords(self) -> Tuple[str, ...]:
+        """제외 필터 키워드의 캐시 키용 정규형 (공백 제거, 중복 제거 후 정렬, 대소문자 유지)"""
+        layer_filter = self.layer_filter.get() if hasattr(self, 'layer_filter') else ""
+        return tuple(sorted({keyword.strip() for keyword in layer_filter.split(',')
+                             if keyword.strip()}))
+    
+    def _derived_key(self, kind: str, filtered_data, original_data) -> Optional[str]:
+        """
+        현재 필터 결과에서 파생된 값의 캐시 키 (현재 상태와 무관한 입력이면 None)
+        
+        Args:
+            kind: 파생 값 종류
+            filtered_data: 필터된 데이터 (self.filtered_data여야 캐시 사용)
+            original_data: 플리킹 단위 계산 기준 데이터
+            
+        Returns:
+            Optional[str]: 캐시 키
+        """
+        if not self.selection_key or not self._filter_key or filtered_data is not self.filtered_data:
+            return None
+        if original_data is None:
+            source = "none"
+        elif original_data is self._combined_data:
+            source = "all"
+        elif original_data is filtered_data:
+            source = "self"
+        else:
+            return None
+        return f"{kind}:{self._filter_key}:{source}"
+    
+    def _get_event_counts(self, filtered_data, combined_data) -> Dict[str, int]:
+        """
+        필터된 데이터의 이벤트 타입별 개수 (HWK, 플리킹 단위, 플리킹 시작점을 뺀 터치)
+        
+        Args:
+            filtered_data: 필터된 데이터
+            combined_data: 플리킹 단위 계산 기준인 결합 데이터
+            
+        Returns:
+            Dict[str, int]: 'hwk', 'flick', 'touch' 개수
+        """
+        def _count():
+            hwk_data = filtered_data[
+                hwk_mask(filtered_data)
             ]
+            touch_data = self._get_filtered_touch_data_without_flick_starts(filtered_data)
+            return {
+                'hwk': len(hwk_data),
+                'flick': self._count_flick_events(filtered_data),
+                'touch': len(touch_data)
+            }
+        
+        key = self._derived_key("counts", filtered_data, combined_data)
+        return self.memoize_derived(key, _count) if key else _count()
+    
+    def _get_flick_index(self) -> FlickIndex:
+        """
+        현재 선택의 플리킹 색인 (선택마다 한 번 계산, 선택 지문으로 캐시)
+        
+        모든 탭과 통계는 이 색인에서 필터된 데이터에 남아 있는 플리킹 단위를 읽습니다.
+        
+        Returns:
+            FlickIndex: 결합 데이터 기준 플리킹 색인 (결합 데이터가 없으면 필터된 데이터 기준)
+        """
+        combined_data = self._combined_data
+        if combined_data is None:
+            logger.info(f"필터된 데이터에서 플리킹 단위 계산: {len(self.filtered_data)} 행")
+            return FlickIndex.build(self.filtered_data)
+        
+        def _build():
+            flick_index = FlickIndex.build(combined_data)
+            logger.info(f"결합 데이터에서 플리킹 단위 계산: {len(combined_data)} 행, "
+                        f"{len(flick_index)}개 단위")
+            return flick_index
+        
+        if not self.selection_key:
+            return _build()
+        return self.memoize_derived(f"flick_index:{self.selection_key}", _build)
     
-    def _count_flick_events(self, filtered_data, original_data=None):
-        """플리킹 이벤트를 1개 단위로 카운트 - 원본 데이터 기준"""
+    def _count_flick_events(self, filtered_data):
+        """플리킹 이벤트를 1개 단위로 카운트 - 결합 데이터 기준 단위 중 SWIPE가 필터된 데이터에 남은 것"""
         try:
-            # 원본 데이터에서 플리킹 단위를 먼저 계산
-            if original_data is not None:
-                self._get_flick_start_points(filtered_data, original_data)
-            
-            if not hasattr(self, 'flick_units'):
-                self._get_flick_start_points(filtered_data, original_data)
-            
-            # 현재 필터링된 데이터에서 실제로 존재하는 SWIPE 이벤트 확인
-            current_swipe_events = filtered_data[
-                filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
-            ]
-            current_swipe_times = set(current_swipe_events['Time(ms)'].tolist())
-            
-            # 원본의 플리킹 단위 중에서 현재 필터링된 데이터에 SWIPE 이벤트가 존재하는 것만 유효한 플리킹으로 간주
-            valid_flick_count = 0
-            if 'units_info' in self.flick_units:
-                for flick_unit in self.flick_units['units_info']:
-                    if flick_unit['end_time'] in current_swipe_times:
-                        valid_flick_count += 1
-            
-            logger.info(f"유효한 플리킹 이벤트 수: {valid_flick_count}개 (전체: {self.flick_units.get('total_flicks', 0)}개)")
-            
-            # 유효한 플리킹 단위 수 반환
+            flick_index = self._get_flick_index()
+            valid_flick_count = flick_index.count(filtered_data)
+            logger.info(f"유효한 플리킹 이벤트 수: {valid_flick_count}개 (전체: {len(flick_index)}개)")
             return valid_flick_count
             
         except Exception as e:
             logger.error(f"플리킹 이벤트 카운팅 실패: {str(e)}")
             # 기존 방식으로 SWIPE 이벤트 수 반환
             swipe_data = filtered_data[
-                filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
+                swipe_mask(filtered_data)
             ]
             return len(swipe_data)
     
-    def _get_filtered_touch_data_without_flick_starts(self, filtered_data, original_data=None):
-        """플리킹 시작점을 제외한 터치 데이터만 반환 - 모든 카운트에서 사용"""
+    def _get_filtered_touch_data_without_flick_starts(self, filtered_data):
+        """플리킹 시작점을 제외한 터치 데이터만 반환 - 모든 카운트에서 사용 (결과 캐시 사용)"""
+        key = self._derived_key("touch", filtered_data, self._combined_data)
+        if key is None:
+            return self._compute_touch_data_without_flick_starts(filtered_data)
+        return self.memoize_derived(
+            key, lambda: self._compute_touch_data_without_flick_starts(filtered_data)
+        )
+    
+    def _compute_touch_data_without_flick_starts(self, filtered_data):
+        """플리킹 시작점을 제외한 터치 데이터 계산 (플리킹 색인의 행 ID로 anti-join)"""
         try:
-            # 원본 데이터에서 플리킹 단위를 먼저 계산
-            if original_data is not None:
-                self._get_flick_start_points(filtered_data, original_data)
-            
             # 일반 터치 데이터 (HWK, SWIPE 제외)
-            touch_data = filtered_data[
-                ~(filtered_data['Layer Name'].str.contains('HWK', case=False, na=False) |
-                  filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False))
-            ]
+            keep = touch_mask(filtered_data).to_numpy()
+            logger.info(f"필터링 전 터치 데이터: {int(keep.sum())}개")
             
-            logger.info(f"필터링 전 터치 데이터: {len(touch_data)}개")
+            flick_index = self._get_flick_index()
+            if len(flick_index) == 0:
+                logger.info("플리킹 단위가 없어 시작점 제외를 건너뜀")
+                return filtered_data[keep]
             
-            # 플리킹 시작점들을 제외 (원본 데이터 기준으로 계산된 시작점들)
-            if hasattr(self, 'flick_units') and 'units_info' in self.flick_units and self.flick_units['units_info']:
-                # 현재 필터링된 데이터에서 실제로 존재하는 SWIPE 이벤트 확인
-                current_swipe_events = filtered_data[
-                    filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
-                ]
-                current_swipe_times = set(current_swipe_events['Time(ms)'].tolist())
-                
-                logger.info(f"현재 필터링된 데이터의 SWIPE 이벤트: {len(current_swipe_events)}개")
-                
-                # 모든 플리킹 시작점을 제외 (SWIPE가 존재하든 안하든 상관없이)
-                # 이유: 플리킹 시작점은 항상 플리킹 단위의 일부이므로 터치 이벤트로 카운트하면 안됨
-                # SWIPE를 필터링하면 모든 플리킹 관련 이벤트가 제외되어야 함
-                flick_start_identifiers = set()
-                
-                for flick_unit in self.flick_units['units_info']:
-                    # 시간을 10ms 단위로 반올림하여 정확한 매칭
-                    time_key = round(flick_unit['start_time'] / 10) * 10
-                    layer_key = str(flick_unit['start_layer']).strip()
-                    identifier = f"{time_key}_{layer_key}"
-                    flick_start_identifiers.add(identifier)
-                    
-                    # SWIPE가 존재하는지 여부에 따라 로그 메시지 구분
-                    if flick_unit['end_time'] in current_swipe_times:
-                        logger.info(f"유효한 플리킹 시작점 제외: {identifier} (시간: {flick_unit['start_time']}ms, 레이어: {flick_unit['start_layer']}) - SWIPE 이벤트 존재하지만 터치로 카운트하지 않음")
-                    else:
-                        logger.info(f"필터링된 플리킹 단위 시작점 제외: {identifier} (시간: {flick_unit['start_time']}ms, 레이어: {flick_unit['start_layer']}) - SWIPE 이벤트 없음")
-                
-                logger.info(f"총 {len(flick_start_identifiers)}개의 플리킹 시작점 제외 (모든 플리킹 시작점은 터치로 카운트하지 않음)")
-                
-                # 필터링된 터치 데이터에서 모든 플리킹 시작점 제외
-                filtered_touch_without_flick_starts = []
-                excluded_count = 0
-                
-                for _, row in touch_data.iterrows():
-                    # 현재 행의 식별자 생성
-                    current_time_key = round(row['Time(ms)'] / 10) * 10
-                    current_layer_key = str(row['Layer Name']).strip()
-                    current_identifier = f"{current_time_key}_{current_layer_key}"
-                    
-                    # 플리킹 시작점이 아니면 포함
-                    if current_identifier not in flick_start_identifiers:
-                        filtered_touch_without_flick_starts.append(row)
-                    else:
-                        excluded_count += 1
-                        # SWIPE가 존재하는지 여부에 따라 로그 메시지 구분
-                        if any(flick_unit['end_time'] in current_swipe_times for flick_unit in self.flick_units['units_info'] 
-                               if round(flick_unit['start_time'] / 10) * 10 == current_time_key and str(flick_unit['start_layer']).strip() == current_layer_key):
-                            logger.info(f"유효한 플리킹 시작점 제외: {current_identifier} (시간: {row['Time(ms)']}ms, 레이어: {row['Layer Name']})")
-                        else:
-                            logger.info(f"필터링된 플리킹 시작점 제외: {current_identifier} (시간: {row['Time(ms)']}ms, 레이어: {row['Layer Name']})")
-                
-                logger.info(f"플리킹 시작점 제외 완료: {excluded_count}개 제외, {len(filtered_touch_without_flick_starts)}개 남음")
-                
-                # DataFrame으로 변환하여 touch_data 업데이트
-                if filtered_touch_without_flick_starts:
-                    touch_data = pd.DataFrame(filtered_touch_without_flick_starts)
-                    logger.info(f"최종 터치 데이터: {len(touch_data)}개 (플리킹 시작점 제외 후)")
-                else:
-                    touch_data = pd.DataFrame(columns=touch_data.columns)
-                    logger.info(f"최종 터치 데이터: 0개 (모든 터치가 플리킹 시작점이므로)")
-            else:
-                # 플리킹 단위 정보가 없으면 원본 데이터에서 계산
-                if original_data is not None:
-                    logger.info("플리킹 단위 정보가 없어 원본 데이터에서 계산")
-                    self._get_flick_start_points(filtered_data, original_data)
-                    
-                    # 다시 플리킹 단위 정보 확인
-                    if hasattr(self, 'flick_units') and 'units_info' in self.flick_units and self.flick_units['units_info']:
-                        # 현재 필터링된 데이터에서 실제로 존재하는 SWIPE 이벤트 확인
-                        current_swipe_events = filtered_data[
-                            filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
-                        ]
-                        current_swipe_times = set(current_swipe_events['Time(ms)'].tolist())
-                        
-                        logger.info(f"재계산 후 현재 필터링된 데이터의 SWIPE 이벤트: {len(current_swipe_events)}개")
-                        
-                        # 모든 플리킹 시작점을 제외
-                        flick_start_identifiers = set()
-                        
-                        for flick_unit in self.flick_units['units_info']:
-                            time_key = round(flick_unit['start_time'] / 10) * 10
-                            layer_key = str(flick_unit['start_layer']).strip()
-                            identifier = f"{time_key}_{layer_key}"
-                            flick_start_identifiers.add(identifier)
-                            
-                            if flick_unit['end_time'] in current_swipe_times:
-                                logger.info(f"재계산 후 유효한 플리킹 시작점 제외: {identifier} (시간: {flick_unit['start_time']}ms, 레이어: {flick_unit['start_layer']})")
-                            else:
-                                logger.info(f"재계산 후 필터링된 플리킹 단위 시작점 제외: {identifier} (시간: {flick_unit['start_time']}ms, 레이어: {flick_unit['start_layer']})")
-                        
-                        logger.info(f"재계산 후 총 {len(flick_start_identifiers)}개의 플리킹 시작점 제외")
-                        
-                        # 필터링된 터치 데이터에서 모든 플리킹 시작점 제외
-                        filtered_touch_without_flick_starts = []
-                        excluded_count = 0
-                        
-                        for _, row in touch_data.iterrows():
-                            current_time_key = round(row['Time(ms)'] / 10) * 10
-                            current_layer_key = str(row['Layer Name']).strip()
-                            current_identifier = f"{current_time_key}_{current_layer_key}"
-                            
-                            if current_identifier not in flick_start_identifiers:
-                                filtered_touch_without_flick_starts.append(row)
-                            else:
-                                excluded_count += 1
-                        
-                        logger.info(f"재계산 후 플리킹 시작점 제외 완료: {excluded_count}개 제외, {len(filtered_touch_without_flick_starts)}개 남음")
-                        
-                        # DataFrame으로 변환하여 touch_data 업데이트
-                        if filtered_touch_without_flick_starts:
-                            touch_data = pd.DataFrame(filtered_touch_without_flick_starts)
-                            logger.info(f"재계산 후 최종 터치 데이터: {len(touch_data)}개 (플리킹 시작점 제외 후)")
-                        else:
-                            touch_data = pd.DataFrame(columns=touch_data.columns)
-                            logger.info(f"재계산 후 최종 터치 데이터: 0개 (모든 터치가 플리킹 시작점이므로)")
-                    else:
-                        logger.info("재계산 후에도 플리킹 단위 정보를 찾을 수 없음")
-                        # 플리킹 단위 정보가 없어도 원본 데이터에서 플리킹 시작점을 찾아서 제외
-                        if original_data is not None:
-                            logger.info("원본 데이터에서 직접 플리킹 시작점 찾기")
-                            # 원본 데이터에서 SWIPE 이벤트 찾기
-                            original_swipe_events = original_data[
-                                original_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
-                            ]
-                            
-                            if len(original_swipe_events) > 0:
-                                # 원본 데이터에서 플리킹 시작점 찾기
-                                flick_start_identifiers = set()
-                                
-                                for _, swipe_row in original_swipe_events.iterrows():
-                                    swipe_time = swipe_row['Time(ms)']
-                                    # SWIPE 이벤트 직전의 터치 이벤트 찾기 (10ms 이내)
-                                    for _, touch_row in touch_data.iterrows():
-                                        touch_time = touch_row['Time(ms)']
-                                        if 0 < (swipe_time - touch_time) <= 10:  # 10ms 이내의 직전 터치
-                                            time_key = round(touch_time / 10) * 10
-                                            layer_key = str(touch_row['Layer Name']).strip()
-                                            identifier = f"{time_key}_{layer_key}"
-                                            flick_start_identifiers.add(identifier)
-                                            logger.info(f"직접 찾은 플리킹 시작점 제외: {identifier} (시간: {touch_time}ms, 레이어: {touch_row['Layer Name']})")
-                                
-                                # 찾은 플리킹 시작점 제외
-                                if flick_start_identifiers:
-                                    filtered_touch_without_flick_starts = []
-                                    excluded_count = 0
-                                    
-                                    for _, row in touch_data.iterrows():
-                                        current_time_key = round(row['Time(ms)'] / 10) * 10
-                                        current_layer_key = str(row['Layer Name']).strip()
-                                        current_identifier = f"{current_time_key}_{current_layer_key}"
-                                        
-                                        if current_identifier not in flick_start_identifiers:
-                                            filtered_touch_without_flick_starts.append(row)
-                                        else:
-                                            excluded_count += 1
-                                    
-                                    logger.info(f"직접 찾은 플리킹 시작점 제외 완료: {excluded_count}개 제외, {len(filtered_touch_without_flick_starts)}개 남음")
-                                    
-                                    if filtered_touch_without_flick_starts:
-                                        touch_data = pd.DataFrame(filtered_touch_without_flick_starts)
-                                        logger.info(f"직접 찾은 플리킹 시작점 제외 후 최종 터치 데이터: {len(touch_data)}개")
-                                    else:
-                                        touch_data = pd.DataFrame(columns=touch_data.columns)
-                                        logger.info(f"직접 찾은 플리킹 시작점 제외 후 최종 터치 데이터: 0개")
-                                else:
-                                    logger.info("직접 찾은 플리킹 시작점이 없음")
-                            else:
-                                logger.info("원본 데이터에 SWIPE 이벤트가 없음")
-                else:
-                    logger.info("원본 데이터가 없어 시작점 제외를 건너뜀")
+            # 모든 플리킹 시작점을 제외 (SWIPE가 존재하든 안하든 상관없이)
+            # 이유: 플리킹 시작점은 항상 플리킹 단위의 일부이므로 터치 이벤트로 카운트하면 안됨
+            # 시작점은 결합 데이터의 행 인덱스이므로 필터된 데이터의 인덱스와 직접 비교
+            is_start = flick_index.start_mask(filtered_data)
+            excluded_count = int((keep & is_start).sum())
+            keep = keep & ~is_start
             
-            return touch_data
+            logger.info(f"플리킹 시작점 제외 완료: 단위 {len(flick_index)}개 중 {excluded_count}개 제외, "
+                        f"{int(keep.sum())}개 남음")
+            return filtered_data[keep]
             
         except Exception as e:
             logger.error(f"터치 데이터 필터링 실패: {str(e)}")
             # 오류 발생 시 기존 방식으로 반환
             return filtered_data[
-                ~(filtered_data['Layer Name'].str.contains('HWK', case=False, na=False) |
-                  filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False))
+                touch_mask(filtered_data)
             ]
     
     def _extract_and_set_hwk_events(self, combined_data):
-        """HWK 이벤트와 SWIPE 이벤트를 추출하고 슬라이더에 설정"""
+        """HWK 이벤트와 SWIPE 이벤트를 추출하고 슬라이더에 설정 (선택별 결과 캐시 사용)"""
+        if self.selection_key and combined_data is self._combined_data:
+            hwk_events = self.memoize_derived(
+                f"hwk_events:{self.selection_key}",
+                lambda: self._collect_hwk_events(combined_data)
+            )
+        else:
+            hwk_events = self._collect_hwk_events(combined_data)
+        
+        if hwk_events is not None and hasattr(self, 'time_range_slider'):
+            self.time_range_slider.set_hwk_events(hwk_events)
+    
+    def _collect_hwk_events(self, combined_data):
+        """HWK 이벤트와 SWIPE 이벤트를 슬라이더 표시용 목록으로 추출 (실패 시 None)"""
         try:
-            hwk_data = combined_data[
-                combined_data['Layer Name'].str.contains('HWK', case=False, na=False)
-            ]
-            swipe_data = combined_data[
-                combined_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
-            ]
+            classifier = self.data_manager.event_classifier
+            if 'hwk_subtype' not in combined_data.columns:
+                combined_data = classifier.add_columns(combined_data[['Time(ms)', 'Layer Name']].copy())
             
+            # 로드 시 분류된 코드로 이벤트 종류를 한 번에 매핑 (HWK 다음 SWIPE 순서 유지)
             hwk_events = []
-            for _, row in hwk_data.iterrows():
-                try:
-                    event_time = row['Time(ms)'] / 1000
-                    layer_name = str(row['Layer Name'])
-                
-                    if 'boost' in layer_name.lower():
-                        event_type = 'HWK_boost'
-                    elif 'magma' in layer_name.lower():
-                        event_type = 'HWK_magma'
-                    elif 'drive' in layer_name.lower():
-                        event_type = 'HWK_drive'
-                    else:
-                        event_type = 'HWK_unknown'
-                
-                    hwk_events.append({
-                        'time': event_time,
-                        'type': event_type
-                    })
-                except Exception as e:
-                    logger.warning(f"HWK 이벤트 처리 중 오류: {str(e)}")
-                    continue
+            for column in ('hwk_subtype', 'swipe_direction'):
+                codes = combined_data[column].to_numpy()
+                selected = codes != NOT_APPLICABLE
+                times = (combined_data['Time(ms)'].to_numpy()[selected] / 1000).tolist()
+                types = np.asarray(classifier.labels[column]).take(codes[selected]).tolist()
+                hwk_events.extend({'time': event_time, 'type': event_type}
+                                  for event_time, event_type in zip(times, types))
             
-            # SWIPE 이벤트도 HWK 이벤트와 함께 처리
-            for _, row in swipe_data.iterrows():
-                try:
-                    event_time = row['Time(ms)'] / 1000
-                    layer_name = str(row['Layer Name'])
-                
-                    if 'swipe_up' in layer_name.lower():
-                        event_type = 'SWIPE_UP'
-                    elif 'swipe_down' in layer_name.lower():
-                        event_type = 'SWIPE_DOWN'
-                    elif 'swipe_left' in layer_name.lower():
-                        event_type = 'SWIPE_LEFT'
-                    elif 'swipe_right' in layer_name.lower():
-                        event_type = 'SWIPE_RIGHT'
-                    else:
-                        event_type = 'SWIPE_UNKNOWN'
-                
-                    hwk_events.append({
-                        'time': event_time,
-                        'type': event_type
-                    })
-                except Exception as e:
-                    logger.warning(f"SWIPE 이벤트 처리 중 오류: {str(e)}")
-                    continue
-            
-            if hasattr(self, 'time_range_slider'):
-                self.time_range_slider.set_hwk_events(hwk_events)
+            return hwk_events
                 
         except Exception as e:
             logger.error(f"이벤트 추출 중 오류: {str(e)}")
+            return None
     
     def show_all_data(self):
         """필터링 리셋 - 모든 필터를 초기화하고 전체 데이터 표시"""
@@ -1368,6 +1176,7 @@ class InteractiveVisualizer(BaseVisualizer):
                 if hasattr(self, 'info_label'):
                     self.info_label.config(text="데이터 로드 실패. 파일을 확인해주세요.")
                 return
+            self._combined_data = combined_data
             
             # 시간 범위 계산 및 슬라이더 업데이트
             if len(combined_data) > 0:
@@ -1400,18 +1209,16 @@ class InteractiveVisualizer(BaseVisualizer):
                 self.time_range_slider.draw_slider()
                 
                 # 이벤트 타입별 개수 계산 - 플리킹 이벤트를 1개 단위로 처리
-                hwk_data = combined_data[
-                    combined_data['Layer Name'].str.contains('HWK', case=False, na=False)
-                ]
-                touch_data = self._get_filtered_touch_data_without_flick_starts(combined_data, combined_data)
+                # (필터 없는 상태의 결과는 선택 지문 기준으로 캐시)
+                self._filter_key = f"{self.selection_key}:all:"
+                self.filtered_data = combined_data
+                counts = self._get_event_counts(combined_data, combined_data)
                 
-                hwk_count = len(hwk_data)
-                flick_count = self._count_flick_events(combined_data, combined_data)  # 원본 데이터 기준으로 플리킹 단위 카운트
-                touch_count = len(touch_data)
+                hwk_count = counts['hwk']
+                flick_count = counts['flick']  # 원본 데이터 기준으로 플리킹 단위 카운트
+                touch_count = counts['touch']
                 total_points = len(combined_data)
                 
-                self.filtered_data = combined_data
-                
                 # HWK 이벤트 슬라이더 표시 개수 확인
                 hwk_events_count = len(self.time_range_slider.hwk_events) if hasattr(self.time_range_slider, 'hwk_events') else 0
                 
@@ -1609,6 +1416,37 @@ class InteractiveVisualizer(BaseVisualizer):
         except Exception as e:
             logger.error(f"시각화 초기화 중 오류: {str(e)}")
     
+    def _release_hidden_figures(self, target_bytes: int) -> int:
+        """
+        메모리 압박 시 현재 탭이 아닌 그림 해제 (탭 전환 시 다시 그려짐)
+        
+        Args:
+            target_bytes: 비울 목표 바이트 수
+            
+        Returns:
+            int: 해제한 이미지 배열 크기 추정치 (바이트)
+        """
+        figures = {
+            "히트맵": 'heatmap_fig',
+            "플로우": 'flow_fig',
+            "이벤트 빈도": 'layer_freq_fig',
+            "이벤트 시간분포": 'layer_time_fig',
+        }
+        freed = 0
+        for tab_name, fig_attr in figures.items():
+            fig = getattr(self, fig_attr, None)
+            if fig is None or tab_name == self.current_tab or not fig.axes:
+                continue
+            for ax in fig.axes:
+                for image in ax.get_images():
+                    array = image.get_array()
+                    if array is not None:
+                        freed += array.nbytes
+            fig.clear()
+            if freed >= target_bytes:
+                break
+        return freed
+    
     # 히트맵 생성 메서드들 (기존 로직을 그대로 유지하되 최적화)
     def create_heatmap(self):
         """히트맵 생성"""
@@ -1625,19 +1463,10 @@ class InteractiveVisualizer(BaseVisualizer):
         
         # 이벤트 타입별 데이터 추출
         try:
-            # 원본 데이터에서 플리킹 단위를 계산하여 정확한 터치 데이터 추출
-            original_data = None
-            for user_data in self.data.values():
-                for task_data in user_data.values():
-                    if len(task_data) > 0:
-                        original_data = task_data
-                        break
-                if original_data is not None:
-                    break
-            
-            touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data, original_data)
+            # 선택의 플리킹 색인으로 플리킹 시작점을 제외한 터치 데이터 추출
+            touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data)
             swipe_data = self.filtered_data[
-                self.filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
+                swipe_mask(self.filtered_data)
             ]
         except Exception as e:
             logger.error(f"이벤트 필터링 실패: {str(e)}")
@@ -1745,35 +1574,18 @@ class InteractiveVisualizer(BaseVisualizer):
             # 플리킹 화살표 추가
             if len(swipe_data) > 0:
                 try:
-                    # 플리킹 이벤트를 시간순으로 정렬
-                    swipe_data_sorted = swipe_data.sort_values('Time(ms)')
-                    
-                    for idx, row in swipe_data_sorted.iterrows():
-                        # 플리킹 종료점 (SWIPE 이벤트 좌표)
-                        end_x = row['TouchX']
-                        end_y = row['TouchY']
-                        layer_name = str(row['Layer Name']).lower()
+                    # 필터 후 남은 SWIPE마다 같은 세션의 직전 비-SWIPE 이벤트 좌표에서 화살표 시작
+                    units = self._get_flick_index().select(self.filtered_data)
+                    for start_x, start_y, end_x, end_y in zip(units.start_x, units.start_y,
+                                                              units.end_x, units.end_y):
+                        # 화살표 색상 결정 (방향에 관계없이 통일)
+                        arrow_color = '#06b6d4'  # 시안블루로 플리킹 이벤트 통일
                         
-                        # 플리킹 시작점 찾기 (SWIPE 직전 좌표)
-                        current_time = row['Time(ms)']
-                        # 현재 SWIPE 이벤트보다 이전의 가장 가까운 터치 이벤트 찾기
-                        prev_touch = self.filtered_data[
-                            (self.filtered_data['Time(ms)'] < current_time) & 
-                            (~self.filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False))
-                        ].sort_values('Time(ms)', ascending=False)
+                        # 두께감 있는 화살표 그리기
+                        ax.annotate('', xy=(end_x, end_y), xytext=(start_x, start_y),
+                                   arrowprops=dict(arrowstyle='->', color=arrow_color, 
+                                                 lw=4, alpha=0.8, shrinkA=0, shrinkB=0))
                         
-                        if len(prev_touch) > 0:
-                            start_x = prev_touch.iloc[0]['TouchX']
-                            start_y = prev_touch.iloc[0]['TouchY']
-                            
-                            # 화살표 색상 결정 (방향에 관계없이 통일)
-                            arrow_color = '#06b6d4'  # 시안블루로 플리킹 이벤트 통일
-                            
-                            # 두께감 있는 화살표 그리기
-                            ax.annotate('', xy=(end_x, end_y), xytext=(start_x, start_y),
-                                       arrowprops=dict(arrowstyle='->', color=arrow_color, 
-                                                     lw=4, alpha=0.8, shrinkA=0, shrinkB=0))
-                            
                 except Exception as e:
                     logger.error(f"플리킹 화살표 그리기 실패: {str(e)}")
             
@@ -1810,19 +1622,10 @@ class InteractiveVisualizer(BaseVisualizer):
         
         # 이벤트 타입별 데이터 추출
         try:
-            # 원본 데이터에서 플리킹 단위를 계산하여 정확한 터치 데이터 추출
-            original_data = None
-            for user_data in self.data.values():
-                for task_data in user_data.values():
-                    if len(task_data) > 0:
-                        original_data = task_data
-                        break
-                if original_data is not None:
-                    break
-            
-            touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data, original_data)
+            # 선택의 플리킹 색인으로 플리킹 시작점을 제외한 터치 데이터 추출
+            touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data)
             swipe_data = self.filtered_data[
-                self.filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
+                swipe_mask(self.filtered_data)
             ]
         except Exception as e:
             logger.error(f"이벤트 필터링 실패: {str(e)}")
@@ -1840,9 +1643,13 @@ class InteractiveVisualizer(BaseVisualizer):
             
             ax = self.flow_fig.add_subplot(111)
             
-            # 터치 좌표 추출
-            x_coords = touch_data['TouchX'].values
-            y_coords = touch_data['TouchY'].values
+            # 터치 좌표 추출 (세션별 시각 순)
+            order = session_time_order(touch_data)
+            x_coords = touch_data['TouchX'].to_numpy()[order]
+            y_coords = touch_data['TouchY'].to_numpy()[order]
+            # 세션(파일) 경계를 넘는 연결선과 화살표는 그리지 않음
+            sessions = session_codes(touch_data)[order]
+            same_session = sessions[1:] == sessions[:-1]
             
             # 배경 이미지 추가 (투명도 감소로 가시성 향상)
             if self.background_image_path and os.path.exists(self.background_image_path):
@@ -1867,6 +1674,8 @@ class InteractiveVisualizer(BaseVisualizer):
                 try:
                     # 각 선분을 개별적으로 그려서 색상 변화 적용 (선 굵기 축소)
                     for i in range(len(x_coords) - 1):
+                        if not same_session[i]:
+                            continue
                         # 선분의 시작점 색상 사용
                         segment_color = colors[i]
                         ax.plot([x_coords[i], x_coords[i+1]], [y_coords[i], y_coords[i+1]], 
@@ -1892,6 +1701,8 @@ class InteractiveVisualizer(BaseVisualizer):
                     
                     # 화살표 추가 개선 (처음 10개만으로 제한)
                     for i in range(min(10, len(x_coords) - 1)):
+                        if not same_session[i]:
+                            continue
                         try:
                             dx = x_coords[i+1] - x_coords[i]
                             dy = y_coords[i+1] - y_coords[i]
@@ -1913,35 +1724,18 @@ class InteractiveVisualizer(BaseVisualizer):
             # 플리킹 화살표 추가
             if len(swipe_data) > 0:
                 try:
-                    # 플리킹 이벤트를 시간순으로 정렬
-                    swipe_data_sorted = swipe_data.sort_values('Time(ms)')
-                    
-                    for idx, row in swipe_data_sorted.iterrows():
-                        # 플리킹 종료점 (SWIPE 이벤트 좌표)
-                        end_x = row['TouchX']
-                        end_y = row['TouchY']
-                        layer_name = str(row['Layer Name']).lower()
+                    # 필터 후 남은 SWIPE마다 같은 세션의 직전 비-SWIPE 이벤트 좌표에서 화살표 시작
+                    units = self._get_flick_index().select(self.filtered_data)
+                    for start_x, start_y, end_x, end_y in zip(units.start_x, units.start_y,
+                                                              units.end_x, units.end_y):
+                        # 화살표 색상 결정 (방향에 관계없이 통일)
+                        arrow_color = '#06b6d4'  # 시안블루로 플리킹 이벤트 통일
                         
-                        # 플리킹 시작점 찾기 (SWIPE 직전 좌표)
-                        current_time = row['Time(ms)']
-                        # 현재 SWIPE 이벤트보다 이전의 가장 가까운 터치 이벤트 찾기
-                        prev_touch = self.filtered_data[
-                            (self.filtered_data['Time(ms)'] < current_time) & 
-                            (~self.filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False))
-                        ].sort_values('Time(ms)', ascending=False)
+                        # 두께감 있는 화살표 그리기 (히트맵과 동일한 두께)
+                        ax.annotate('', xy=(end_x, end_y), xytext=(start_x, start_y),
+                                   arrowprops=dict(arrowstyle='->', color=arrow_color, 
+                                                 lw=4, alpha=0.8, shrinkA=0, shrinkB=0))
                         
-                        if len(prev_touch) > 0:
-                            start_x = prev_touch.iloc[0]['TouchX']
-                            start_y = prev_touch.iloc[0]['TouchY']
-                            
-                            # 화살표 색상 결정 (방향에 관계없이 통일)
-                            arrow_color = '#06b6d4'  # 시안블루로 플리킹 이벤트 통일
-                            
-                            # 두께감 있는 화살표 그리기 (히트맵과 동일한 두께)
-                            ax.annotate('', xy=(end_x, end_y), xytext=(start_x, start_y),
-                                       arrowprops=dict(arrowstyle='->', color=arrow_color, 
-                                                     lw=4, alpha=0.8, shrinkA=0, shrinkB=0))
-                            
                 except Exception as e:
                     logger.error(f"플리킹 화살표 그리기 실패: {str(e)}")
             
@@ -2024,23 +1818,13 @@ class InteractiveVisualizer(BaseVisualizer):
             ax.set_facecolor('none')
             
             if len(self.filtered_data) > 0:
-                # 플리킹 시작점을 제외한 데이터 준비
-                # 원본 데이터에서 플리킹 단위를 계산하여 정확한 터치 데이터 추출
-                original_data = None
-                for user_data in self.data.values():
-                    for task_data in user_data.values():
-                        if len(task_data) > 0:
-                            original_data = task_data
-                            break
-                    if original_data is not None:
-                        break
-                
-                filtered_touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data, original_data)
+                # 플리킹 시작점을 제외한 데이터 준비 (선택의 플리킹 색인 기준)
+                filtered_touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data)
                 hwk_data = self.filtered_data[
-                    self.filtered_data['Layer Name'].str.contains('HWK', case=False, na=False)
+                    hwk_mask(self.filtered_data)
                 ]
                 swipe_data = self.filtered_data[
-                    self.filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
+                    swipe_mask(self.filtered_data)
                 ]
                 
                 # 모든 데이터를 하나로 합치기 (플리킹 시작점 제외된 터치 + HWK + SWIPE)
@@ -2124,23 +1908,13 @@ class InteractiveVisualizer(BaseVisualizer):
             ax.set_facecolor('none')
             
             if len(self.filtered_data) > 0:
-                # 플리킹 시작점을 제외한 데이터 준비
-                # 원본 데이터에서 플리킹 단위를 계산하여 정확한 터치 데이터 추출
-                original_data = None
-                for user_data in self.data.values():
-                    for task_data in user_data.values():
-                        if len(task_data) > 0:
-                            original_data = task_data
-                            break
-                    if original_data is not None:
-                        break
-                
-                filtered_touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data, original_data)
+                # 플리킹 시작점을 제외한 데이터 준비 (선택의 플리킹 색인 기준)
+                filtered_touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data)
                 hwk_data = self.filtered_data[
-                    self.filtered_data['Layer Name'].str.contains('HWK', case=False, na=False)
+                    hwk_mask(self.filtered_data)
                 ]
                 swipe_data = self.filtered_data[
-                    self.filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
+                    swipe_mask(self.filtered_data)
                 ]
                 
                 # 모든 데이터를 하나로 합치기 (플리킹 시작점 제외된 터치 + HWK + SWIPE)
@@ -2256,59 +2030,19 @@ class InteractiveVisualizer(BaseVisualizer):
             
             # 이벤트 타입별 분리
             hwk_data = self.filtered_data[
-                self.filtered_data['Layer Name'].str.contains('HWK', case=False, na=False)
+                hwk_mask(self.filtered_data)
             ]
             
-            # 원본 데이터에서 플리킹 단위를 계산하기 위해 원본 데이터 찾기
-            # 필터링과 동일한 방식으로 combined_data 가져오기
-            original_data = None
-            try:
-                # load_and_combine_data()와 동일한 로직으로 원본 데이터 결합
-                combined_data = self.load_and_combine_data()
-                if combined_data is not None:
-                    original_data = combined_data
-                    logger.info(f"통계 탭: 원본 데이터 결합 완료 - {len(combined_data)} 행")
-                else:
-                    logger.warning("통계 탭: load_and_combine_data()에서 None 반환")
-            except Exception as e:
-                logger.error(f"통계 탭: 원본 데이터 결합 중 오류: {str(e)}")
-            
-            # 원본 데이터가 없으면 fallback으로 기존 방식 사용
-            if original_data is None and hasattr(self, 'data') and self.data:
-                logger.info("통계 탭: fallback으로 기존 방식 사용")
-                for user_data in self.data.values():
-                    if isinstance(user_data, dict):
-                        for task_data in user_data.values():
-                            if isinstance(task_data, pd.DataFrame) and len(task_data) > 0:
-                                original_data = task_data
-                                break
-                        if original_data is not None:
-                            break
-            
-            # 원본 데이터가 없으면 필터된 데이터 사용
-            if original_data is None:
-                original_data = self.filtered_data
-                logger.warning("통계 탭: 원본 데이터를 찾을 수 없어 필터된 데이터 사용")
-            
-            # 통계 탭에서도 다른 시각화와 동일한 로직 사용
-            # 플리킹 단위 정보를 먼저 계산 (원본 데이터 기준)
-            if not hasattr(self, 'flick_units') or not self.flick_units:
-                self._get_flick_start_points(self.filtered_data, original_data)
-            
-            # 플리킹 단위 정보가 제대로 계산되었는지 확인
-            if not hasattr(self, 'flick_units') or not self.flick_units or 'units_info' not in self.flick_units:
-                logger.warning("통계 탭: 플리킹 단위 정보를 찾을 수 없어 다시 계산")
-                self._get_flick_start_points(self.filtered_data, original_data)
-            
+            # 통계 탭에서도 다른 시각화와 동일한 선택의 플리킹 색인 사용
             # 플리킹 시작점이 제외된 터치 데이터 가져오기
-            touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data, original_data)
+            touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data)
             
             # 디버깅: 터치 데이터 상태 확인
-            logger.info(f"통계 탭: 터치 데이터 상태 - 원본: {len(self.filtered_data[~(self.filtered_data['Layer Name'].str.contains('HWK|SWIPE', case=False, na=False))])}개, 플리킹 시작점 제외 후: {len(touch_data)}개")
+            logger.info(f"통계 탭: 터치 데이터 상태 - 원본: {len(self.filtered_data[touch_mask(self.filtered_data)])}개, 플리킹 시작점 제외 후: {len(touch_data)}개")
             
             # SWIPE 데이터 추출 (필터링된 데이터에서)
             swipe_data = self.filtered_data[
-                self.filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
+                swipe_mask(self.filtered_data)
             ]
             
             # 전체 통계 (플리킹 시작점 제외된 실제 이벤트 수)
@@ -2316,7 +2050,7 @@ class InteractiveVisualizer(BaseVisualizer):
             actual_total_events = len(touch_data) + len(hwk_data) + len(swipe_data)
             
             hwk_count = len(hwk_data)
-            flick_count = self._count_flick_events(self.filtered_data, original_data)  # 원본 데이터 기준으로 플리킹 단위 카운트
+            flick_count = self._count_flick_events(self.filtered_data)  # 결합 데이터 기준 플리킹 단위 카운트
             touch_count = len(touch_data)
             swipe_count = len(swipe_data)
             
@@ -2369,21 +2103,7 @@ class InteractiveVisualizer(BaseVisualizer):
             
             # HWK 이벤트 분석
             if len(hwk_data) > 0:
-                hwk_types = {}
-                for _, row in hwk_data.iterrows():
-                    layer_name = str(row['Layer Name']).lower()
-                    if 'boost' in layer_name:
-                        hwk_type = 'HWK_boost'
-                    elif 'magma' in layer_name:
-                        hwk_type = 'HWK_magma'
-                    elif 'drive' in layer_name:
-                        hwk_type = 'HWK_drive'
-                    else:
-                        hwk_type = 'HWK_unknown'
-                    
-                    if hwk_type not in hwk_types:
-                        hwk_types[hwk_type] = 0
-                    hwk_types[hwk_type] += 1
+                hwk_types = self.data_manager.event_classifier.count_labels(hwk_data, 'hwk_subtype')
                 
                 stats_text += f"""
 🎮 HWK 이벤트 분석 (게임 특화):
@@ -2407,26 +2127,10 @@ class InteractiveVisualizer(BaseVisualizer):
             if flick_count > 0:
                 # SWIPE 데이터에서 방향별 분포 계산
                 swipe_data = self.filtered_data[
-                    self.filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
+                    swipe_mask(self.filtered_data)
                 ]
                 
-                swipe_types = {}
-                for _, row in swipe_data.iterrows():
-                    layer_name = str(row['Layer Name']).lower()
-                    if 'swipe_up' in layer_name:
-                        swipe_type = 'SWIPE_UP'
-                    elif 'swipe_down' in layer_name:
-                        swipe_type = 'SWIPE_DOWN'
-                    elif 'swipe_left' in layer_name:
-                        swipe_type = 'SWIPE_LEFT'
-                    elif 'swipe_right' in layer_name:
-                        swipe_type = 'SWIPE_RIGHT'
-                    else:
-                        swipe_type = 'SWIPE_UNKNOWN'
-                    
-                    if swipe_type not in swipe_types:
-                        swipe_types[swipe_type] = 0
-                    swipe_types[swipe_type] += 1
+                swipe_types = self.data_manager.event_classifier.count_labels(swipe_data, 'swipe_direction')
                 
                 stats_text += f"""
 🔄 플리킹 이벤트 분석 (1개 단위):
@@ -2450,6 +2154,7 @@ class InteractiveVisualizer(BaseVisualizer):
             # 레이어별 통계 (터치 이벤트만, 플리킹 시작점 제외)
             if len(touch_data) > 0:
                 touch_layer_stats = touch_data['Layer Name'].value_counts()
+                touch_layer_stats = touch_layer_stats[touch_layer_stats > 0]  # 공유 어휘 중 없는 레이어 제외
                 
                 stats_text += f"""
 🎯 터치 레이어별 분포 (플리킹 시작점 제외):
@@ -2466,9 +2171,10 @@ class InteractiveVisualizer(BaseVisualizer):
             if flick_count > 0:
                 # SWIPE 데이터에서 레이어별 분포 계산
                 swipe_data = self.filtered_data[
-                    self.filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
+                    swipe_mask(self.filtered_data)
                 ]
                 swipe_layer_stats = swipe_data['Layer Name'].value_counts()
+                swipe_layer_stats = swipe_layer_stats[swipe_layer_stats > 0]  # 공유 어휘 중 없는 레이어 제외
                 
                 stats_text += f"""
 🎯 플리킹 레이어별 분포 (1개 단위):
@@ -2488,19 +2194,8 @@ class InteractiveVisualizer(BaseVisualizer):
             self.stats_text.insert(tk.END, f"통계 생성 중 오류가 발생했습니다: {str(e)}")
     
     def get_event_type(self, layer_name):
-        """레이어 이름을 기반으로 이벤트 타입을 분류"""
-        layer_name_lower = layer_name.lower()
-        
-        if 'hwk' in layer_name_lower:
-            return 'HWK'
-        elif 'swipe' in layer_name_lower:
-            return 'SWIPE'
-        elif 'area' in layer_name_lower:
-            return 'AREA'
-        elif 'btn' in layer_name_lower or 'button' in layer_name_lower:
-            return 'BTN'
-        else:
-            return 'OTHER'
+        """레이어 이름을 기반으로 이벤트 타입을 분류 (설정의 분류 규칙 사용)"""
+        return self.data_manager.event_classifier.event_type_of(layer_name)
     
     def get_event_color(self, event_type):
         """이벤트 타입에 따른 색상 반환"""
@@ -2733,32 +2428,16 @@ class InteractiveVisualizer(BaseVisualizer):
         try:
             # 통계 데이터 준비
             hwk_data = self.filtered_data[
-                self.filtered_data['Layer Name'].str.contains('HWK', case=False, na=False)
+                hwk_mask(self.filtered_data)
             ]
             
-            # 원본 데이터에서 플리킹 단위를 계산하기 위해 원본 데이터 찾기
-            original_data = None
-            if hasattr(self, 'data') and self.data:
-                # data는 원본 데이터의 딕셔너리
-                for user_data in self.data.values():
-                    if isinstance(user_data, dict):
-                        for task_data in user_data.values():
-                            if isinstance(task_data, pd.DataFrame) and len(task_data) > 0:
-                                original_data = task_data
-                                break
-                        if original_data is not None:
-                            break
-            
-            # 원본 데이터가 없으면 필터된 데이터 사용
-            if original_data is None:
-                original_data = self.filtered_data
-            
-            touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data, original_data)
+            # 화면과 동일한 선택의 플리킹 색인 사용
+            touch_data = self._get_filtered_touch_data_without_flick_starts(self.filtered_data)
             
             # 기본 통계 계산
             total_events = len(self.filtered_data)
             hwk_count = len(hwk_data)
-            flick_count = self._count_flick_events(self.filtered_data, original_data)  # 원본 데이터 기준으로 플리킹 단위 카운트
+            flick_count = self._count_flick_events(self.filtered_data)  # 결합 데이터 기준 플리킹 단위 카운트
             touch_count = len(touch_data)
             total_time_seconds = (self.filtered_data['Time(ms)'].max() - self.filtered_data['Time(ms)'].min()) / 1000
             
@@ -2803,21 +2482,7 @@ class InteractiveVisualizer(BaseVisualizer):
             
             # HWK 이벤트 상세 분석
             if len(hwk_data) > 0:
-                hwk_types = {}
-                for _, row in hwk_data.iterrows():
-                    layer_name = str(row['Layer Name']).lower()
-                    if 'boost' in layer_name:
-                        hwk_type = 'HWK_boost'
-                    elif 'magma' in layer_name:
-                        hwk_type = 'HWK_magma'
-                    elif 'drive' in layer_name:
-                        hwk_type = 'HWK_drive'
-                    else:
-                        hwk_type = 'HWK_unknown'
-                    
-                    if hwk_type not in hwk_types:
-                        hwk_types[hwk_type] = 0
-                    hwk_types[hwk_type] += 1
+                hwk_types = self.data_manager.event_classifier.count_labels(hwk_data, 'hwk_subtype')
                 
                 stats_text += f"""
 
@@ -2842,26 +2507,10 @@ class InteractiveVisualizer(BaseVisualizer):
             if flick_count > 0:
                 # SWIPE 데이터에서 방향별 분포 계산
                 swipe_data = self.filtered_data[
-                    self.filtered_data['Layer Name'].str.contains('SWIPE', case=False, na=False)
+                    swipe_mask(self.filtered_data)
                 ]
                 
-                swipe_types = {}
-                for _, row in swipe_data.iterrows():
-                    layer_name = str(row['Layer Name']).lower()
-                    if 'swipe_up' in layer_name:
-                        swipe_type = 'SWIPE_UP'
-                    elif 'swipe_down' in layer_name:
-                        swipe_type = 'SWIPE_DOWN'
-                    elif 'swipe_left' in layer_name:
-                        swipe_type = 'SWIPE_LEFT'
-                    elif 'swipe_right' in layer_name:
-                        swipe_type = 'SWIPE_RIGHT'
-                    else:
-                        swipe_type = 'SWIPE_UNKNOWN'
-                    
-                    if swipe_type not in swipe_types:
-                        swipe_types[swipe_type] = 0
-                    swipe_types[swipe_type] += 1
+                swipe_types = self.data_manager.event_classifier.count_labels(swipe_data, 'swipe_direction')
                 
                 stats_text += f"""
 
@@ -2931,6 +2580,14 @@ class InteractiveVisualizer(BaseVisualizer):
     def cleanup_resources(self) -> None:
         """리소스 정리"""
         try:
+            # 미리 읽기 워커 종료
+            if getattr(self, 'prefetcher', None) is not None:
+                self.prefetcher.shutdown()
+            
+            # 다음 실행을 위해 마지막 선택 저장 (캐시를 비우기 전에)
+            if getattr(self, 'warm_start', None) is not None:
+                self.save_warm_start()
+            
             # 캐시 클리어
             if hasattr(self, 'clear_cache'):
                 self.clear_cache()
@@ -2965,6 +2622,7 @@ def show_quick_help(self):
 • 회색으로 표시된 사용자는 데이터가 없습니다
 • 시간 슬라이더로 특정 구간만 분석할 수 있습니다
 • Ctrl+S를 눌러 빠르게 저장할 수 있습니다
+• F6으로 기록 중인 세션을 실시간으로 추적할 수 있습니다
 • 레이어 필터로 특정 UI 요소만 분석 가능합니다
 
 📁 데이터 준비:
@@ -2991,6 +2649,9 @@ def setup_keyboard_shortcuts(self):
     # 새로고침 단축키
     self.root.bind('<F5>', lambda e: self.refresh_data())
     
+    # 실시간 추적 토글 (기록 중인 세션)
+    self.root.bind('<F6>', lambda e: self.toggle_live_follow())
+    
     # 종료 단축키
     self.root.bind('<Control-q>', lambda e: self.root.quit())
     
@@ -3003,20 +2664,84 @@ def setup_keyboard_shortcuts(self):
 def refresh_data(self):
     """데이터 새로고침"""
     try:
-        # 기존 데이터 클리어
-        self.data.clear()
-        self.filtered_data = None
-        
-        # 사용자 목록 다시 로드
+        # 변경된 파일만 증분 반영 (버튼 재구성 및 현재 화면 갱신 포함)
+        changes = self.check_data_changes(force=True)
         users = self.get_user_list()
         
-        # UI 업데이트 (사용자 버튼 다시 생성은 복잡하므로 메시지만)
-        messagebox.showinfo("새로고침 완료", f"{len(users)}명의 사용자를 다시 로드했습니다.")
+        if changes:
+            messagebox.showinfo("새로고침 완료",
+                                f"{len(users)}명의 사용자, 변경된 파일 {len(changes.changed_paths)}개를 반영했습니다.")
+        else:
+            messagebox.showinfo("새로고침 완료", f"{len(users)}명의 사용자, 변경된 파일이 없습니다.")
         
     except Exception as e:
         logger.error(f"데이터 새로고침 오류: {e}")
 
 
+def toggle_live_follow(self):
+    """선택된 파일의 실시간 추적(테일 읽기) 켜기/끄기"""
+    self.live_follow = not getattr(self, 'live_follow', False)
+    
+    # 예약된 틱을 먼저 취소해 빠르게 껐다 켜도 추적 루프가 하나만 돌게 함
+    after_id = getattr(self, '_live_follow_after_id', None)
+    if after_id is not None:
+        self.root.after_cancel(after_id)
+        self._live_follow_after_id = None
+    
+    if self.live_follow:
+        logger.info("실시간 추적 시작")
+        if hasattr(self, 'info_label'):
+            self.info_label.config(text="🔴 실시간 추적 중 (F6으로 중지)")
+        self._live_follow_after_id = self.root.after(self.config.live_follow_interval,
+                                                     self._live_follow_tick)
+    else:
+        self.data_manager.stop_following()
+        logger.info("실시간 추적 중지")
+        if hasattr(self, 'info_label'):
+            self.info_label.config(text="실시간 추적이 중지되었습니다.")
+
+
+def _live_follow_tick(self):
+    """추가된 행만 읽어 현재 화면에 반영 (root.after 콜백)"""
+    self._live_follow_after_id = None
+    if not getattr(self, 'live_follow', False):
+        return
+    
+    try:
+        if self.selected_files:
+            added = self.data_manager.follow_files(sorted(self.selected_files))
+            if added:
+                logger.debug(f"실시간 추적: {added}개 행 추가")
+                self._refresh_followed_data()
+    except Exception as e:
+        logger.error(f"실시간 추적 오류: {e}")
+    finally:
+        if getattr(self, 'live_follow', False) and self._live_follow_after_id is None:
+            self._live_follow_after_id = self.root.after(self.config.live_follow_interval,
+                                                         self._live_follow_tick)
+
+
+def _refresh_followed_data(self):
+    """추가된 행을 현재 시간 구간과 제외 필터를 유지한 채 반영"""
+    combined_data = self.load_and_combine_data()
+    if combined_data is None or len(combined_data) == 0:
+        return
+    
+    # 슬라이더 범위만 늘리고, 구간 끝이 범위 끝에 붙어 있었으면 새 끝까지 따라감
+    slider = self.time_range_slider
+    max_time_sec = combined_data['Time(ms)'].max() / 1000
+    follow_end = slider.end_var.get() >= slider.to
+    slider.set_range(slider.from_, max_time_sec)
+    if follow_end:
+        slider.end_var.set(max_time_sec)
+        self.end_time_var.set(max_time_sec * 1000)
+        slider.draw_slider()
+        slider.update_range_label()
+    self.update_time_range_display(*slider.get_values())
+    
+    self.apply_filter_auto()
+
+
 def select_task_by_key(self, task_num):
     """키보드로 Task 선택"""
     try:
@@ -3035,3 +2760,6 @@ InteractiveVisualizer.get_user_file_count = get_user_file_count
 InteractiveVisualizer.setup_keyboard_shortcuts = setup_keyboard_shortcuts
 InteractiveVisualizer.refresh_data = refresh_data
 InteractiveVisualizer.select_task_by_key = select_task_by_key
+InteractiveVisualizer.toggle_live_follow = toggle_live_follow
+InteractiveVisualizer._live_follow_tick = _live_follow_tick
+InteractiveVisualizer._refresh_followed_data = _refresh_followed_data
@@ -14,7 +14,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 import tkinter as tk
 from src.touch_analyzer.core.config import Config
 from src.touch_analyzer.utils.logging_utils import setup_logger
-from src.touch_analyzer.utils.memory_utils import MemoryMonitor, full_memory_cleanup
+from src.touch_analyzer.utils.memory_utils import MemoryMonitor, full_memory_cleanup, enable_copy_on_write
 from src.touch_analyzer.utils.path_manager import path_manager
 
 # 설정 로드
@@ -37,10 +37,13 @@ def initialize_application():
     # 필요한 디렉토리 생성
     config.ensure_directories()
     
+    # 캐시된 데이터프레임을 복사 없이 공유하기 위한 pandas Copy-on-Write 모드
+    enable_copy_on_write()
+    
     # 메모리 모니터 초기화
     memory_monitor = MemoryMonitor(
         enable_monitoring=True, 
-        threshold_mb=config_dict.get('performance', {}).get('memory_threshold_mb', 1000.0)
+        threshold_mb=config_dict.get('performance', {}).get('memory_threshold_mb', 800.0)
     )
     memory_monitor.log_memory_usage("프로그램 시작")
     
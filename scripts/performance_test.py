@@ -15,7 +15,8 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.touch_analyzer.core.config import Config
-from src.touch_analyzer.core.data_manager import DataManager
+from src.touch_analyzer.core.data_manager import DataManager, optimize_touch_dataframe
+from src.touch_analyzer.core.touch_log_parser import parse_touch_log
 from src.touch_analyzer.utils.memory_utils import MemoryMonitor, optimize_dataframe_memory
 from src.touch_analyzer.core.cache_manager import CacheManager
 
@@ -150,7 +151,40 @@ class PerformanceTester:
             else:
                 logger.warning(f"  파일 로딩 실패")
     
-    def _get_test_files(self):
+    def test_parser_throughput(self, repeat: int = 5):
+        """CSV 파서 처리량 비교 (범용 read_csv 경로 vs 전용 파서)"""
+        logger.info("=== 파서 처리량 테스트 시작 ===")
+        
+        import pandas as pd
+        
+        test_files = self._get_test_files(limit=None)
+        if not test_files:
+            logger.warning("테스트 파일이 없습니다.")
+            return
+        
+        required_columns = list(self.config.required_columns)
+        
+        def legacy_parse(file_path):
+            return optimize_touch_dataframe(pd.read_csv(file_path), required_columns)
+        
+        def schema_parse(file_path):
+            return parse_touch_log(file_path, required_columns)
+        
+        for name, parse in (("범용 read_csv", legacy_parse), ("전용 파서", schema_parse)):
+            total_rows = 0
+            start_time = time.perf_counter()
+            for _ in range(repeat):
+                for file_path in test_files:
+                    total_rows += len(parse(file_path))
+            elapsed = time.perf_counter() - start_time
+            
+            sample = parse(test_files[0])
+            memory_kb = sample.memory_usage(deep=True).sum() / 1024
+            logger.info(f"{name}: {total_rows / elapsed:,.0f} 행/초 "
+                        f"({len(test_files)}개 파일 x {repeat}회, {elapsed:.2f}초, "
+                        f"첫 파일 메모리 {memory_kb:.1f} KB)")
+    
+    def _get_test_files(self, limit=5):
         """테스트용 파일 목록 반환"""
         data_dir = self.config.data_dir
         test_files = []
@@ -161,7 +195,7 @@ class PerformanceTester:
                     if file.endswith('.csv'):
                         test_files.append(os.path.join(root, file))
         
-        return test_files[:5]  # 최대 5개 파일만 테스트
+        return test_files[:limit]  # 기본 최대 5개 파일만 테스트
     
     def run_all_tests(self):
         """모든 성능 테스트 실행"""
@@ -180,6 +214,9 @@ class PerformanceTester:
             self.test_file_loading_performance()
             print()
             
+            self.test_parser_throughput()
+            print()
+            
             logger.info("✅ 모든 성능 테스트 완료")
             
         except Exception as e:
@@ -1,34 +1,56 @@
 """
 캐시 관리 모듈 - 최적화된 버전
-LRU 방식의 메모리 캐시 관리
+바이트 예산 안에서 재계산 비용/크기를 고려하는 GreedyDual-Size 메모리 캐시 관리
 """
 
+import sys
 import time
 import logging
-from typing import Optional, Dict, Any, Tuple
+import threading
+from typing import Optional, Dict, Any, Tuple, Callable, List
 from collections import OrderedDict
+from concurrent.futures import Future
 import gc
 
-logger = logging.getLogger(__name__)
+import numpy as np
+import pandas as pd
+
+from ..utils.memory_utils import copy_on_write_enabled
 
+logger = logging.getLogger(__name__)
 
 class CacheManager:
-    """최적화된 LRU 캐시 매니저"""
+    """바이트 예산 기반 GreedyDual-Size 캐시 매니저 (스레드 안전, 키별 단일 계산)"""
     
-    def __init__(self, max_size: int = 10, ttl_seconds: int = 3600):
+    def __init__(self, max_size: Optional[int] = 10, ttl_seconds: int = 3600,
+                 max_bytes: Optional[int] = None,
+                 on_evict: Optional[Callable[[str, Any], None]] = None):
         """
         캐시 매니저 초기화
         
         Args:
-            max_size: 최대 캐시 크기
+            max_size: 최대 항목 수 (None이면 항목 수 제한 없음)
             ttl_seconds: 캐시 항목의 수명 (초)
+            max_bytes: 캐시 메모리 예산 (바이트, None이면 예산 제한 없음)
+            on_evict: 용량 때문에 밀려난 항목을 받는 콜백 (키, 값) - 하위 계층 스필용
         """
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self._lock = threading.RLock()
         self._cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
         self._access_count: Dict[str, int] = {}
+        # 항목별 (크기 바이트, 재계산 비용, GreedyDual 우선순위)
+        self._entry_meta: Dict[str, Tuple[int, float, float]] = {}
+        self._inflight: Dict[str, Future] = {}  # 계산 중인 키 → 결과를 기다릴 Future
+        self._total_bytes = 0
+        self._inflation = 0.0  # GreedyDual의 L 값 (마지막 제거 항목의 우선순위)
         self._total_hits = 0
         self._total_misses = 0
+        self._evictions = 0
+        self._rejected = 0
+        self._coalesced_waits = 0
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -40,55 +62,54 @@ class CacheManager:
         Returns:
             Optional[Any]: 캐시된 값 또는 None
         """
-        if key in self._cache:
-            value, timestamp = self._cache[key]
-            current_time = time.time()
-            
-            # TTL 확인
-            if current_time - timestamp > self.ttl_seconds:
-                # 만료된 항목 제거
-                del self._cache[key]
-                if key in self._access_count:
-                    del self._access_count[key]
-                logger.debug(f"캐시 만료: {key}")
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
                 self._total_misses += 1
                 return None
-            
-            # LRU: 사용된 항목을 맨 뒤로 이동
-            self._cache.move_to_end(key)
-            self._access_count[key] = self._access_count.get(key, 0) + 1
-            self._total_hits += 1
-            
-            logger.debug(f"캐시 히트: {key}")
-            return value
+            return _share(value)
+    
+    def _lookup(self, key: str) -> Optional[Any]:
+        """유효한 항목의 원본 값 조회 및 히트 기록 (잠금 안에서 호출, 미스는 기록하지 않음)"""
+        if key not in self._cache:
+            return None
+        
+        value, timestamp = self._cache[key]
+        current_time = time.time()
+        
+        # TTL 확인
+        if current_time - timestamp > self.ttl_seconds:
+            # 만료된 항목 제거
+            self._remove(key)
+            logger.debug(f"캐시 만료: {key}")
+            return None
+        
+        # 사용된 항목은 우선순위를 현재 L 기준으로 다시 올림
+        self._cache.move_to_end(key)
+        size, cost, _ = self._entry_meta[key]
+        self._entry_meta[key] = (size, cost, self._inflation + cost / size)
+        self._access_count[key] = self._access_count.get(key, 0) + 1
+        self._total_hits += 1
         
-        self._total_misses += 1
-        logger.debug(f"캐시 미스: {key}")
-        return None
+        logger.debug(f"캐시 히트: {key}")
+        return value
     
-    def put(self, key: str, value: Any) -> None:
+    def put(self, key: str, value: Any, cost: float = 1.0) -> bool:
         """
-        캐시에 값 저장 (메모리 최적화 포함)
+        캐시에 값 저장 (크기를 측정하여 예산 안에서 GreedyDual-Size로 제거)
         
         Args:
             key: 캐시 키
             value: 저장할 값
+            cost: 값을 다시 만드는 비용 (예: 로드 시간 초, 클수록 오래 유지)
+            
+        Returns:
+            bool: 저장 여부 (예산보다 큰 값은 저장하지 않음)
         """
-        current_time = time.time()
-        
-        if key in self._cache:
-            # 기존 키 업데이트
-            self._cache.pop(key)
-            logger.debug(f"캐시 업데이트: {key}")
-        elif len(self._cache) >= self.max_size:
-            # 캐시 크기 초과 시 가장 오래된 항목 제거
-            oldest_key, _ = self._cache.popitem(last=False)
-            if oldest_key in self._access_count:
-                del self._access_count[oldest_key]
-            logger.debug(f"캐시 제거 (LRU): {oldest_key}")
-        
-        # 메모리 사용량이 큰 객체는 복사본 저장
-        if hasattr(value, 'copy'):
+        # pandas 객체는 CoW 얕은 복사로 공유 (호출자가 수정해도 캐시는 불변)
+        if isinstance(value, (pd.DataFrame, pd.Series)) and copy_on_write_enabled():
+            cached_value = value.copy(deep=False)
+        elif hasattr(value, 'copy'):
             try:
                 cached_value = value.copy()
             except Exception:
@@ -96,27 +117,225 @@ class CacheManager:
         else:
             cached_value = value
         
-        self._cache[key] = (cached_value, current_time)
-        self._access_count[key] = 0
-        logger.debug(f"캐시 저장: {key}")
+        size = max(1, estimate_size(cached_value) + len(key.encode('utf-8')))
+        evicted = []
+        
+        with self._lock:
+            if key in self._cache:
+                # 기존 키 업데이트
+                self._remove(key)
+                logger.debug(f"캐시 업데이트: {key}")
+            
+            if self.max_bytes is not None and size > self.max_bytes:
+                # 어차피 들어가지 못할 값 때문에 다른 항목을 비우지 않음
+                self._rejected += 1
+                logger.debug(f"캐시 예산 초과로 저장 생략: {key} ({size / 1024 / 1024:.1f} MB)")
+                evicted.append((key, cached_value))
+                stored = False
+            else:
+                while self._cache and self._over_budget(size):
+                    evicted.append(self._evict_one())
+                
+                cost = max(float(cost), 1e-6)
+                self._cache[key] = (cached_value, time.time())
+                self._entry_meta[key] = (size, cost, self._inflation + cost / size)
+                self._total_bytes += size
+                self._access_count[key] = 0
+                logger.debug(f"캐시 저장: {key} ({size / 1024:.1f} KB)")
+                stored = True
+        
+        # 스필 등 느린 콜백은 잠금 밖에서 실행
+        self._notify_evicted(evicted)
+        return stored
+    
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       cost: Optional[float] = None) -> Any:
+        """
+        캐시 조회 후 없으면 계산하여 저장 (같은 키의 동시 요청은 한 번만 계산)
+        
+        먼저 도착한 호출자가 계산하고, 계산 중에 들어온 호출자들은
+        같은 Future의 결과를 기다립니다.
+        
+        Args:
+            key: 캐시 키
+            compute: 값을 만드는 함수
+            cost: 재계산 비용 (None이면 계산에 걸린 시간 초)
+            
+        Returns:
+            Any: 캐시된 값 또는 새로 계산한 값
+            
+        Raises:
+            Exception: compute가 실패한 경우 그 예외 (기다리던 호출자에게도 전달)
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        future, owner = self.begin_compute(key)
+        if not owner:
+            return _share(future.result())
+        
+        start = time.perf_counter()
+        try:
+            value = compute()
+        except BaseException as e:
+            self.fail_compute(key, e)
+            raise
+        self.finish_compute(key, value, cost if cost is not None else time.perf_counter() - start)
+        return value
+    
+    def begin_compute(self, key: str) -> Tuple[Future, bool]:
+        """
+        키 계산 시작 선언 (단일 계산 보장용 저수준 API)
+        
+        앞선 get() 이후 다른 호출자가 계산을 끝냈을 수 있으므로 같은 잠금 안에서
+        캐시를 다시 확인하고, 값이 있으면 이미 완료된 Future를 돌려줍니다.
+        계산 담당(True)을 받은 호출자는 반드시 finish_compute 또는 fail_compute를 호출해야 합니다.
+        
+        Args:
+            key: 캐시 키
+            
+        Returns:
+            Tuple[Future, bool]: 결과 Future, 호출자가 계산 담당인지 여부
+                (False면 캐시된 값이 있거나 다른 호출자가 계산 중이므로 Future만 기다리면 됨)
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                future = Future()
+                future.set_result(value)
+                return future, False
+            
+            future = self._inflight.get(key)
+            if future is not None:
+                self._coalesced_waits += 1
+                logger.debug(f"진행 중인 계산 대기: {key}")
+                return future, False
+            
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+    
+    def finish_compute(self, key: str, value: Any, cost: float = 1.0) -> None:
+        """begin_compute로 시작한 계산 결과를 저장하고 대기자들에게 전달 (저장이 실패해도 전달)"""
+        try:
+            if value is not None:
+                self.put(key, value, cost=cost)
+        finally:
+            with self._lock:
+                future = self._inflight.pop(key, None)
+            if future is not None:
+                future.set_result(value)
+    
+    def fail_compute(self, key: str, error: BaseException) -> None:
+        """begin_compute로 시작한 계산 실패를 대기자들에게 전달"""
+        with self._lock:
+            future = self._inflight.pop(key, None)
+        if future is not None:
+            future.set_exception(error)
+    
+    def _over_budget(self, incoming: int) -> bool:
+        """새 항목을 넣으면 항목 수 또는 바이트 예산을 넘는지 여부"""
+        if self.max_size is not None and len(self._cache) >= self.max_size:
+            return True
+        return self.max_bytes is not None and self._total_bytes + incoming > self.max_bytes
+    
+    def _evict_one(self, candidates: Optional[List[str]] = None) -> Tuple[str, Any]:
+        """우선순위(L + 비용/크기)가 가장 낮은 항목 제거 (동률이면 오래된 것부터, 잠금 안에서 호출)"""
+        victim = min(candidates if candidates is not None else self._cache,
+                     key=lambda k: self._entry_meta[k][2])
+        self._inflation = self._entry_meta[victim][2]
+        value, _ = self._cache[victim]
+        self._remove(victim)
+        self._evictions += 1
+        logger.debug(f"캐시 제거 (GreedyDual-Size): {victim}")
+        return victim, value
+    
+    def _notify_evicted(self, evicted: List[Tuple[str, Any]]) -> None:
+        """밀려난 항목들을 콜백에 전달"""
+        if self.on_evict is None:
+            return
+        for key, value in evicted:
+            try:
+                self.on_evict(key, value)
+            except Exception as e:
+                logger.warning(f"제거 콜백 실패: {key}, 오류: {str(e)}")
+    
+    def _remove(self, key: str) -> None:
+        """항목과 관련 메타데이터 제거 (잠금 안에서 호출)"""
+        del self._cache[key]
+        self._access_count.pop(key, None)
+        size, _, _ = self._entry_meta.pop(key, (0, 0.0, 0.0))
+        self._total_bytes -= size
+    
+    def invalidate(self, predicate: Callable[[str], bool]) -> int:
+        """
+        조건에 맞는 키의 캐시 항목들만 제거
+        
+        Args:
+            predicate: 키를 받아 제거 여부를 반환하는 함수
+            
+        Returns:
+            int: 제거된 항목 수
+        """
+        with self._lock:
+            keys = [key for key in self._cache if predicate(key)]
+            for key in keys:
+                self._remove(key)
+        
+        if keys:
+            logger.debug(f"캐시 무효화: {len(keys)}개 항목")
+        return len(keys)
     
     def clear(self) -> None:
         """캐시 전체 클리어"""
-        cache_size = len(self._cache)
-        self._cache.clear()
-        self._access_count.clear()
-        self._total_hits = 0
-        self._total_misses = 0
+        with self._lock:
+            cache_size = len(self._cache)
+            self._cache.clear()
+            self._access_count.clear()
+            self._entry_meta.clear()
+            self._total_bytes = 0
+            self._inflation = 0.0
+            self._total_hits = 0
+            self._total_misses = 0
+            self._coalesced_waits = 0
+            self._evictions = 0
+            self._rejected = 0
         gc.collect()  # 가비지 컬렉션 강제 실행
         logger.info(f"캐시 클리어 완료: {cache_size}개 항목 제거")
     
+    def contains(self, key: str) -> bool:
+        """통계나 접근 순서를 바꾸지 않고 유효한 항목이 있는지 확인"""
+        with self._lock:
+            entry = self._cache.get(key)
+            return entry is not None and time.time() - entry[1] <= self.ttl_seconds
+    
+    def export_entries(self, predicate: Callable[[str], bool]) -> List[Tuple[str, Any]]:
+        """
+        조건에 맞는 유효 항목들의 (키, 값) 목록 (영속화용, 통계에 반영하지 않음)
+        
+        Args:
+            predicate: 키를 받아 포함 여부를 반환하는 함수
+            
+        Returns:
+            List[Tuple[str, Any]]: (키, 값) 목록
+        """
+        now = time.time()
+        with self._lock:
+            return [(key, _share(value)) for key, (value, timestamp) in self._cache.items()
+                    if now - timestamp <= self.ttl_seconds and predicate(key)]
+    
     def size(self) -> int:
         """현재 캐시 크기 반환"""
-        return len(self._cache)
+        with self._lock:
+            return len(self._cache)
     
     def is_full(self) -> bool:
-        """캐시가 가득 찼는지 확인"""
-        return len(self._cache) >= self.max_size
+        """캐시가 가득 찼는지 확인 (항목 수 또는 바이트 예산 기준)"""
+        with self._lock:
+            if self.max_size is not None and len(self._cache) >= self.max_size:
+                return True
+            return self.max_bytes is not None and self._total_bytes >= self.max_bytes
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -125,25 +344,32 @@ class CacheManager:
         Returns:
             Dict[str, Any]: 캐시 통계 정보
         """
-        total_requests = self._total_hits + self._total_misses
-        hit_rate = (self._total_hits / total_requests * 100) if total_requests > 0 else 0
-        
-        # 가장 자주 접근된 항목들
-        top_accessed = sorted(
-            self._access_count.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:5]
-        
-        return {
-            'size': len(self._cache),
-            'max_size': self.max_size,
-            'total_hits': self._total_hits,
-            'total_misses': self._total_misses,
-            'hit_rate': hit_rate,
-            'ttl_seconds': self.ttl_seconds,
-            'top_accessed': top_accessed
-        }
+        with self._lock:
+            total_requests = self._total_hits + self._total_misses
+            hit_rate = (self._total_hits / total_requests * 100) if total_requests > 0 else 0
+            
+            # 가장 자주 접근된 항목들
+            top_accessed = sorted(
+                self._access_count.items(), 
+                key=lambda x: x[1], 
+                reverse=True
+            )[:5]
+            
+            return {
+                'size': len(self._cache),
+                'max_size': self.max_size,
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'evictions': self._evictions,
+                'rejected': self._rejected,
+                'total_hits': self._total_hits,
+                'total_misses': self._total_misses,
+                'coalesced_waits': self._coalesced_waits,
+                'inflight': len(self._inflight),
+                'hit_rate': hit_rate,
+                'ttl_seconds': self.ttl_seconds,
+                'top_accessed': top_accessed
+            }
     
     def cleanup_expired(self) -> int:
         """
@@ -153,16 +379,12 @@ class CacheManager:
             int: 정리된 항목 수
         """
         current_time = time.time()
-        expired_keys = []
-        
-        for key, (value, timestamp) in self._cache.items():
-            if current_time - timestamp > self.ttl_seconds:
-                expired_keys.append(key)
         
-        for key in expired_keys:
-            del self._cache[key]
-            if key in self._access_count:
-                del self._access_count[key]
+        with self._lock:
+            expired_keys = [key for key, (_, timestamp) in self._cache.items()
+                            if current_time - timestamp > self.ttl_seconds]
+            for key in expired_keys:
+                self._remove(key)
         
         if expired_keys:
             logger.debug(f"만료된 캐시 항목 정리: {len(expired_keys)}개")
@@ -171,51 +393,59 @@ class CacheManager:
     
     def get_memory_usage_estimate(self) -> int:
         """
-        캐시 메모리 사용량 추정 (바이트)
+        캐시 메모리 사용량 (저장 시 측정한 바이트 합계)
         
         Returns:
-            int: 추정 메모리 사용량 (바이트)
+            int: 메모리 사용량 (바이트)
         """
-        total_size = 0
-        
-        for key, (value, timestamp) in self._cache.items():
-            # 키 크기
-            total_size += len(key.encode('utf-8'))
-            
-            # 값 크기 추정
-            if hasattr(value, '__sizeof__'):
-                total_size += value.__sizeof__()
-            elif hasattr(value, 'memory_usage'):
-                # pandas DataFrame의 경우
-                total_size += value.memory_usage(deep=True).sum()
-            else:
-                # 기본 추정
-                total_size += 1000  # 기본 1KB 추정
-        
-        return total_size
+        with self._lock:
+            return self._total_bytes
     
     def optimize_memory(self, target_size_mb: float = 100.0) -> None:
         """
-        메모리 사용량 최적화
+        메모리 사용량 최적화 (목표 크기 이하가 될 때까지 우선순위 낮은 항목 제거)
         
         Args:
             target_size_mb: 목표 메모리 크기 (MB)
         """
-        current_memory_mb = self.get_memory_usage_estimate() / 1024 / 1024
+        target_bytes = target_size_mb * 1024 * 1024
+        evicted = []
+        with self._lock:
+            while self._cache and self._total_bytes > target_bytes:
+                evicted.append(self._evict_one())
         
-        if current_memory_mb > target_size_mb:
-            # 메모리 사용량이 목표를 초과한 경우
-            items_to_remove = int(len(self._cache) * 0.3)  # 30% 제거
-            
-            # 가장 오래된 항목들 제거
-            for _ in range(items_to_remove):
-                if self._cache:
-                    oldest_key, _ = self._cache.popitem(last=False)
-                    if oldest_key in self._access_count:
-                        del self._access_count[oldest_key]
+        if not evicted:
+            return
+        
+        self._notify_evicted(evicted)
+        gc.collect()  # 가비지 컬렉션 강제 실행
+        logger.info(f"메모리 최적화 완료: {len(evicted)}개 항목 제거")
+    
+    def release(self, target_bytes: int,
+                predicate: Optional[Callable[[str], bool]] = None) -> int:
+        """
+        우선순위 낮은 항목부터 목표 바이트 이상을 비울 때까지 제거 (메모리 압박 대응)
+        
+        Args:
+            target_bytes: 비울 목표 바이트 수
+            predicate: 제거 대상 키 조건 (None이면 전체)
             
-            gc.collect()  # 가비지 컬렉션 강제 실행
-            logger.info(f"메모리 최적화 완료: {items_to_remove}개 항목 제거")
+        Returns:
+            int: 실제로 비운 바이트 수
+        """
+        freed = 0
+        evicted = []
+        with self._lock:
+            candidates = [key for key in self._cache if predicate is None or predicate(key)]
+            while candidates and freed < target_bytes:
+                before = self._total_bytes
+                key, value = self._evict_one(candidates)
+                candidates.remove(key)
+                freed += before - self._total_bytes
+                evicted.append((key, value))
+        
+        self._notify_evicted(evicted)
+        return freed
     
     def get_cache_info(self) -> Dict[str, Any]:
         """
@@ -230,3 +460,42 @@ class CacheManager:
             'expired_items': self.cleanup_expired()
         })
         return stats
+
+
+def estimate_size(value: Any) -> int:
+    """
+    캐시 값의 메모리 크기 측정 (바이트)
+    
+    데이터프레임/시리즈는 memory_usage(deep=True), 배열과 nbytes 속성을 가진 객체
+    (FlickIndex, SessionTimeIndex 등)는 nbytes로 정확히 재고,
+    그 외 컨테이너는 원소까지 한 단계만 합산합니다.
+    
+    Args:
+        value: 측정할 값
+        
+    Returns:
+        int: 크기 (바이트)
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, (int, np.integer)):
+        return sys.getsizeof(value) + int(nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def _share(value: Any) -> Any:
+    """캐시 값을 호출자에게 전달 (CoW 모드면 버퍼를 공유하는 얕은 복사본, 아니면 깊은 복사본)"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not copy_on_write_enabled())
+    return value
@@ -0,0 +1,204 @@
+"""
+컬럼 캐시 모듈 - 파싱된 터치 로그의 디스크 사이드카 캐시
+CSV 파싱 결과를 컬럼별 .npy 파일로 저장하여 재시작 후에도 즉시 로드
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import logging
+from typing import Optional, Dict, Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 캐시 포맷이 바뀌면 증가시켜 이전 캐시를 자동 무효화
+CACHE_FORMAT_VERSION = 3
+META_FILENAME = "meta.json"
+
+
+class ColumnCache:
+    """원본 파일 경로 + mtime + 크기로 검증되는 컬럼형 디스크 캐시"""
+
+    def __init__(self, cache_dir: str, tag: str = ""):
+        """
+        컬럼 캐시 초기화
+
+        Args:
+            cache_dir: 캐시 루트 디렉토리 (하위에 columns/ 생성)
+            tag: 파생 컬럼 계산 방식 지문 (다르면 캐시 미스로 처리, 예: 이벤트 분류 규칙)
+        """
+        self.cache_dir = os.path.join(cache_dir, "columns")
+        self.tag = tag
+        self._hits = 0
+        self._misses = 0
+
+    def _entry_dir(self, file_path: str) -> str:
+        """원본 파일 경로에 대응하는 캐시 항목 디렉토리"""
+        digest = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:20]
+        return os.path.join(self.cache_dir, digest)
+
+    @staticmethod
+    def _signature(file_stat: os.stat_result) -> Dict[str, int]:
+        """캐시 유효성 검증용 파일 시그니처"""
+        return {'mtime_ns': file_stat.st_mtime_ns, 'size': file_stat.st_size}
+
+    def _read_meta(self, entry_dir: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목 메타데이터 읽기"""
+        try:
+            with open(os.path.join(entry_dir, META_FILENAME), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load(self, file_path: str, file_stat: os.stat_result,
+             mmap: bool = True) -> Optional[pd.DataFrame]:
+        """
+        캐시된 컬럼들을 데이터프레임으로 복원
+
+        Args:
+            file_path: 원본 CSV 파일 경로
+            file_stat: 원본 파일의 os.stat 결과
+            mmap: 메모리 매핑으로 읽을지 여부
+
+        Returns:
+            Optional[pd.DataFrame]: 유효한 캐시가 있으면 데이터프레임, 없으면 None
+        """
+        entry_dir = self._entry_dir(file_path)
+        meta = self._read_meta(entry_dir)
+        if (meta is None
+                or meta.get('version') != CACHE_FORMAT_VERSION
+                or meta.get('tag', "") != self.tag
+                or meta.get('signature') != self._signature(file_stat)):
+            self._misses += 1
+            return None
+
+        try:
+            df = read_columns(entry_dir, meta, mmap=mmap)
+        except Exception as e:
+            logger.warning(f"컬럼 캐시 읽기 실패, 재생성합니다: {file_path}, 오류: {str(e)}")
+            self.invalidate(file_path)
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        logger.debug(f"컬럼 캐시 히트: {file_path} ({len(df)} 행)")
+        return df
+
+    def store(self, file_path: str, file_stat: os.stat_result, df: pd.DataFrame) -> bool:
+        """
+        데이터프레임을 컬럼 캐시에 저장
+
+        Args:
+            file_path: 원본 CSV 파일 경로
+            file_stat: 파싱 시점의 원본 파일 os.stat 결과
+            df: 최적화가 끝난 데이터프레임
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        entry_dir = self._entry_dir(file_path)
+        meta = {
+            'version': CACHE_FORMAT_VERSION,
+            'tag': self.tag,
+            'source': os.path.abspath(file_path),
+            'signature': self._signature(file_stat),
+        }
+        try:
+            write_columns(entry_dir, df, meta)
+            logger.debug(f"컬럼 캐시 저장: {file_path}")
+            return True
+        except Exception as e:
+            logger.warning(f"컬럼 캐시 저장 실패: {file_path}, 오류: {str(e)}")
+            return False
+
+    def invalidate(self, file_path: str) -> None:
+        """특정 원본 파일의 캐시 항목 제거"""
+        shutil.rmtree(self._entry_dir(file_path), ignore_errors=True)
+
+    def clear(self) -> None:
+        """컬럼 캐시 전체 삭제"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self._hits = 0
+        self._misses = 0
+        logger.info("컬럼 캐시 삭제 완료")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """컬럼 캐시 통계 반환"""
+        return {
+            'cache_dir': self.cache_dir,
+            'hits': self._hits,
+            'misses': self._misses
+        }
+
+
+def write_columns(entry_dir: str, df: pd.DataFrame, meta: Dict[str, Any]) -> None:
+    """
+    데이터프레임을 컬럼별 .npy 파일과 메타데이터로 저장 (원자적 교체)
+
+    Args:
+        entry_dir: 저장할 디렉토리
+        df: 저장할 데이터프레임
+        meta: 함께 저장할 메타데이터
+    """
+    # 같은 항목을 여러 스레드/프로세스가 동시에 써도 겹치지 않는 임시 디렉토리
+    parent_dir = os.path.dirname(entry_dir)
+    os.makedirs(parent_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=f"{os.path.basename(entry_dir)}.", suffix=".tmp", dir=parent_dir)
+    try:
+        _write_columns_to(tmp_dir, df, meta)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(tmp_dir, entry_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def _write_columns_to(tmp_dir: str, df: pd.DataFrame, meta: Dict[str, Any]) -> None:
+    """컬럼 파일과 메타데이터를 임시 디렉토리에 기록"""
+    columns = []
+    for i, name in enumerate(df.columns):
+        series = df[name]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            np.save(os.path.join(tmp_dir, f"col_{i}.npy"), np.asarray(series.cat.codes))
+            columns.append({
+                'name': name,
+                'kind': 'category',
+                'categories': [str(c) for c in series.cat.categories]
+            })
+        else:
+            np.save(os.path.join(tmp_dir, f"col_{i}.npy"), series.to_numpy())
+            columns.append({'name': name, 'kind': 'numeric'})
+
+    meta = dict(meta, rows=len(df), columns=columns)
+    with open(os.path.join(tmp_dir, META_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+
+def read_columns(entry_dir: str, meta: Dict[str, Any], mmap: bool = True) -> pd.DataFrame:
+    """
+    write_columns로 저장한 컬럼들을 데이터프레임으로 복원
+
+    Args:
+        entry_dir: 캐시 항목 디렉토리
+        meta: 캐시 항목 메타데이터
+        mmap: 메모리 매핑으로 읽을지 여부
+
+    Returns:
+        pd.DataFrame: 복원된 데이터프레임
+    """
+    mmap_mode = 'r' if mmap else None
+    data = {}
+    for i, column in enumerate(meta['columns']):
+        # memmap 서브클래스가 pandas 내부로 전파되지 않도록 ndarray 뷰로 변환 (복사 없음)
+        values = np.asarray(np.load(os.path.join(entry_dir, f"col_{i}.npy"), mmap_mode=mmap_mode))
+        if column['kind'] == 'category':
+            data[column['name']] = pd.Categorical.from_codes(values, categories=column['categories'])
+        else:
+            data[column['name']] = values
+
+    return pd.DataFrame(data, copy=False)
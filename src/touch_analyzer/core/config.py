@@ -26,6 +26,7 @@ class Config:
     output_dir: str
     background_images_dir: str
     backup_dir: str
+    cache_dir: str = ""
     
     # 화면 설정
     screen_width: int = 3840
@@ -39,7 +40,24 @@ class Config:
     # 데이터 처리 설정
     required_columns: List[str] = None
     max_cache_size: int = 10
+    cache_budget_mb: float = 512.0
+    spill_cache_mb: float = 1024.0
     memory_monitor_interval: int = 5000
+    enable_column_cache: bool = True
+    max_concurrent_loads: int = 3
+    use_process_pool: bool = False
+    chunk_size: int = 10000
+    chunked_load_threshold_mb: float = 32.0
+    data_watch_interval: int = 2000
+    live_follow_interval: int = 1000
+    prefetch_enabled: bool = True
+    prefetch_memory_mb: float = 256.0
+    memory_threshold_mb: float = 800.0
+    memory_low_watermark_mb: float = 600.0
+    memory_release_cooldown_seconds: float = 10.0
+    derived_cache_mb: float = 128.0
+    warm_start_enabled: bool = False
+    event_rules: Dict[str, Any] = None  # 이벤트 분류 규칙 표 (None이면 기본 규칙)
     
     # 시각화 설정
     default_heatmap_bins_x: int = 50
@@ -63,6 +81,9 @@ class Config:
     
     def __post_init__(self):
         """초기화 후 기본값 설정"""
+        if not self.cache_dir:
+            self.cache_dir = str(Path(self.data_dir).parent / "data_cache")
+        
         if self.required_columns is None:
             self.required_columns = ['Time(ms)', 'TouchX', 'TouchY', 'Layer Name']
         
@@ -87,6 +108,7 @@ class Config:
             default_output_dir = path_manager.get_output_dir_str()
             default_bg_dir = path_manager.get_background_images_dir_str()
             default_backup_dir = path_manager.get_backup_dir_str()
+            default_cache_dir = path_manager.get_cache_dir_str()
         else:
             # 백업용 직접 경로 설정
             base_dir = Path(__file__).parent.parent.parent.parent
@@ -94,6 +116,7 @@ class Config:
             default_output_dir = str(base_dir / "data_results")
             default_bg_dir = str(base_dir / "data_bg")
             default_backup_dir = str(base_dir / "backup")
+            default_cache_dir = str(base_dir / "data_cache")
         
         return cls(
             base_dir=base_dir,
@@ -101,6 +124,7 @@ class Config:
             output_dir=config_dict.get('paths', {}).get('output_dir', default_output_dir),
             background_images_dir=config_dict.get('paths', {}).get('background_images_dir', default_bg_dir),
             backup_dir=config_dict.get('paths', {}).get('backup_dir', default_backup_dir),
+            cache_dir=config_dict.get('paths', {}).get('cache_dir', default_cache_dir),
             screen_width=config_dict.get('screen', {}).get('width', 3840),
             screen_height=config_dict.get('screen', {}).get('height', 850),
             window_width=config_dict.get('ui', {}).get('window_width', 1400),
@@ -108,7 +132,24 @@ class Config:
             window_title=config_dict.get('ui', {}).get('title', "dflux_InteractiveAnalyzer"),
             required_columns=config_dict.get('data', {}).get('required_columns', ['Time(ms)', 'TouchX', 'TouchY', 'Layer Name']),
             max_cache_size=config_dict.get('data', {}).get('max_cache_size', 10),
+            cache_budget_mb=config_dict.get('data', {}).get('cache_budget_mb', 512.0),
+            spill_cache_mb=config_dict.get('data', {}).get('spill_cache_mb', 1024.0),
             memory_monitor_interval=config_dict.get('data', {}).get('memory_monitor_interval', 5000),
+            enable_column_cache=config_dict.get('data', {}).get('enable_column_cache', True),
+            max_concurrent_loads=config_dict.get('performance', {}).get('options', {}).get('max_concurrent_loads', 3),
+            use_process_pool=config_dict.get('performance', {}).get('options', {}).get('use_process_pool', False),
+            chunk_size=config_dict.get('performance', {}).get('options', {}).get('chunk_size', 10000),
+            chunked_load_threshold_mb=config_dict.get('performance', {}).get('options', {}).get('chunked_load_threshold_mb', 32.0),
+            data_watch_interval=config_dict.get('data', {}).get('data_watch_interval', 2000),
+            live_follow_interval=config_dict.get('data', {}).get('live_follow_interval', 1000),
+            prefetch_enabled=config_dict.get('performance', {}).get('options', {}).get('enable_prefetch', True),
+            prefetch_memory_mb=config_dict.get('performance', {}).get('options', {}).get('prefetch_memory_mb', 256.0),
+            memory_threshold_mb=config_dict.get('performance', {}).get('memory_threshold_mb', 800.0),
+            memory_low_watermark_mb=config_dict.get('performance', {}).get('memory_low_watermark_mb', 600.0),
+            memory_release_cooldown_seconds=config_dict.get('performance', {}).get('memory_release_cooldown_seconds', 10.0),
+            derived_cache_mb=config_dict.get('data', {}).get('derived_cache_mb', 128.0),
+            warm_start_enabled=config_dict.get('data', {}).get('warm_start_enabled', False),
+            event_rules=config_dict.get('data', {}).get('event_rules'),
             default_heatmap_bins_x=config_dict.get('visualization', {}).get('heatmap', {}).get('default_bins_x', 50),
             default_heatmap_bins_y=config_dict.get('visualization', {}).get('heatmap', {}).get('default_bins_y', 20),
             min_heatmap_bins_x=config_dict.get('visualization', {}).get('heatmap', {}).get('min_bins_x', 20),
@@ -133,7 +174,8 @@ class Config:
                 data_dir=path_manager.get_data_dir_str(),
                 output_dir=path_manager.get_output_dir_str(),
                 background_images_dir=path_manager.get_background_images_dir_str(),
-                backup_dir=path_manager.get_backup_dir_str()
+                backup_dir=path_manager.get_backup_dir_str(),
+                cache_dir=path_manager.get_cache_dir_str()
             )
         else:
             # 백업용 직접 경로 설정
@@ -143,14 +185,16 @@ class Config:
                 data_dir=str(base_dir / "data_log"),
                 output_dir=str(base_dir / "data_results"),
                 background_images_dir=str(base_dir / "data_bg"),
-                backup_dir=str(base_dir / "backup")
+                backup_dir=str(base_dir / "backup"),
+                cache_dir=str(base_dir / "data_cache")
             )
     
     def ensure_directories(self) -> None:
         """필요한 디렉토리들 생성"""
         directories = [
             self.output_dir,
-            self.backup_dir
+            self.backup_dir,
+            self.cache_dir
         ]
         
         for directory in directories:
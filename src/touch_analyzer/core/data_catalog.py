@@ -0,0 +1,520 @@
+"""
+데이터 카탈로그 모듈
+data_log 폴더를 한 번의 scandir로 색인하여 사용자/Task/파일 조회를 O(1)로 제공
+모든 세션이 공유하는 레이어 이름 어휘(추가만 가능)도 함께 관리
+"""
+
+import os
+import json
+import logging
+import threading
+from dataclasses import dataclass, asdict, field
+from typing import Iterable, List, Optional, Dict, Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 포맷이 바뀌면 증가시켜 이전 인덱스를 무시
+CATALOG_FORMAT_VERSION = 1
+
+
+def extract_time_from_filename(filename: str) -> str:
+    """
+    파일명에서 시간 정보 추출 (마지막 6자리 숫자)
+
+    Args:
+        filename: 파일명
+
+    Returns:
+        str: 시간 정보 (6자리 숫자)
+    """
+    basename = os.path.basename(filename)
+    # 예: ks_drag_0803-121820.csv -> 121820
+    parts = basename.split('-')
+    if len(parts) > 1:
+        time_part = parts[-1].split('.')[0]  # .csv 제거
+        if len(time_part) == 6 and time_part.isdigit():
+            return time_part
+    return "000000"  # 기본값
+
+
+def count_data_rows(file_path: str) -> int:
+    """
+    CSV 파일의 데이터 행 수 계산 (헤더 제외, 파싱 없이 줄바꿈만 계수)
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        int: 데이터 행 수
+    """
+    lines = 0
+    last_byte = b'\n'
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(1 << 20)
+            if not block:
+                break
+            lines += block.count(b'\n')
+            last_byte = block[-1:]
+    if last_byte != b'\n':
+        lines += 1  # 마지막 줄에 줄바꿈이 없는 경우
+    return max(0, lines - 1)
+
+
+@dataclass
+class CatalogEntry:
+    """카탈로그에 등록된 세션 파일 하나의 메타데이터"""
+
+    file_id: int
+    path: str
+    user: str
+    size: int
+    mtime_ns: int
+    row_count: int
+    time_key: str
+
+
+@dataclass
+class CatalogChanges:
+    """카탈로그 갱신 결과 (변경된 파일 경로 목록)"""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    users_changed: bool = False
+
+    @property
+    def changed_paths(self) -> List[str]:
+        """추가/삭제/수정된 모든 경로"""
+        return self.added + self.removed + self.modified
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified or self.users_changed)
+
+
+class DataCatalog:
+    """data_log 폴더의 사용자 → 시간순 세션 목록 색인"""
+
+    def __init__(self, data_dir: str, index_path: Optional[str] = None):
+        """
+        데이터 카탈로그 초기화
+
+        Args:
+            data_dir: 데이터 루트 폴더 (data_log)
+            index_path: 색인 저장 파일 경로 (None이면 저장하지 않음)
+        """
+        self.data_dir = data_dir
+        self.index_path = index_path
+        self._users: List[str] = []
+        self._sessions: Dict[str, List[CatalogEntry]] = {}
+        self._root_files: List[CatalogEntry] = []
+        self._by_path: Dict[str, CatalogEntry] = {}
+        self._dir_mtimes: Dict[str, int] = {}  # 사용자 폴더별 mtime (파일 추가/삭제 감지용)
+        self._max_tasks = 0
+        self._next_file_id = 0
+        self._built = False
+        # 레이어 이름 어휘: 코드 = 목록 위치 (추가만 하므로 기존 코드는 바뀌지 않음)
+        self._layer_names: List[str] = []
+        self._layer_codes: Dict[str, int] = {}
+        self._layer_dtype: Optional[pd.CategoricalDtype] = None
+        self._layer_lock = threading.Lock()  # 워커/미리 읽기 스레드에서도 등록
+
+    @property
+    def is_built(self) -> bool:
+        """카탈로그가 구성되었는지 여부"""
+        return self._built
+
+    def build(self) -> None:
+        """
+        data_log 폴더를 한 번 스캔하여 카탈로그 구성
+
+        저장된 색인에서 크기/mtime이 같은 파일은 행 수와 파일 ID를 재사용합니다.
+        """
+        previous = self._load_index()
+        self._users = []
+        self._sessions = {}
+        self._root_files = []
+        self._by_path = {}
+        self._dir_mtimes = {}
+
+        if not os.path.isdir(self.data_dir):
+            self._built = True
+            self._max_tasks = 0
+            return
+
+        try:
+            with os.scandir(self.data_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        self._users.append(entry.name)
+                        self._dir_mtimes[entry.name] = entry.stat().st_mtime_ns
+                        self._sessions[entry.name] = self._scan_user_dir(entry.path, entry.name, previous)
+                    elif entry.is_file() and entry.name.endswith('.csv'):
+                        self._root_files.append(self._make_entry(entry, "", previous))
+        except OSError as e:
+            logger.error(f"데이터 폴더 스캔 실패: {str(e)}")
+
+        self._users.sort()
+        self._root_files.sort(key=self._sort_key)
+        self._reindex()
+        self._built = True
+        self.save()
+        logger.info(f"데이터 카탈로그 구성 완료: 사용자 {len(self._users)}명, 파일 {len(self._by_path)}개")
+
+    def _scan_user_dir(self, user_path: str, user: str,
+                       previous: Dict[str, Dict[str, Any]]) -> List[CatalogEntry]:
+        """사용자 폴더의 CSV 세션들을 시간순으로 수집"""
+        sessions = []
+        try:
+            with os.scandir(user_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.name.endswith('.csv'):
+                        continue
+                    if entry.is_file():
+                        sessions.append(self._make_entry(entry, user, previous))
+        except OSError as e:
+            logger.warning(f"사용자 폴더 스캔 실패: {user_path}, 오류: {str(e)}")
+        sessions.sort(key=self._sort_key)
+        return sessions
+
+    def _make_entry(self, dir_entry: os.DirEntry, user: str,
+                    previous: Dict[str, Dict[str, Any]]) -> CatalogEntry:
+        """DirEntry로부터 카탈로그 항목 생성 (변경 없는 파일은 이전 값 재사용)"""
+        stat = dir_entry.stat()
+        path = dir_entry.path
+        old = previous.get(path)
+
+        if old is not None and old['size'] == stat.st_size and old['mtime_ns'] == stat.st_mtime_ns:
+            row_count = old['row_count']
+        else:
+            try:
+                row_count = count_data_rows(path)
+            except OSError:
+                row_count = 0
+
+        if old is not None:
+            file_id = old['file_id']
+        else:
+            file_id = self._next_file_id
+            self._next_file_id += 1
+
+        return CatalogEntry(
+            file_id=file_id,
+            path=path,
+            user=user,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            row_count=row_count,
+            time_key=extract_time_from_filename(dir_entry.name)
+        )
+
+    def refresh(self) -> CatalogChanges:
+        """
+        변경된 부분만 다시 스캔하여 카탈로그를 증분 갱신
+
+        최상위 폴더는 매번 나열하지만, 사용자 폴더는 폴더 mtime이 바뀐 경우에만
+        다시 나열하고 그 외에는 알려진 파일들의 stat만 확인합니다.
+
+        Returns:
+            CatalogChanges: 추가/삭제/수정된 파일 목록
+        """
+        if not self._built:
+            self.build()
+            return CatalogChanges(added=list(self._by_path), users_changed=True)
+
+        changes = CatalogChanges()
+        current_users: Dict[str, os.DirEntry] = {}
+        root_entries: Dict[str, os.DirEntry] = {}
+        if os.path.isdir(self.data_dir):
+            try:
+                with os.scandir(self.data_dir) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir():
+                            current_users[entry.name] = entry
+                        elif entry.is_file() and entry.name.endswith('.csv'):
+                            root_entries[entry.path] = entry
+            except OSError as e:
+                logger.error(f"데이터 폴더 스캔 실패: {str(e)}")
+                return changes
+
+        # 삭제된 사용자 폴더
+        for user in [u for u in self._users if u not in current_users]:
+            changes.removed.extend(entry.path for entry in self._sessions.pop(user, []))
+            self._dir_mtimes.pop(user, None)
+            changes.users_changed = True
+
+        # 추가되었거나 내용이 바뀐 사용자 폴더
+        for user, dir_entry in current_users.items():
+            try:
+                dir_mtime = dir_entry.stat().st_mtime_ns
+            except OSError:
+                continue
+            if user not in self._sessions:
+                changes.users_changed = True
+            if user not in self._sessions or self._dir_mtimes.get(user) != dir_mtime:
+                self._dir_mtimes[user] = dir_mtime
+                self._sessions[user] = self._rescan_user_dir(dir_entry.path, user, changes)
+            else:
+                self._sessions[user] = self._restat_sessions(self._sessions[user], changes)
+
+        # 루트 레벨 CSV 파일
+        known_root = {entry.path: entry for entry in self._root_files}
+        new_root = []
+        for path, dir_entry in root_entries.items():
+            new_root.append(self._diff_entry(known_root.get(path), dir_entry, "", changes))
+        changes.removed.extend(path for path in known_root if path not in root_entries)
+        self._root_files = sorted(new_root, key=self._sort_key)
+
+        if changes:
+            self._users = sorted(current_users)
+            self._reindex()
+            self.save()
+            logger.info(f"데이터 카탈로그 갱신: 추가 {len(changes.added)}개, "
+                        f"삭제 {len(changes.removed)}개, 수정 {len(changes.modified)}개")
+        return changes
+
+    def _rescan_user_dir(self, user_path: str, user: str,
+                         changes: CatalogChanges) -> List[CatalogEntry]:
+        """mtime이 바뀐 사용자 폴더를 다시 나열하고 변경분을 기록"""
+        known = {entry.path: entry for entry in self._sessions.get(user, [])}
+        sessions = []
+        seen = set()
+        try:
+            with os.scandir(user_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.name.endswith('.csv') or not entry.is_file():
+                        continue
+                    seen.add(entry.path)
+                    sessions.append(self._diff_entry(known.get(entry.path), entry, user, changes))
+        except OSError as e:
+            logger.warning(f"사용자 폴더 스캔 실패: {user_path}, 오류: {str(e)}")
+            return list(known.values())
+        changes.removed.extend(path for path in known if path not in seen)
+        sessions.sort(key=self._sort_key)
+        return sessions
+
+    def _restat_sessions(self, sessions: List[CatalogEntry],
+                         changes: CatalogChanges) -> List[CatalogEntry]:
+        """폴더 구성이 그대로인 사용자의 파일들 stat만 확인"""
+        refreshed = []
+        for entry in sessions:
+            try:
+                stat = os.stat(entry.path)
+            except OSError:
+                changes.removed.append(entry.path)
+                continue
+            if stat.st_size != entry.size or stat.st_mtime_ns != entry.mtime_ns:
+                entry = self._updated_entry(entry, stat)
+                changes.modified.append(entry.path)
+            refreshed.append(entry)
+        return refreshed
+
+    def _diff_entry(self, known: Optional[CatalogEntry], dir_entry: os.DirEntry,
+                    user: str, changes: CatalogChanges) -> CatalogEntry:
+        """기존 항목과 비교하여 새 항목을 만들고 변경분을 기록"""
+        if known is None:
+            entry = self._make_entry(dir_entry, user, {})
+            changes.added.append(entry.path)
+            return entry
+        stat = dir_entry.stat()
+        if stat.st_size != known.size or stat.st_mtime_ns != known.mtime_ns:
+            changes.modified.append(known.path)
+            return self._updated_entry(known, stat)
+        return known
+
+    @staticmethod
+    def _updated_entry(entry: CatalogEntry, stat: os.stat_result) -> CatalogEntry:
+        """수정된 파일의 크기/mtime/행 수 갱신 (파일 ID 유지)"""
+        try:
+            row_count = count_data_rows(entry.path)
+        except OSError:
+            row_count = entry.row_count
+        return CatalogEntry(
+            file_id=entry.file_id,
+            path=entry.path,
+            user=entry.user,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            row_count=row_count,
+            time_key=entry.time_key
+        )
+
+    @staticmethod
+    def _sort_key(entry: CatalogEntry):
+        """세션 정렬 기준 (파일명 시간, 동률이면 파일명)"""
+        return entry.time_key, os.path.basename(entry.path)
+
+    def _reindex(self) -> None:
+        """경로 색인과 최대 Task 수 갱신"""
+        self._by_path = {entry.path: entry for entry in self._root_files}
+        for sessions in self._sessions.values():
+            for entry in sessions:
+                self._by_path[entry.path] = entry
+
+        if self._users:
+            self._max_tasks = max((len(s) for s in self._sessions.values()), default=0)
+        else:
+            # 루트 레벨에 CSV 파일이 있는 경우
+            self._max_tasks = len(self._root_files)
+
+    # === 조회 (모두 O(1) 또는 결과 크기에 비례) ===
+
+    def users(self) -> List[str]:
+        """정렬된 사용자 목록"""
+        return list(self._users)
+
+    def sessions(self, user: str) -> List[CatalogEntry]:
+        """사용자의 시간순 세션 목록"""
+        return self._sessions.get(user, [])
+
+    def user_file_count(self, user: str) -> int:
+        """사용자의 CSV 세션 수"""
+        return len(self._sessions.get(user, ()))
+
+    def max_task_count(self) -> int:
+        """사용자별 세션 수의 최대값 (= Task 버튼 수)"""
+        return self._max_tasks
+
+    def task_file(self, user: str, task_num: int) -> Optional[CatalogEntry]:
+        """사용자의 task 번호(1부터)에 해당하는 세션"""
+        sessions = self._sessions.get(user)
+        if sessions and 1 <= task_num <= len(sessions):
+            return sessions[task_num - 1]
+        return None
+
+    def task_files(self, task_num: int, users: List[str]) -> List[str]:
+        """여러 사용자의 task 번호에 해당하는 파일 경로 목록"""
+        file_paths = []
+        for user in users:
+            entry = self.task_file(user, task_num)
+            if entry is not None:
+                file_paths.append(entry.path)
+        return file_paths
+
+    def get_entry(self, file_path: str) -> Optional[CatalogEntry]:
+        """파일 경로로 카탈로그 항목 조회"""
+        return self._by_path.get(file_path)
+
+    def entries(self) -> List[CatalogEntry]:
+        """등록된 모든 항목"""
+        return list(self._by_path.values())
+
+    # === 레이어 이름 어휘 ===
+
+    def layer_names(self) -> List[str]:
+        """등록된 레이어 이름 목록 (코드 순서)"""
+        with self._layer_lock:
+            return list(self._layer_names)
+
+    def layer_dtype(self) -> pd.CategoricalDtype:
+        """현재 어휘 전체를 범주로 갖는 범주형 dtype"""
+        return self.register_layers(())
+
+    def register_layers(self, names: Iterable[str]) -> pd.CategoricalDtype:
+        """
+        처음 보는 레이어 이름을 어휘 끝에 추가
+
+        Args:
+            names: 레이어 이름들
+
+        Returns:
+            pd.CategoricalDtype: 추가 후 어휘 전체를 범주로 갖는 dtype
+        """
+        with self._layer_lock:
+            for name in names:
+                name = str(name)
+                if name not in self._layer_codes:
+                    self._layer_codes[name] = len(self._layer_names)
+                    self._layer_names.append(name)
+            if self._layer_dtype is None or len(self._layer_dtype.categories) != len(self._layer_names):
+                self._layer_dtype = pd.CategoricalDtype(pd.Index(self._layer_names))
+            return self._layer_dtype
+
+    def encode_layers(self, layer: pd.Series,
+                      dtype: Optional[pd.CategoricalDtype] = None) -> pd.Series:
+        """
+        Layer Name 컬럼을 공유 어휘 코드의 범주형으로 변환
+
+        같은 dtype으로 변환한 데이터프레임끼리는 pd.concat이 정수 코드 결합으로 끝나고,
+        코드 기반 마스크/그룹/색상이 세션이 달라도 같은 의미를 갖습니다.
+        파일의 범주가 어휘의 앞부분과 같으면 코드를 그대로 재사용합니다.
+
+        Args:
+            layer: Layer Name 컬럼
+            dtype: 맞출 어휘 dtype (None이면 이름을 등록한 뒤 현재 어휘 사용)
+
+        Returns:
+            pd.Series: 어휘 범주형으로 변환된 컬럼
+        """
+        if isinstance(layer.dtype, pd.CategoricalDtype):
+            if dtype is not None and layer.dtype == dtype:
+                return layer
+            codes = layer.cat.codes.to_numpy()
+            categories = layer.cat.categories.astype(str)
+        else:
+            codes, categories = pd.factorize(layer)
+            categories = categories.astype(str)
+
+        if dtype is None:
+            dtype = self.register_layers(categories)
+        vocabulary = dtype.categories
+        if not (len(categories) <= len(vocabulary) and vocabulary[:len(categories)].equals(categories)):
+            mapping = vocabulary.get_indexer(categories)
+            if (mapping < 0).any():
+                # 주어진 dtype 이후에 등록된 이름이 있으면 최신 어휘로 변환
+                dtype = self.register_layers(categories)
+                mapping = dtype.categories.get_indexer(categories)
+            # 마지막 원소는 이름이 없는 행(코드 -1)용
+            codes = np.append(mapping, -1).take(codes)
+
+        return pd.Series(pd.Categorical.from_codes(codes, dtype=dtype),
+                         index=layer.index, name=layer.name, copy=False)
+
+    # === 색인 저장/복원 ===
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """저장된 색인을 경로 → 항목 딕셔너리로 읽기"""
+        if not self.index_path or not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') != CATALOG_FORMAT_VERSION or index.get('data_dir') != self.data_dir:
+                return {}
+            self._next_file_id = max(self._next_file_id, index.get('next_file_id', 0))
+            with self._layer_lock:
+                if not self._layer_names:
+                    self._layer_names = list(index.get('layers', []))
+                    self._layer_codes = {name: code for code, name in enumerate(self._layer_names)}
+                    self._layer_dtype = None
+            return {item['path']: item for item in index.get('entries', [])}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"카탈로그 색인 읽기 실패: {str(e)}")
+            return {}
+
+    def save(self) -> None:
+        """카탈로그 색인을 파일로 저장"""
+        if not self.index_path:
+            return
+        index = {
+            'version': CATALOG_FORMAT_VERSION,
+            'data_dir': self.data_dir,
+            'next_file_id': self._next_file_id,
+            'layers': self.layer_names(),
+            'entries': [asdict(entry) for entry in self._by_path.values()]
+        }
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"카탈로그 색인 저장 실패: {str(e)}")
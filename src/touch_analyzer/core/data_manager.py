@@ -4,13 +4,25 @@ CSV 파일 로딩, 데이터 검증, 변환 등을 담당
 """
 
 import os
-import glob
+import time
+import hashlib
 from typing import List, Optional, Dict, Set, Tuple, Any
+import numpy as np
 import pandas as pd
 import logging
 import gc
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
 
 from .cache_manager import CacheManager
+from .column_cache import ColumnCache
+from .spill_cache import SpillCache
+from .data_catalog import DataCatalog, CatalogChanges, extract_time_from_filename
+from .file_watcher import CatalogWatcher
+from .tail_reader import TailReader
+from .touch_log_parser import parse_touch_log, parse_touch_log_chunked
+from .event_types import EVENT_COLUMNS, SESSION_COLUMN, EventClassifier, add_event_columns
+from .event_store import sort_by_session_time
 from .config import Config
 from ..utils.memory_utils import optimize_dataframe_memory
 
@@ -22,83 +34,249 @@ class DataManager:
     
     def __init__(self, config: Config):
         self.config = config
-        self.cache_manager = CacheManager(config.max_cache_size)
+        # 설정의 규칙 표로 컴파일한 이벤트 분류기 (지문이 바뀌면 디스크 캐시의 분류 컬럼 재계산)
+        self.event_classifier = EventClassifier(config.event_rules)
+        cache_tag = self.event_classifier.fingerprint
+        if config.cache_budget_mb > 0:
+            # 바이트 예산으로만 제한 (항목 수 제한 없음)
+            self.cache_manager = CacheManager(max_size=None,
+                                              max_bytes=int(config.cache_budget_mb * 1024 * 1024),
+                                              on_evict=self._spill_evicted)
+        else:
+            self.cache_manager = CacheManager(config.max_cache_size, on_evict=self._spill_evicted)
+        # 메모리에서 밀려난 결합 데이터의 디스크 계층
+        self.spill_cache = (SpillCache(config.cache_dir, int(config.spill_cache_mb * 1024 * 1024),
+                                       tag=cache_tag)
+                            if config.spill_cache_mb > 0 else None)
+        self._key_sources: Dict[str, Tuple[str, ...]] = {}  # 메모리 캐시 키 → 원본 파일 경로
         self.data: Dict[str, pd.DataFrame] = {}
         self._file_metadata_cache = {}  # 파일 메타데이터 캐시
+        # 파싱 결과 디스크 캐시 (재시작/TTL 만료 후에도 CSV 재파싱 생략)
+        self.column_cache = (ColumnCache(config.cache_dir, tag=cache_tag)
+                             if config.enable_column_cache else None)
+        self._catalog = DataCatalog(config.data_dir,
+                                    index_path=os.path.join(config.cache_dir, "catalog.json"))
+        self.watcher = CatalogWatcher(self._catalog)
+        self.watcher.add_listener(self._on_catalog_changes)
+        self.tail_reader = TailReader(config.required_columns,
+                                      self.event_classifier)  # 기록 중인 파일 증분 읽기
+        self._executor: Optional[Executor] = None  # 파일 로드 워커 풀 (지연 생성)
+        # UI/미리 읽기/워커 스레드가 함께 바꾸는 키 출처 표와 워커 풀 생성 보호
+        self._state_lock = threading.Lock()
+        self.last_load_failures: Dict[str, str] = {}  # 마지막 결합 로드의 파일별 실패 사유
         
-    def get_user_list(self) -> List[str]:
+    @property
+    def catalog(self) -> DataCatalog:
+        """data_log 카탈로그 (첫 조회 시 한 번 스캔하여 구성)"""
+        if not self._catalog.is_built:
+            self._catalog.build()
+        return self._catalog
+    
+    def refresh_catalog(self) -> None:
+        """data_log 폴더를 다시 스캔하여 카탈로그 갱신"""
+        self._catalog.build()
+        self.cache_manager.clear()
+    
+    def poll_changes(self, force: bool = False) -> Optional[CatalogChanges]:
         """
-        사용자 목록을 반환 (캐시 최적화)
+        data_log 변경 사항을 확인하고 영향받은 캐시만 무효화
         
+        Args:
+            force: 폴링 최소 간격을 무시할지 여부 (F5 새로고침)
+            
         Returns:
-            List[str]: 정렬된 사용자 이름 목록
+            Optional[CatalogChanges]: 변경 사항 (없으면 None)
         """
-        cache_key = "user_list"
-        cached_result = self.cache_manager.get(cache_key)
-        if cached_result is not None:
-            return cached_result
-        
-        users = []
-        data_folder = self.config.data_dir
+        self.catalog  # 최초 구성 보장
+        return self.watcher.poll(force=force)
+    
+    def _on_catalog_changes(self, changes: CatalogChanges) -> None:
+        """변경된 파일과 관련된 메모리/디스크 캐시 항목 무효화"""
+        # 테일 리더가 추적 중인 파일의 수정(추가/잘림/교체)은 follow_files가 직접 반영하므로 제외
+        changed = [path for path in changes.changed_paths
+                   if path not in changes.modified or not self.is_following(path)]
+        if changed:
+            removed = self._invalidate_paths(changed)
+            logger.info(f"변경된 파일 {len(changed)}개 관련 캐시 {removed}개 무효화")
         
-        if not os.path.exists(data_folder):
-            return users
-            
-        try:
-            for item in os.listdir(data_folder):
-                item_path = os.path.join(data_folder, item)
-                if os.path.isdir(item_path) and not item.startswith('.'):
-                    users.append(item)
-            
-            users = sorted(users)
-            self.cache_manager.put(cache_key, users)
-            return users
-        except Exception as e:
-            logger.error(f"사용자 목록 조회 실패: {str(e)}")
-            return []
+        for path in changes.removed + changes.modified:
+            if path not in changed:
+                continue
+            self.tail_reader.forget(path)
+            self._file_metadata_cache.pop(path, None)
+            if self.column_cache is not None:
+                self.column_cache.invalidate(path)
     
-    def get_max_task_count(self) -> int:
+    def _invalidate_paths(self, file_paths: List[str], combined_only: bool = False) -> int:
         """
-        사용 가능한 최대 task 수를 반환 (최적화된 버전)
+        주어진 파일에서 만들어진 캐시 항목 제거
         
+        키에는 파일 상태 지문이 들어 있어 바뀐 파일의 옛 항목은 다시 조회되지 않지만,
+        메모리/디스크를 바로 돌려받기 위해 명시적으로 제거합니다.
+        
+        Args:
+            file_paths: 변경된 파일 경로 목록
+            combined_only: 결합 결과만 제거할지 여부
+            
         Returns:
-            int: 최대 task 수
+            int: 제거된 항목 수
+        """
+        targets = set(file_paths)
+        with self._state_lock:
+            stale = {key for key, sources in self._key_sources.items()
+                     if targets.intersection(sources)
+                     and (not combined_only or key.startswith("combined:"))}
+            for key in stale:
+                self._key_sources.pop(key, None)
+        removed = self.cache_manager.invalidate(lambda key: key in stale)
+        if self.spill_cache is not None:
+            removed += self.spill_cache.invalidate_sources(targets)
+        return removed
+    
+    def is_following(self, file_path: str) -> bool:
+        """테일 리더가 파일을 추적 중인지 여부 (수정 사항을 follow_files가 반영)"""
+        return self.tail_reader.is_tracking(file_path)
+    
+    def follow_files(self, file_paths: List[str]) -> int:
         """
-        cache_key = "max_task_count"
-        cached_result = self.cache_manager.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        기록 중인 파일들에 새로 추가된 행만 읽어 반영
         
-        max_tasks = 0
-        data_folder = self.config.data_dir
+        처음 추적하는 파일은 기존 캐시 경로로 한 번 전체 로드한 뒤,
+        이후에는 바이트 오프셋 이후의 추가분만 파싱합니다. 누적 데이터프레임은
+        load_files가 필요로 할 때 테일 리더에서 합치고, 디스크 컬럼 캐시는
+        추가가 멈춘 틱(또는 추적 중단 시)에 한 번만 기록합니다.
         
-        if not os.path.exists(data_folder):
-            return 0
+        Args:
+            file_paths: 추적할 파일 경로 목록
             
+        Returns:
+            int: 이번 호출에서 추가된 전체 행 수
+        """
+        total_added = 0
+        for file_path in file_paths:
+            if not self.tail_reader.is_tracking(file_path):
+                df = self.load_file(file_path)
+                if df is not None:
+                    self.tail_reader.seed(file_path, df)
+            
+            try:
+                added = self.tail_reader.read(file_path)
+            except Exception as e:
+                logger.warning(f"테일 읽기 실패: {file_path}, 오류: {str(e)}")
+                continue
+            if not added:
+                self._save_followed(file_path)
+                continue
+            
+            # 이전 상태의 결합 결과만 비움 (파일 단위 프레임은 테일 리더가 제공)
+            total_added += added
+            self._invalidate_paths([file_path], combined_only=True)
+        
+        return total_added
+    
+    def _save_followed(self, file_path: str) -> None:
+        """추가가 멈춘 추적 파일의 누적 데이터프레임을 컬럼 캐시에 기록 (기록할 추가분이 있을 때만)"""
+        if self.column_cache is None or not self.tail_reader.has_unsaved(file_path):
+            return
         try:
-            user_folders = []
-            for item in os.listdir(data_folder):
-                item_path = os.path.join(data_folder, item)
-                if os.path.isdir(item_path) and not item.startswith('.'):
-                    user_folders.append(item)
+            file_stat = os.stat(file_path)
+        except OSError:
+            return
+        if not self.tail_reader.is_current(file_path, file_stat):
+            return  # 마지막 읽기 이후 또 추가됨 - 다음 틱에서 반영
+        frame = self._encode_layers(self.tail_reader.frame(file_path))
+        if self.column_cache.store(file_path, file_stat, frame):
+            self.tail_reader.mark_saved(file_path)
+    
+    def stop_following(self) -> None:
+        """모든 파일의 테일 추적 중단 (기록하지 않은 추가분은 컬럼 캐시에 기록)"""
+        for file_path in self.tail_reader.tracked_paths():
+            self._save_followed(file_path)
+        self.tail_reader.clear()
+    
+    def _file_fingerprint(self, file_path: str, file_stat: os.stat_result) -> str:
+        """
+        파일 상태 지문 (카탈로그 파일 ID + 수정 시각 + 크기)
+        
+        카탈로그에 아직 없는 파일은 경로 해시를 ID 대신 사용합니다.
+        """
+        entry = self.catalog.get_entry(file_path)
+        if entry is not None:
+            ident = str(entry.file_id)
+        else:
+            ident = "p" + hashlib.sha1(file_path.encode('utf-8')).hexdigest()[:12]
+        return f"{ident}:{file_stat.st_mtime_ns}:{file_stat.st_size}"
+    
+    def _file_cache_key(self, file_path: str, file_stat: os.stat_result) -> str:
+        """파일 단위 메모리 캐시 키 (경로 길이와 무관한 고정 크기)"""
+        return f"file:{self._file_fingerprint(file_path, file_stat)}"
+    
+    def _selection_key(self, file_paths: List[str]) -> str:
+        """
+        여러 파일 선택의 결합 캐시 키 (파일 지문들을 고정 크기 다이제스트로 축약)
+        
+        파일 중 하나라도 수정되면 키가 바뀌므로 오래된 결합 결과가 조회되지 않습니다.
+        
+        Args:
+            file_paths: 파일 경로 목록
             
-            if not user_folders:
-                # 루트 레벨에 CSV 파일이 있는 경우
-                csv_files = glob.glob(os.path.join(data_folder, "*.csv"))
-                max_tasks = len(csv_files)
-            else:
-                # 사용자별 폴더에서 최대 task 수 계산
-                for user_folder in user_folders:
-                    user_path = os.path.join(data_folder, user_folder)
-                    csv_files = glob.glob(os.path.join(user_path, "*.csv"))
-                    sorted_files = self._sort_files_by_time(csv_files)
-                    max_tasks = max(max_tasks, len(sorted_files))
+        Returns:
+            str: "combined:<32자리 16진수>" 형식의 키
+        """
+        tokens = []
+        for file_path in file_paths:
+            try:
+                tokens.append(self._file_fingerprint(file_path, os.stat(file_path)))
+            except OSError:
+                tokens.append("missing:" + hashlib.sha1(file_path.encode('utf-8')).hexdigest()[:12])
+        digest = hashlib.blake2b("|".join(sorted(tokens)).encode('ascii'), digest_size=16)
+        return f"combined:{digest.hexdigest()}"
+    
+    def get_selection_key(self, file_paths: List[str]) -> str:
+        """
+        파일 선택의 지문 (결합 캐시 키와 동일, 파생 결과 캐시 키의 접두어로 사용)
+        
+        Args:
+            file_paths: 파일 경로 목록
             
-            self.cache_manager.put(cache_key, max_tasks)
-            return max_tasks
-        except Exception as e:
-            logger.error(f"최대 task 수 조회 실패: {str(e)}")
-            return 0
+        Returns:
+            str: 선택 지문
+        """
+        return self._selection_key(file_paths)
+    
+    def _cache_put(self, key: str, value: Any, source_paths: Tuple[str, ...],
+                   cost: float = 1.0) -> None:
+        """원본 파일 목록을 기록하면서 메모리 캐시에 저장"""
+        self._set_sources(key, source_paths)
+        self.cache_manager.put(key, value, cost=cost)
+    
+    def _set_sources(self, key: str, source_paths: Tuple[str, ...]) -> None:
+        """캐시 키의 원본 파일 목록 기록 (무효화/스필용)"""
+        with self._state_lock:
+            self._key_sources[key] = source_paths
+    
+    def _pop_sources(self, key: str) -> Optional[Tuple[str, ...]]:
+        """캐시 키의 원본 파일 목록을 꺼내고 제거"""
+        with self._state_lock:
+            return self._key_sources.pop(key, None)
+    
+    def get_user_list(self) -> List[str]:
+        """
+        사용자 목록을 반환 (카탈로그 조회)
+        
+        Returns:
+            List[str]: 정렬된 사용자 이름 목록
+        """
+        return self.catalog.users()
+    
+    def get_max_task_count(self) -> int:
+        """
+        사용 가능한 최대 task 수를 반환 (카탈로그 조회)
+        
+        Returns:
+            int: 최대 task 수
+        """
+        return self.catalog.max_task_count()
     
     def _extract_time_from_filename(self, filename: str) -> str:
         """
@@ -110,15 +288,7 @@ class DataManager:
         Returns:
             str: 시간 정보 (6자리 숫자)
         """
-        basename = os.path.basename(filename)
-        # 파일명에서 마지막 6자리 숫자 추출
-        # 예: ks_drag_0803-121820.csv -> 121820
-        parts = basename.split('-')
-        if len(parts) > 1:
-            time_part = parts[-1].split('.')[0]  # .csv 제거
-            if len(time_part) == 6 and time_part.isdigit():
-                return time_part
-        return "000000"  # 기본값
+        return extract_time_from_filename(filename)
     
     def _sort_files_by_time(self, file_list: List[str]) -> List[str]:
         """
@@ -134,7 +304,7 @@ class DataManager:
     
     def get_task_files_for_users(self, task_num: int, users: List[str]) -> List[str]:
         """
-        특정 사용자들의 task 번호에 해당하는 파일들을 반환 (최적화된 버전)
+        특정 사용자들의 task 번호에 해당하는 파일들을 반환 (카탈로그 조회)
         
         Args:
             task_num: task 번호
@@ -143,30 +313,7 @@ class DataManager:
         Returns:
             List[str]: 파일 경로 목록
         """
-        cache_key = f"task_files_{task_num}_{'_'.join(sorted(users))}"
-        cached_result = self.cache_manager.get(cache_key)
-        if cached_result is not None:
-            return cached_result
-        
-        file_paths = []
-        data_folder = self.config.data_dir
-        
-        try:
-            for user in users:
-                user_folder = os.path.join(data_folder, user)
-                if os.path.exists(user_folder):
-                    csv_files = glob.glob(os.path.join(user_folder, "*.csv"))
-                    sorted_files = self._sort_files_by_time(csv_files)
-                    
-                    # task_num에 해당하는 파일 선택 (1-based indexing)
-                    if 1 <= task_num <= len(sorted_files):
-                        file_paths.append(sorted_files[task_num - 1])
-            
-            self.cache_manager.put(cache_key, file_paths)
-            return file_paths
-        except Exception as e:
-            logger.error(f"task 파일 조회 실패: {str(e)}")
-            return []
+        return self.catalog.task_files(task_num, sorted(users))
     
     def load_file(self, file_path: str) -> Optional[pd.DataFrame]:
         """
@@ -178,50 +325,155 @@ class DataManager:
         Returns:
             Optional[pd.DataFrame]: 로드된 데이터프레임 또는 None
         """
-        if not os.path.exists(file_path):
-            logger.warning(f"파일이 존재하지 않습니다: {file_path}")
-            return None
+        frames, failures = self.load_files([file_path])
+        if file_path in failures:
+            logger.error(f"파일 로드 실패: {file_path}, 오류: {failures[file_path]}")
+        return frames[0]
+    
+    def load_files(self, file_paths: List[str]) -> Tuple[List[Optional[pd.DataFrame]], Dict[str, str]]:
+        """
+        여러 파일을 동시에 로드 (캐시 미스만 워커 풀에서 읽기/검증)
         
-        try:
-            # 파일 메타데이터 캐시 확인
-            file_stat = os.stat(file_path)
-            cache_key = f"file_{file_path}_{file_stat.st_mtime}"
-            
-            cached_df = self.cache_manager.get(cache_key)
-            if cached_df is not None:
-                logger.debug(f"캐시에서 파일 로드: {file_path}")
-                return cached_df.copy()
-            
-            # 파일 로드
-            logger.debug(f"파일 로드 시작: {file_path}")
-            df = pd.read_csv(file_path)
-            
-            # 데이터 검증
-            required_columns = self.config.required_columns
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                logger.warning(f"필수 컬럼이 누락되었습니다: {missing_columns}")
-                return None
-            
-            # 데이터 최적화
-            df = self._optimize_dataframe(df)
-            
-            # 캐시에 저장
-            self.cache_manager.put(cache_key, df.copy())
+        캐시 접근은 호출 스레드에서만 이루어지고, 워커는 디스크 I/O와
+        파싱만 담당합니다. 결과 순서는 입력 순서와 동일합니다.
+        
+        Args:
+            file_paths: 파일 경로 목록
             
+        Returns:
+            Tuple[List[Optional[pd.DataFrame]], Dict[str, str]]:
+                입력 순서대로의 데이터프레임 목록 (실패 시 None), 파일별 실패 사유
+        """
+        frames: List[Optional[pd.DataFrame]] = [None] * len(file_paths)
+        failures: Dict[str, str] = {}
+        pending: List[Tuple[int, str, str, Optional[int]]] = []
+        waiting: List[Tuple[int, str, Future]] = []
+        
+        try:
+            # 1단계: 메모리 캐시 확인
+            for i, file_path in enumerate(file_paths):
+                try:
+                    file_stat = os.stat(file_path)
+                except OSError:
+                    failures[file_path] = "파일이 존재하지 않습니다"
+                    continue
+                
+                # 실시간 추적 중인 파일은 테일 리더의 누적 프레임 사용 (재파싱 없음)
+                followed = self.tail_reader.frame(file_path)
+                if followed is not None:
+                    frames[i] = self._encode_layers(followed)
+                    continue
+                
+                cache_key = self._file_cache_key(file_path, file_stat)
+                cached_df = self.cache_manager.get(cache_key)
+                if cached_df is not None:
+                    logger.debug(f"캐시에서 파일 로드: {file_path}")
+                    frames[i] = cached_df
+                    continue
+                
+                # 같은 파일을 다른 스레드가 읽는 중이면 그 결과를 기다림 (중복 파싱 방지)
+                chunk_size = self._chunk_size_for(file_stat)
+                flight, owner = self.cache_manager.begin_compute(cache_key)
+                if owner:
+                    pending.append((i, file_path, cache_key, chunk_size))
+                else:
+                    waiting.append((i, file_path, flight))
+            
+            if pending:
+                self._read_pending(pending, frames, failures)
+        except BaseException as e:
+            # 계산 담당으로 선언하고 아직 끝내지 못한 키는 실패로 완료해 대기자가 막히지 않게 함
+            for _, _, cache_key, _ in pending:
+                self.cache_manager.fail_compute(cache_key, e)
+            raise
+        
+        # 3단계: 다른 호출자가 읽고 있던 파일 (자기 몫을 끝낸 뒤 기다려 교착 방지)
+        for index, file_path, flight in waiting:
+            try:
+                df = flight.result()
+            except Exception as e:
+                failures[file_path] = str(e)
+                continue
+            frames[index] = df.copy(deep=False)
+        
+        return frames, failures
+    
+    def _read_pending(self, pending: List[Tuple[int, str, str, Optional[int]]],
+                      frames: List[Optional[pd.DataFrame]], failures: Dict[str, str]) -> None:
+        """
+        계산 담당으로 선언한 캐시 미스 파일들을 읽어 캐시에 저장
+        
+        결과(성공/실패)를 전달한 항목은 pending에서 제거하므로, 도중에 예외가 나면
+        호출자가 남은 항목의 계산을 실패로 완료할 수 있습니다.
+        
+        Args:
+            pending: (결과 위치, 파일 경로, 캐시 키, 청크 크기) 목록
+            frames: 결과를 채울 데이터프레임 목록
+            failures: 실패 사유를 기록할 딕셔너리
+        """
+        
+        # 2단계: 캐시 미스 파일들을 워커 풀에서 읽기
+        required_columns = list(self.config.required_columns)
+        
+        def _collect(entry: Tuple[int, str, str, Optional[int]], read) -> None:
+            index, file_path, cache_key, _ = entry
+            try:
+                df, elapsed = read()
+                df = self._encode_layers(df)
+                self._set_sources(cache_key, (file_path,))
+            except Exception as e:
+                failures[file_path] = str(e)
+                pending.remove(entry)
+                self.cache_manager.fail_compute(cache_key, e)
+                return
+            # 재로드 비용(초)을 함께 넘겨 비싼 파일일수록 캐시에 오래 남도록 함
+            pending.remove(entry)
+            self.cache_manager.finish_compute(cache_key, df, cost=elapsed)
+            frames[index] = df
             logger.debug(f"파일 로드 완료: {file_path} ({len(df)} 행)")
-            return df
-            
-        except Exception as e:
-            logger.error(f"파일 로드 실패: {file_path}, 오류: {str(e)}")
+        
+        if len(pending) == 1 or self.config.max_concurrent_loads <= 1:
+            for entry in list(pending):
+                _collect(entry, lambda p=entry[1], c=entry[3]: timed_read_touch_log(
+                    p, required_columns, self.column_cache, c, self.event_classifier))
+        else:
+            executor = self._get_executor()
+            futures = [
+                (entry, executor.submit(timed_read_touch_log, entry[1], required_columns,
+                                        self.column_cache, entry[3], self.event_classifier))
+                for entry in pending
+            ]
+            for entry, future in futures:
+                _collect(entry, future.result)
+    
+    def _chunk_size_for(self, file_stat: os.stat_result) -> Optional[int]:
+        """임계 크기를 넘는 파일은 청크 단위로 파싱 (None이면 한 번에 파싱)"""
+        threshold_mb = self.config.chunked_load_threshold_mb
+        if threshold_mb <= 0 or file_stat.st_size < threshold_mb * 1024 * 1024:
             return None
+        return max(1, self.config.chunk_size)
+    
+    def _get_executor(self) -> Executor:
+        """파일 로드용 워커 풀 반환 (지연 생성 후 재사용, 동시 호출에도 하나만 생성)"""
+        with self._state_lock:
+            if self._executor is None:
+                workers = max(1, self.config.max_concurrent_loads)
+                if self.config.use_process_pool:
+                    self._executor = ProcessPoolExecutor(max_workers=workers)
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=workers,
+                                                        thread_name_prefix="touch-loader")
+            return self._executor
     
-    def load_and_combine_data(self, file_paths: List[str]) -> Optional[pd.DataFrame]:
+    def load_and_combine_data(self, file_paths: List[str],
+                              report_failures: bool = True) -> Optional[pd.DataFrame]:
         """
         여러 파일을 로드하고 합치는 공통 로직 (메모리 최적화)
         
         Args:
             file_paths: 파일 경로 목록
+            report_failures: 파일별 실패 사유를 last_load_failures에 기록할지 여부
+                (미리 읽기는 사용자 선택의 실패 사유를 덮어쓰지 않도록 False)
             
         Returns:
             Optional[pd.DataFrame]: 합쳐진 데이터프레임 또는 None
@@ -230,34 +482,14 @@ class DataManager:
             return None
         
         try:
-            # 캐시 키 생성
-            cache_key = f"combined_{'_'.join(sorted(file_paths))}"
-            cached_result = self.cache_manager.get(cache_key)
-            if cached_result is not None:
-                logger.debug("캐시에서 결합 데이터 로드")
-                return cached_result.copy()
-            
-            # 파일들 로드
-            dataframes = []
-            for file_path in file_paths:
-                df = self.load_file(file_path)
-                if df is not None:
-                    dataframes.append(df)
-            
-            if not dataframes:
-                logger.warning("로드할 수 있는 파일이 없습니다.")
-                return None
-            
-            # 데이터프레임 결합
-            combined_df = pd.concat(dataframes, ignore_index=True)
-            
-            # 결합된 데이터 최적화
-            combined_df = self._optimize_dataframe(combined_df)
-            
-            # 캐시에 저장
-            self.cache_manager.put(cache_key, combined_df.copy())
-            
-            logger.info(f"데이터 결합 완료: {len(combined_df)} 행")
+            # 캐시 키 생성 후 조회 (같은 선택을 동시에 요청하면 한 번만 결합)
+            cache_key = self._selection_key(file_paths)
+            self._set_sources(cache_key, tuple(file_paths))
+            combined_df = self.cache_manager.get_or_compute(
+                cache_key, lambda: self._build_combined(cache_key, file_paths, report_failures)
+            )
+            if combined_df is None:
+                self._pop_sources(cache_key)
             return combined_df
             
         except Exception as e:
@@ -267,69 +499,196 @@ class DataManager:
             # 메모리 정리
             gc.collect()
     
-    def _optimize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _build_combined(self, cache_key: str, file_paths: List[str],
+                        report_failures: bool = True) -> Optional[pd.DataFrame]:
         """
-        데이터프레임 메모리 최적화 (향상된 버전)
+        결합 데이터프레임 생성 (디스크 계층 확인 후 파일 로드 및 결합)
         
         Args:
-            df: 원본 데이터프레임
+            cache_key: 결합 캐시 키
+            file_paths: 파일 경로 목록
+            report_failures: 파일별 실패 사유를 last_load_failures에 기록할지 여부
             
         Returns:
-            pd.DataFrame: 최적화된 데이터프레임
+            Optional[pd.DataFrame]: 합쳐진 데이터프레임 또는 None
         """
-        try:
-            # 필요한 컬럼만 선택
-            required_columns = self.config.required_columns
-            available_columns = [col for col in required_columns if col in df.columns]
-            df = df[available_columns].copy()
-            
-            # 데이터 타입 최적화
-            if 'Time(ms)' in df.columns:
-                df['Time(ms)'] = pd.to_numeric(df['Time(ms)'], errors='coerce', downcast='integer')
-            
-            if 'TouchX' in df.columns:
-                df['TouchX'] = pd.to_numeric(df['TouchX'], errors='coerce', downcast='float')
-            
-            if 'TouchY' in df.columns:
-                df['TouchY'] = pd.to_numeric(df['TouchY'], errors='coerce', downcast='float')
+        # 디스크 계층 확인 (mmap 복원 후 메모리 계층으로 승격)
+        if self.spill_cache is not None:
+            spilled = self.spill_cache.load(cache_key)
+            # 세션 컬럼이 없는 이전 형식은 다시 결합
+            if spilled is not None and SESSION_COLUMN in spilled.columns:
+                logger.debug("디스크 스필 캐시에서 결합 데이터 로드")
+                return self._encode_layers(sort_by_session_time(spilled))
+        
+        # 파일들 동시 로드 (입력 순서 유지)
+        frames, failures = self.load_files(file_paths)
+        if report_failures:
+            self.last_load_failures = failures
+        for file_path, reason in failures.items():
+            logger.warning(f"파일 로드 실패: {file_path}, 오류: {reason}")
+        
+        if all(df is None for df in frames):
+            logger.warning("로드할 수 있는 파일이 없습니다.")
+            return None
+        
+        # 모든 파일을 같은 어휘 dtype으로 맞춰 범주형 그대로(정수 코드) 결합하고,
+        # 파일마다 선택 내 위치를 세션 번호로 붙여 파일 간 이벤트가 섞이지 않게 함
+        layer_dtype = self.catalog.layer_dtype()
+        session_dtype = np.int16 if len(file_paths) <= np.iinfo(np.int16).max else np.int32
+        dataframes = [
+            self._encode_layers(df, layer_dtype).assign(
+                **{SESSION_COLUMN: np.full(len(df), session, dtype=session_dtype)}
+            )
+            for session, df in enumerate(frames) if df is not None
+        ]
+        combined_df = pd.concat(dataframes, ignore_index=True)
+        
+        # 결합된 데이터 최적화 후 (세션, 시각) 순으로 정렬 (시간 구간을 이진 탐색으로 자르기 위함)
+        combined_df = sort_by_session_time(self._optimize_dataframe(combined_df))
+        
+        logger.info(f"데이터 결합 완료: {len(combined_df)} 행")
+        return combined_df
+    
+    def is_selection_cached(self, file_paths: List[str]) -> bool:
+        """
+        파일 선택의 결합 결과가 메모리 캐시에 있는지 확인 (히트 통계에 반영하지 않음)
+        
+        Args:
+            file_paths: 파일 경로 목록
             
-            # Layer Name 컬럼 최적화
-            if 'Layer Name' in df.columns:
-                df['Layer Name'] = df['Layer Name'].astype('category')
+        Returns:
+            bool: 캐시 여부
+        """
+        return self.cache_manager.contains(self._selection_key(file_paths))
+    
+    def persist_selection(self, file_paths: List[str]) -> bool:
+        """
+        메모리에 있는 결합 결과를 디스크 계층에 저장 (종료 후 재시작 시 mmap으로 즉시 복원)
+        
+        Args:
+            file_paths: 파일 경로 목록
             
-            # NaN 값 제거
-            numeric_columns = ['Time(ms)', 'TouchX', 'TouchY']
-            available_numeric = [col for col in numeric_columns if col in df.columns]
-            if available_numeric:
-                df = df.dropna(subset=available_numeric)
+        Returns:
+            bool: 저장 여부
+        """
+        if self.spill_cache is None:
+            return False
+        cache_key = self._selection_key(file_paths)
+        entries = self.cache_manager.export_entries(lambda key: key == cache_key)
+        if not entries:
+            return False
+        return self.spill_cache.store(cache_key, entries[0][1], file_paths)
+    
+    def get_uncached_files(self, file_paths: List[str]) -> List[Tuple[str, int]]:
+        """
+        메모리 캐시에 없는 파일들과 디스크상 크기 반환 (미리 읽기 용량 추정용)
+        
+        Args:
+            file_paths: 파일 경로 목록
             
-            # 추가 메모리 최적화
-            df = optimize_dataframe_memory(df)
+        Returns:
+            List[Tuple[str, int]]: (파일 경로, 바이트 크기) 목록 (없는 파일 제외)
+        """
+        uncached = []
+        for file_path in file_paths:
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                continue
+            if not self.cache_manager.contains(self._file_cache_key(file_path, file_stat)):
+                uncached.append((file_path, file_stat.st_size))
+        return uncached
+    
+    def _spill_evicted(self, key: str, value: Any) -> None:
+        """메모리 캐시에서 밀려난 결합 데이터프레임을 디스크 계층으로 이동"""
+        source_paths = self._pop_sources(key)
+        if (self.spill_cache is None or source_paths is None
+                or not key.startswith("combined:") or not isinstance(value, pd.DataFrame)):
+            return
+        self.spill_cache.store(key, value, source_paths)
+    
+    def _encode_layers(self, df: pd.DataFrame,
+                       dtype: Optional[pd.CategoricalDtype] = None) -> pd.DataFrame:
+        """
+        Layer Name을 카탈로그의 공유 어휘 범주형으로 변환 (원본 데이터프레임은 변경하지 않음)
+        
+        Args:
+            df: 데이터프레임
+            dtype: 맞출 어휘 dtype (None이면 현재 어휘)
             
+        Returns:
+            pd.DataFrame: 변환된 데이터프레임 (이미 같은 dtype이면 그대로)
+        """
+        if 'Layer Name' not in df.columns:
             return df
-            
-        except Exception as e:
-            logger.warning(f"데이터프레임 최적화 실패: {str(e)}")
+        original = df['Layer Name']
+        layer = self.catalog.encode_layers(original, dtype)
+        if layer is original:
             return df
+        df = df.copy(deep=False)
+        df['Layer Name'] = layer
+        return df
+    
+    def _optimize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        데이터프레임 메모리 최적화 (향상된 버전)
+        
+        Args:
+            df: 원본 데이터프레임
+            
+        Returns:
+            pd.DataFrame: 최적화된 데이터프레임
+        """
+        return optimize_touch_dataframe(df, self.config.required_columns, self.event_classifier)
     
-    def clear_cache(self) -> None:
-        """캐시 클리어"""
+    def clear_cache(self, include_disk: bool = False) -> None:
+        """
+        캐시 클리어
+        
+        Args:
+            include_disk: 디스크 컬럼 캐시까지 삭제할지 여부
+        """
         self.cache_manager.clear()
+        with self._state_lock:
+            self._key_sources.clear()
+        if include_disk and self.column_cache is not None:
+            self.column_cache.clear()
+        if include_disk and self.spill_cache is not None:
+            self.spill_cache.clear()
         self._file_metadata_cache.clear()
         gc.collect()
         logger.info("데이터 매니저 캐시 클리어 완료")
     
+    def release_memory(self, target_bytes: int) -> int:
+        """
+        메모리 압박 시 캐시 해제 (파일 단위 항목 먼저, 부족하면 결합 결과까지)
+        
+        파일 단위 항목은 컬럼 캐시에서 바로 복원되고, 결합 결과는 디스크 계층으로 스필됩니다.
+        
+        Args:
+            target_bytes: 비울 목표 바이트 수
+            
+        Returns:
+            int: 비운 바이트 수
+        """
+        freed = self.cache_manager.release(target_bytes, lambda key: key.startswith("file:"))
+        if freed < target_bytes:
+            freed += self.cache_manager.release(target_bytes - freed)
+        return freed
+    
     def get_cache_info(self) -> Dict[str, int]:
         """캐시 정보 반환"""
         return {
             'size': self.cache_manager.size(),
             'max_size': self.cache_manager.max_size,
+            'bytes': self.cache_manager.get_memory_usage_estimate(),
+            'max_bytes': self.cache_manager.max_bytes,
             'metadata_cache_size': len(self._file_metadata_cache)
         }
     
     def get_user_file_count(self, user: str) -> int:
         """
-        특정 사용자의 CSV 파일 개수 반환 (캐시 최적화)
+        특정 사용자의 CSV 파일 개수 반환 (카탈로그 조회)
         
         Args:
             user: 사용자 이름
@@ -337,21 +696,7 @@ class DataManager:
         Returns:
             int: CSV 파일 개수
         """
-        cache_key = f"user_file_count_{user}"
-        cached_result = self.cache_manager.get(cache_key)
-        if cached_result is not None:
-            return cached_result
-        
-        try:
-            user_folder = os.path.join(self.config.data_dir, user)
-            if os.path.exists(user_folder):
-                file_count = len([f for f in os.listdir(user_folder) if f.endswith('.csv')])
-                self.cache_manager.put(cache_key, file_count)
-                return file_count
-            return 0
-        except Exception as e:
-            logger.error(f"사용자 파일 개수 조회 실패: {str(e)}")
-            return 0
+        return self.catalog.user_file_count(user)
     
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """
@@ -395,7 +740,130 @@ class DataManager:
     
     def cleanup_resources(self) -> None:
         """리소스 정리"""
+        with self._state_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.stop_following()
         self.clear_cache()
         self.data.clear()
+        if self._catalog.is_built:
+            self._catalog.save()  # 이번 실행에서 늘어난 레이어 어휘 보존
         gc.collect()
         logger.info("데이터 매니저 리소스 정리 완료")
+
+
+def read_touch_log(file_path: str, required_columns: List[str],
+                   column_cache: Optional[ColumnCache] = None,
+                   chunk_size: Optional[int] = None,
+                   classifier: Optional[EventClassifier] = None) -> pd.DataFrame:
+    """
+    터치 로그 파일 하나를 읽고 검증/최적화 (워커 풀에서 실행 가능)
+    
+    DataManager 상태에 접근하지 않으므로 스레드/프로세스 풀 어디서든
+    안전하게 호출할 수 있습니다.
+    
+    Args:
+        file_path: 파일 경로
+        required_columns: 필수 컬럼 목록
+        column_cache: 디스크 컬럼 캐시 (None이면 사용 안 함)
+        chunk_size: 청크 단위로 파싱할 행 수 (None이면 한 번에 파싱)
+        classifier: 이벤트 분류기 (None이면 기본 규칙)
+        
+    Returns:
+        pd.DataFrame: 최적화된 데이터프레임
+        
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+        ValueError: 필수 컬럼이 누락된 경우
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"파일이 존재하지 않습니다: {file_path}")
+    
+    file_stat = os.stat(file_path)
+    
+    # 디스크 컬럼 캐시 확인 (CSV 파싱 및 타입 최적화 생략)
+    if column_cache is not None:
+        df = column_cache.load(file_path, file_stat)
+        if df is not None:
+            return df
+    
+    logger.debug(f"파일 로드 시작: {file_path}")
+    # 필요한 컬럼만 압축 dtype으로 파싱 (누락 컬럼은 ValueError)
+    if chunk_size:
+        logger.info(f"대용량 파일 청크 로드: {file_path} ({file_stat.st_size / 1024 / 1024:.1f} MB)")
+        df = parse_touch_log_chunked(file_path, list(required_columns), chunk_size)
+    else:
+        df = parse_touch_log(file_path, list(required_columns))
+    # 레이어 범주를 한 번 분류해 int8 이벤트 컬럼으로 저장 (캐시에도 함께 저장)
+    df = add_event_columns(df, classifier)
+    
+    if column_cache is not None:
+        column_cache.store(file_path, file_stat, df)
+    return df
+
+
+def timed_read_touch_log(file_path: str, required_columns: List[str],
+                         column_cache: Optional[ColumnCache] = None,
+                         chunk_size: Optional[int] = None,
+                         classifier: Optional[EventClassifier] = None) -> Tuple[pd.DataFrame, float]:
+    """
+    read_touch_log 실행 시간을 함께 반환 (캐시 비용 산정용, 워커 풀에서 실행 가능)
+    
+    Returns:
+        Tuple[pd.DataFrame, float]: 최적화된 데이터프레임, 소요 시간 (초)
+    """
+    start = time.perf_counter()
+    df = read_touch_log(file_path, required_columns, column_cache, chunk_size, classifier)
+    return df, time.perf_counter() - start
+
+
+def optimize_touch_dataframe(df: pd.DataFrame, required_columns: List[str],
+                             classifier: Optional[EventClassifier] = None) -> pd.DataFrame:
+    """
+    터치 데이터프레임 메모리 최적화
+    
+    Args:
+        df: 원본 데이터프레임
+        required_columns: 유지할 컬럼 목록
+        classifier: 분류 컬럼이 없을 때 사용할 이벤트 분류기 (None이면 기본 규칙)
+        
+    Returns:
+        pd.DataFrame: 최적화된 데이터프레임
+    """
+    try:
+        # 필요한 컬럼과 이벤트 분류/세션 컬럼만 선택
+        available_columns = [col for col in list(required_columns) + EVENT_COLUMNS + [SESSION_COLUMN]
+                             if col in df.columns]
+        df = df[available_columns]
+        
+        # 데이터 타입 최적화 (전용 파서가 이미 정수로 읽은 컬럼은 유지)
+        if 'Time(ms)' in df.columns and not pd.api.types.is_integer_dtype(df['Time(ms)']):
+            df['Time(ms)'] = pd.to_numeric(df['Time(ms)'], errors='coerce', downcast='integer')
+        
+        if 'TouchX' in df.columns and not pd.api.types.is_integer_dtype(df['TouchX']):
+            df['TouchX'] = pd.to_numeric(df['TouchX'], errors='coerce', downcast='float')
+        
+        if 'TouchY' in df.columns and not pd.api.types.is_integer_dtype(df['TouchY']):
+            df['TouchY'] = pd.to_numeric(df['TouchY'], errors='coerce', downcast='float')
+        
+        # Layer Name 컬럼 최적화
+        if 'Layer Name' in df.columns:
+            df['Layer Name'] = df['Layer Name'].astype('category')
+            if not all(col in df.columns for col in EVENT_COLUMNS):
+                df = add_event_columns(df, classifier)
+        
+        # NaN 값 제거
+        numeric_columns = ['Time(ms)', 'TouchX', 'TouchY']
+        available_numeric = [col for col in numeric_columns if col in df.columns]
+        if available_numeric:
+            df = df.dropna(subset=available_numeric)
+        
+        # 추가 메모리 최적화
+        df = optimize_dataframe_memory(df)
+        
+        return df
+        
+    except Exception as e:
+        logger.warning(f"데이터프레임 최적화 실패: {str(e)}")
+        return df
@@ -0,0 +1,156 @@
+"""
+시간 정렬 이벤트 저장소 모듈
+결합 데이터를 (세션, 시각) 순으로 정렬해 두고, 세션별 오프셋과 이진 탐색으로
+시간 구간을 세션마다 연속된 행 구간으로 잘라냄
+"""
+
+import logging
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .flick_units import session_codes, session_time_order
+
+logger = logging.getLogger(__name__)
+
+
+def sort_by_session_time(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    데이터프레임을 (세션, 시각) 순으로 정렬하고 인덱스를 0부터 다시 매김
+
+    같은 세션·시각의 행은 원래 순서를 유지합니다.
+    이미 정렬된 경우(파일이 시각 순으로 기록된 일반적인 경우)에는 복사하지 않습니다.
+
+    Args:
+        df: Time(ms) 컬럼이 있는 데이터프레임
+
+    Returns:
+        pd.DataFrame: 정렬된 데이터프레임
+    """
+    if not is_session_time_sorted(df):
+        df = df.take(session_time_order(df))
+        logger.debug(f"결합 데이터를 (세션, 시각) 순으로 정렬: {len(df)} 행")
+    if not df.index.equals(pd.RangeIndex(len(df))):
+        df = df.reset_index(drop=True)
+    return df
+
+
+def is_session_time_sorted(df: pd.DataFrame) -> bool:
+    """데이터프레임이 (세션, 시각) 순으로 정렬되어 있는지 확인 (O(N))"""
+    if len(df) < 2:
+        return True
+    sessions = session_codes(df)
+    times = df['Time(ms)'].to_numpy()
+    session_step = np.diff(sessions)
+    return bool(np.all(session_step >= 0) and np.all((session_step > 0) | (np.diff(times) >= 0)))
+
+
+class SessionTimeIndex:
+    """(세션, 시각) 순으로 정렬된 데이터프레임의 세션별 오프셋과 시각 배열"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        세션별 시간 색인 생성
+
+        Args:
+            df: sort_by_session_time으로 정렬된 데이터프레임
+
+        Raises:
+            ValueError: (세션, 시각) 순으로 정렬되지 않은 경우
+        """
+        if not is_session_time_sorted(df):
+            raise ValueError("시간 색인에는 (세션, 시각) 순으로 정렬된 데이터가 필요합니다")
+        times = df['Time(ms)'].to_numpy()
+        sessions = session_codes(df)
+        # offsets[k]:offsets[k + 1]이 k번째 세션의 행 구간
+        self.offsets = np.concatenate(
+            ([0], np.flatnonzero(np.diff(sessions)) + 1, [len(df)])
+        ).astype(np.intp)
+
+        # 세션 순서를 시각보다 앞세운 단조 증가 키 (세션마다 시각 범위를 겹치지 않게 이어 붙임)
+        self._min_time = times.min() if len(times) else 0
+        self._max_time = times.max() if len(times) else -1
+        self._stride = float(self._max_time - self._min_time) + 1.0
+        self._session_base = np.arange(len(self.offsets) - 1, dtype=np.float64) * self._stride
+        rank = np.repeat(np.arange(len(self.offsets) - 1, dtype=np.float64), np.diff(self.offsets))
+        self._keys = rank * self._stride + (times - self._min_time)
+
+    @property
+    def nbytes(self) -> int:
+        """오프셋과 키 배열의 메모리 크기 (바이트, 캐시 예산 계산용)"""
+        return int(self.offsets.nbytes + self._keys.nbytes + self._session_base.nbytes)
+
+    def slices(self, start_time, end_time) -> List[slice]:
+        """
+        세션마다 시각이 [start_time, end_time] 구간인 행 위치 구간
+
+        모든 세션의 경계를 searchsorted 두 번(세션 수만큼의 질의를 한 번에)으로 계산하므로
+        비용은 행 수와 무관하게 세션 수에 비례합니다.
+
+        Args:
+            start_time: 구간 시작 (ms)
+            end_time: 구간 끝 (ms)
+
+        Returns:
+            List[slice]: 비어 있지 않은 행 위치 구간들 (세션 순)
+        """
+        if start_time > end_time or start_time > self._max_time or end_time < self._min_time:
+            return []
+        # 구간을 데이터 시각 범위로 좁혀 다른 세션의 키 범위로 넘어가지 않게 함
+        start = max(start_time, self._min_time) - self._min_time
+        end = min(end_time, self._max_time) - self._min_time
+        first = np.searchsorted(self._keys, self._session_base + start, side='left')
+        last = np.searchsorted(self._keys, self._session_base + end, side='right')
+        return [slice(lo, hi) for lo, hi in zip(first.tolist(), last.tolist()) if lo < hi]
+
+    def window(self, df: pd.DataFrame, start_time, end_time,
+               keep: Optional[Callable[[pd.DataFrame], np.ndarray]] = None) -> pd.DataFrame:
+        """
+        시간 구간에 해당하는 행만 담은 데이터프레임
+
+        구간이 하나의 연속 구간이면(한 세션 안이거나 세션 전체를 덮으면) 복사 없는 iloc 뷰를
+        반환합니다. 세션마다 떨어진 구간이거나 keep으로 걸러지는 행이 있으면 하나의
+        데이터프레임으로 만들기 위해 남는 행만 위치로 한 번 모읍니다 (남는 행 수에 비례하는
+        복사 한 번, 전체 행에 대한 비교 마스크는 만들지 않음).
+
+        Args:
+            df: 색인을 만든 데이터프레임
+            start_time: 구간 시작 (ms)
+            end_time: 구간 끝 (ms)
+            keep: 구간 조각(뷰)을 받아 유지할 행 마스크를 반환하는 함수 (예: 레이어 제외 필터)
+
+        Returns:
+            pd.DataFrame: 구간 내 데이터 (인덱스 라벨 유지)
+
+        Raises:
+            ValueError: 색인을 만든 데이터프레임과 행 수가 다른 경우
+        """
+        if len(df) != self.offsets[-1]:
+            raise ValueError("시간 색인을 만든 데이터와 행 수가 다릅니다")
+
+        # 이웃 세션이 맞닿으면(구간이 세션 전체를 덮으면) 하나의 구간으로 합침
+        merged: List[slice] = []
+        for part in self.slices(start_time, end_time):
+            if merged and merged[-1].stop == part.start:
+                merged[-1] = slice(merged[-1].start, part.stop)
+            else:
+                merged.append(part)
+
+        if not merged:
+            return df.iloc[0:0]
+
+        positions = []
+        for part in merged:
+            if keep is None:
+                positions.append(np.arange(part.start, part.stop))
+                continue
+            mask = np.asarray(keep(df.iloc[part]), dtype=bool)
+            if mask.all():
+                positions.append(np.arange(part.start, part.stop))
+            else:
+                positions.append(part.start + np.flatnonzero(mask))
+
+        if len(merged) == 1 and len(positions[0]) == merged[0].stop - merged[0].start:
+            return df.iloc[merged[0]]
+        return df.take(np.concatenate(positions))
@@ -0,0 +1,257 @@
+"""
+이벤트 분류 모듈
+선언적 규칙 표를 컴파일하여 Layer Name을 이벤트 타입/HWK 종류/플리킹 방향 코드(int8)로 분류
+분류는 행이 아닌 범주(고유 레이어 이름) 단위로 한 번만 수행하고 코드로 펼침
+"""
+
+import re
+import json
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 로드 시 추가되는 분류 컬럼 (규칙 표의 축 이름과 같음)
+EVENT_COLUMNS = ['event_type', 'hwk_subtype', 'swipe_direction']
+
+# 결합 시 추가되는 세션(선택 내 파일 위치) 번호 컬럼
+SESSION_COLUMN = 'session_id'
+
+# 코드 0: event_type은 기본 타입, applies_to가 있는 축은 해당 없음
+NOT_APPLICABLE = 0
+HWK_NONE = NOT_APPLICABLE
+SWIPE_NONE = NOT_APPLICABLE
+
+
+def default_event_rules() -> Dict[str, Dict[str, Any]]:
+    """
+    기본 분류 규칙 표 (config/settings.py의 EVENT_CLASSIFICATION_RULES가 유일한 정의)
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 축 이름 → 규칙 표
+
+    Raises:
+        ImportError: config.settings를 불러올 수 없는 경우 (프로젝트 루트가 경로에 없음)
+    """
+    from config.settings import EVENT_CLASSIFICATION_RULES
+    return EVENT_CLASSIFICATION_RULES
+
+
+class EventClassifier:
+    """규칙 표를 축별 정규식 목록으로 컴파일한 범주 단위 분류기"""
+
+    def __init__(self, rules: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        규칙 표 컴파일
+
+        축마다 위에서부터 처음 일치한 규칙의 label을 사용하고, 일치하는 규칙이 없으면
+        default를 사용합니다. applies_to가 있는 축은 그 문자열 중 하나를 포함한
+        레이어만 분류하고 나머지는 해당 없음(코드 0)으로 둡니다.
+        모든 비교는 대소문자를 구분하지 않는 부분 문자열 매칭입니다.
+
+        Args:
+            rules: 축 이름 → {'applies_to', 'default', 'rules'} 규칙 표
+                (None이면 config/settings.py의 기본 규칙)
+
+        Raises:
+            ValueError: 규칙 표 형식이 잘못된 경우
+        """
+        rules = default_event_rules() if rules is None else rules
+        self.labels: Dict[str, Tuple[str, ...]] = {}
+        # 축 이름 → (applies_to 패턴, [(패턴, 코드)], default 코드)
+        self._compiled: Dict[str, Tuple[Optional[str], List[Tuple[str, int]], int]] = {}
+
+        for column in EVENT_COLUMNS:
+            spec = rules.get(column)
+            if not isinstance(spec, dict) or 'default' not in spec:
+                raise ValueError(f"이벤트 분류 규칙에 '{column}' 축(default 포함)이 필요합니다")
+
+            applies_to = _substring_pattern(spec.get('applies_to') or [])
+            labels = ['' if applies_to else spec['default']]
+            matchers = []
+            for rule in spec.get('rules', []):
+                pattern = _substring_pattern(rule.get('contains', []))
+                if 'label' not in rule or pattern is None:
+                    raise ValueError(f"'{column}' 규칙에는 label과 contains가 필요합니다: {rule}")
+                matchers.append((pattern, _label_code(labels, rule['label'])))
+            default_code = _label_code(labels, spec['default'])
+
+            if len(labels) > np.iinfo(np.int8).max:
+                raise ValueError(f"'{column}' 축의 label이 너무 많습니다: {len(labels)}개")
+            self.labels[column] = tuple(labels)
+            self._compiled[column] = (applies_to, matchers, default_code)
+
+        self._name_codes: Dict[str, Tuple[int, int, int]] = {}  # 단일 이름 분류 결과
+        # 규칙이 바뀌면 디스크 캐시에 저장된 분류 컬럼을 다시 계산하기 위한 지문
+        self.fingerprint = hashlib.sha1(
+            json.dumps([self._compiled[c] for c in EVENT_COLUMNS]).encode('utf-8')
+        ).hexdigest()[:12]
+
+    def classify(self, layer_names: Iterable) -> np.ndarray:
+        """
+        레이어 이름 목록(범주)을 분류하여 (이름 수, 3) int8 배열로 반환
+
+        규칙마다 어휘 전체에 벡터화된 정규식 검색을 한 번씩 수행합니다.
+
+        Args:
+            layer_names: 고유 레이어 이름들
+
+        Returns:
+            np.ndarray: 각 행이 (이벤트 타입, HWK 종류, 플리킹 방향) 코드인 배열
+        """
+        names = pd.Index([str(name) for name in layer_names], dtype=object)
+        table = np.zeros((len(names), len(EVENT_COLUMNS)), dtype=np.int8)
+        if len(names) == 0:
+            return table
+
+        for i, column in enumerate(EVENT_COLUMNS):
+            applies_to, matchers, default_code = self._compiled[column]
+            codes = np.full(len(names), default_code, dtype=np.int8)
+            # 뒤 규칙부터 덮어써 앞 규칙이 우선하도록 함
+            for pattern, code in reversed(matchers):
+                codes[_contains(names, pattern)] = code
+            if applies_to is not None:
+                codes[~_contains(names, applies_to)] = NOT_APPLICABLE
+            table[:, i] = codes
+        return table
+
+    def classify_name(self, layer_name) -> Tuple[int, int, int]:
+        """
+        레이어 이름 하나를 분류
+
+        Args:
+            layer_name: 레이어 이름
+
+        Returns:
+            Tuple[int, int, int]: (이벤트 타입, HWK 종류, 플리킹 방향) 코드
+        """
+        name = str(layer_name)
+        codes = self._name_codes.get(name)
+        if codes is None:
+            codes = tuple(int(code) for code in self.classify([name])[0])
+            self._name_codes[name] = codes
+        return codes
+
+    def event_type_of(self, layer_name) -> str:
+        """레이어 이름의 이벤트 타입 label"""
+        return self.labels['event_type'][self.classify_name(layer_name)[0]]
+
+    def add_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Layer Name 범주를 한 번 분류하고 코드로 펼쳐 int8 분류 컬럼 추가
+
+        범주형이 아니면 factorize로 고유 이름을 먼저 구합니다.
+        이름이 없는 행(NaN)은 모든 축에서 코드 0으로 분류됩니다.
+
+        Args:
+            df: Layer Name 컬럼이 있는 데이터프레임
+
+        Returns:
+            pd.DataFrame: 분류 컬럼이 추가된 데이터프레임 (Layer Name이 없으면 그대로)
+        """
+        if 'Layer Name' not in df.columns:
+            return df
+
+        layer = df['Layer Name']
+        if isinstance(layer.dtype, pd.CategoricalDtype):
+            codes = layer.cat.codes.to_numpy()
+            categories = layer.cat.categories
+        else:
+            codes, categories = pd.factorize(layer)
+
+        # 마지막 행을 NaN(코드 -1)용 기본값으로 두어 take 한 번으로 펼침
+        table = np.vstack([self.classify(categories),
+                           np.zeros((1, len(EVENT_COLUMNS)), dtype=np.int8)])
+        for i, column in enumerate(EVENT_COLUMNS):
+            df[column] = table[:, i].take(codes)
+        return df
+
+    def count_labels(self, df: pd.DataFrame, column: str) -> Dict[str, int]:
+        """
+        분류 컬럼의 label별 행 수 (처음 등장한 순서, 해당 없음 제외)
+
+        Args:
+            df: 분류 컬럼이 있는 데이터프레임
+            column: 분류 컬럼 이름
+
+        Returns:
+            Dict[str, int]: label → 행 수
+        """
+        if column not in df.columns:
+            df = self.add_columns(df[['Layer Name']].copy())
+        codes = df[column].to_numpy()
+        labels = self.labels[column]
+        present, first_index, counts = np.unique(codes, return_index=True, return_counts=True)
+        result = {}
+        for order in np.argsort(first_index, kind='stable'):
+            code = int(present[order])
+            if labels[code] == '':
+                continue
+            result[labels[code]] = int(counts[order])
+        return result
+
+
+_default_classifier: Optional[EventClassifier] = None
+
+
+def default_classifier() -> EventClassifier:
+    """기본 규칙으로 컴파일한 분류기 (처음 호출 시 생성)"""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = EventClassifier()
+    return _default_classifier
+
+
+def add_event_columns(df: pd.DataFrame,
+                      classifier: Optional[EventClassifier] = None) -> pd.DataFrame:
+    """
+    분류기로 int8 분류 컬럼 추가 (EventClassifier.add_columns 참고)
+
+    Args:
+        df: Layer Name 컬럼이 있는 데이터프레임
+        classifier: 사용할 분류기 (None이면 기본 규칙)
+
+    Returns:
+        pd.DataFrame: 분류 컬럼이 추가된 데이터프레임
+    """
+    return (classifier or default_classifier()).add_columns(df)
+
+
+def hwk_mask(df: pd.DataFrame) -> pd.Series:
+    """HWK 종류가 분류된 행 마스크 (분류 컬럼이 없으면 'HWK' 문자열 검색)"""
+    if 'hwk_subtype' in df.columns:
+        return df['hwk_subtype'] != HWK_NONE
+    return df['Layer Name'].str.contains('HWK', case=False, na=False)
+
+
+def swipe_mask(df: pd.DataFrame) -> pd.Series:
+    """플리킹 방향이 분류된 행 마스크 (분류 컬럼이 없으면 'SWIPE' 문자열 검색)"""
+    if 'swipe_direction' in df.columns:
+        return df['swipe_direction'] != SWIPE_NONE
+    return df['Layer Name'].str.contains('SWIPE', case=False, na=False)
+
+
+def touch_mask(df: pd.DataFrame) -> pd.Series:
+    """HWK와 SWIPE를 제외한 일반 터치 행 마스크"""
+    return ~(hwk_mask(df) | swipe_mask(df))
+
+
+def _substring_pattern(substrings: List[str]) -> Optional[str]:
+    """부분 문자열 목록을 하나의 대소문자 무시 정규식으로 컴파일 (비어 있으면 None)"""
+    substrings = [str(s) for s in substrings if str(s)]
+    if not substrings:
+        return None
+    return '|'.join(re.escape(s.lower()) for s in substrings)
+
+
+def _label_code(labels: List[str], label: str) -> int:
+    """label의 코드 (처음 보는 label이면 뒤에 추가)"""
+    if label not in labels:
+        labels.append(label)
+    return labels.index(label)
+
+
+def _contains(names: pd.Index, pattern: str) -> np.ndarray:
+    """어휘 전체에 대한 대소문자 무시 정규식 검색"""
+    return np.asarray(names.str.contains(pattern, case=False, regex=True), dtype=bool)
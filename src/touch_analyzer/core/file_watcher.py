@@ -0,0 +1,81 @@
+"""
+파일 변경 감시 모듈
+OS별 API 없이 stat 기반 폴링으로 data_log 폴더의 변경을 감지
+"""
+
+import time
+import logging
+from typing import Callable, List, Optional
+
+from .data_catalog import DataCatalog, CatalogChanges
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogWatcher:
+    """카탈로그를 주기적으로 증분 갱신하고 변경 사항을 구독자에게 전달"""
+
+    def __init__(self, catalog: DataCatalog, min_interval_seconds: float = 1.0):
+        """
+        카탈로그 감시자 초기화
+
+        Args:
+            catalog: 감시할 데이터 카탈로그
+            min_interval_seconds: 연속 폴링 사이의 최소 간격 (초)
+        """
+        self.catalog = catalog
+        self.min_interval_seconds = min_interval_seconds
+        self._listeners: List[Callable[[CatalogChanges], None]] = []
+        self._last_poll = 0.0
+        self._poll_count = 0
+        self._change_count = 0
+
+    def add_listener(self, listener: Callable[[CatalogChanges], None]) -> None:
+        """변경 발생 시 호출될 콜백 등록"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[CatalogChanges], None]) -> None:
+        """등록된 콜백 제거"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def poll(self, force: bool = False) -> Optional[CatalogChanges]:
+        """
+        변경 사항 확인 (변경이 있으면 구독자들에게 전달)
+
+        Args:
+            force: 최소 간격을 무시하고 즉시 확인할지 여부
+
+        Returns:
+            Optional[CatalogChanges]: 변경 사항 (변경 없거나 건너뛰면 None)
+        """
+        now = time.monotonic()
+        if not force and now - self._last_poll < self.min_interval_seconds:
+            return None
+        self._last_poll = now
+        self._poll_count += 1
+
+        try:
+            changes = self.catalog.refresh()
+        except Exception as e:
+            logger.error(f"데이터 폴더 변경 확인 실패: {str(e)}")
+            return None
+
+        if not changes:
+            return None
+
+        self._change_count += 1
+        for listener in list(self._listeners):
+            try:
+                listener(changes)
+            except Exception as e:
+                logger.error(f"변경 알림 처리 실패: {str(e)}")
+        return changes
+
+    def get_stats(self) -> dict:
+        """폴링 통계 반환"""
+        return {
+            'polls': self._poll_count,
+            'changes_detected': self._change_count,
+            'min_interval_seconds': self.min_interval_seconds
+        }
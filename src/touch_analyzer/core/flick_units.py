@@ -0,0 +1,243 @@
+"""
+플리킹 단위 모듈
+SWIPE 이벤트마다 같은 세션의 직전 비-SWIPE 이벤트(플리킹 시작점)를 정렬 한 번과 이진 탐색으로
+짝지어 플리킹 단위를 컬럼형 표로 계산
+"""
+
+import logging
+from dataclasses import dataclass, fields
+from typing import Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from .event_types import SESSION_COLUMN, swipe_mask
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FlickUnits:
+    """플리킹 단위 표 (행 하나 = 시작점 → SWIPE 종료점, 세션/종료 시각 순)"""
+
+    session: np.ndarray  # 시작점과 종료점이 속한 세션 번호
+    start_index: np.ndarray  # 시작점의 데이터프레임 인덱스 라벨
+    end_index: np.ndarray  # 종료점(SWIPE)의 데이터프레임 인덱스 라벨
+    start_time: np.ndarray
+    end_time: np.ndarray
+    start_layer: pd.Categorical
+    end_layer: pd.Categorical
+    start_x: np.ndarray
+    start_y: np.ndarray
+    end_x: np.ndarray
+    end_y: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.end_index)
+
+    @property
+    def start_points(self) -> Set:
+        """플리킹 시작점 인덱스 라벨 집합"""
+        return set(self.start_index.tolist())
+
+    @property
+    def end_points(self) -> Set:
+        """플리킹 종료점 인덱스 라벨 집합"""
+        return set(self.end_index.tolist())
+
+    @property
+    def nbytes(self) -> int:
+        """보관 중인 배열들의 메모리 크기 (바이트, 캐시 예산 계산용)"""
+        return sum(int(getattr(self, field.name).nbytes) for field in fields(self))
+
+    def take(self, positions: np.ndarray) -> 'FlickUnits':
+        """위치 배열에 해당하는 단위만 담은 표"""
+        return FlickUnits(**{field.name: getattr(self, field.name)[positions]
+                             for field in fields(self)})
+
+
+class FlickIndex:
+    """
+    선택 하나의 플리킹 단위 색인
+
+    결합 데이터에서 한 번 계산한 플리킹 단위를 SWIPE 시각 순 정렬 색인과 함께 보관하고,
+    필터된 데이터(결합 데이터의 행 부분 집합)에 남아 있는 단위만 골라 줍니다.
+    """
+
+    def __init__(self, units: FlickUnits):
+        """
+        플리킹 색인 초기화
+
+        Args:
+            units: 결합 데이터 기준 플리킹 단위 표
+        """
+        self.units = units
+        # SWIPE 시각 순 단위 위치 (시간 구간 조회용)
+        self._by_end_time = np.argsort(units.end_time, kind='stable')
+        self._sorted_end_time = units.end_time[self._by_end_time]
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> 'FlickIndex':
+        """데이터프레임의 플리킹 단위를 계산하여 색인 생성"""
+        return cls(find_flick_units(df))
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    @property
+    def start_points(self) -> Set:
+        """플리킹 시작점 인덱스 라벨 집합"""
+        return self.units.start_points
+
+    @property
+    def nbytes(self) -> int:
+        """단위 표와 정렬 색인의 메모리 크기 (바이트, 캐시 예산 계산용)"""
+        return self.units.nbytes + int(self._by_end_time.nbytes) + int(self._sorted_end_time.nbytes)
+
+    def window(self, start_time, end_time) -> np.ndarray:
+        """
+        SWIPE 시각이 [start_time, end_time] 구간인 단위 위치
+
+        Args:
+            start_time: 구간 시작 (ms)
+            end_time: 구간 끝 (ms)
+
+        Returns:
+            np.ndarray: 단위 위치 배열 (세션/종료 시각 순)
+        """
+        lo = np.searchsorted(self._sorted_end_time, start_time, side='left')
+        hi = np.searchsorted(self._sorted_end_time, end_time, side='right')
+        return np.sort(self._by_end_time[lo:hi])
+
+    def present(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        SWIPE 행이 데이터프레임에 남아 있는 단위 위치
+
+        df의 시간 범위로 후보를 먼저 좁힌 뒤 행 인덱스로 확인합니다.
+
+        Args:
+            df: 결합 데이터에서 걸러낸 데이터프레임
+
+        Returns:
+            np.ndarray: 단위 위치 배열 (세션/종료 시각 순)
+        """
+        if len(df) == 0 or len(self.units) == 0:
+            return np.empty(0, dtype=np.intp)
+        times = df['Time(ms)']
+        candidates = self.window(times.min(), times.max())
+        return candidates[pd.Index(self.units.end_index[candidates]).isin(df.index)]
+
+    def count(self, df: pd.DataFrame) -> int:
+        """SWIPE 행이 데이터프레임에 남아 있는 단위 수"""
+        return len(self.present(df))
+
+    def select(self, df: pd.DataFrame) -> FlickUnits:
+        """SWIPE 행이 데이터프레임에 남아 있는 단위 표"""
+        return self.units.take(self.present(df))
+
+    def start_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        플리킹 시작점 행 마스크 (SWIPE가 걸러졌더라도 시작점이면 True)
+
+        Args:
+            df: 결합 데이터에서 걸러낸 데이터프레임
+
+        Returns:
+            np.ndarray: bool 배열
+        """
+        return df.index.isin(self.units.start_index)
+
+
+def find_flick_units(df: pd.DataFrame, is_swipe: Optional[np.ndarray] = None) -> FlickUnits:
+    """
+    모든 SWIPE 이벤트의 플리킹 시작점을 한 번에 찾기 (O(N log N))
+
+    시작점은 같은 세션에서 SWIPE 시각보다 엄격히 이전인 비-SWIPE 이벤트 중 가장 늦은 것입니다.
+    같은 시각의 후보가 여럿이면 데이터프레임 순서상 첫 행을 사용합니다.
+    세션 안에 이전 이벤트가 없는 SWIPE는 단위를 만들지 않습니다.
+    모든 세션을 (세션, 시각) 정수 키 하나로 함께 정렬하므로 세션 간에는 서로 영향이 없습니다.
+
+    Args:
+        df: Time(ms), Layer Name(, TouchX, TouchY, session_id) 컬럼이 있는 데이터프레임
+        is_swipe: SWIPE 행 마스크 (None이면 분류 컬럼으로 계산)
+
+    Returns:
+        FlickUnits: 플리킹 단위 표
+    """
+    times = df['Time(ms)'].to_numpy()
+    sessions = session_codes(df)
+    if is_swipe is None:
+        is_swipe = swipe_mask(df).to_numpy()
+    keys = _session_time_keys(sessions, times)
+
+    swipe_pos = np.flatnonzero(is_swipe)
+    other_pos = np.flatnonzero(~is_swipe)
+    swipe_pos = swipe_pos[np.argsort(keys[swipe_pos], kind='stable')]
+    other_pos = other_pos[np.argsort(keys[other_pos], kind='stable')]
+
+    # 각 SWIPE 키보다 작은 가장 큰 비-SWIPE 키 (다른 세션이면 짝 없음), 그 키의 첫 행 위치
+    other_keys = keys[other_pos]
+    nearest = np.searchsorted(other_keys, keys[swipe_pos], side='left') - 1
+    paired = nearest >= 0
+    paired[paired] = sessions[other_pos[nearest[paired]]] == sessions[swipe_pos[paired]]
+    nearest = np.searchsorted(other_keys, other_keys[nearest[paired]], side='left')
+    start_pos = other_pos[nearest]
+    end_pos = swipe_pos[paired]
+
+    index = df.index.to_numpy()
+    layer = df['Layer Name'].array
+
+    def _coords(column: str, positions: np.ndarray) -> np.ndarray:
+        if column not in df.columns:
+            return np.full(len(positions), np.nan)
+        return df[column].to_numpy()[positions]
+
+    units = FlickUnits(
+        session=sessions[end_pos],
+        start_index=index[start_pos],
+        end_index=index[end_pos],
+        start_time=times[start_pos],
+        end_time=times[end_pos],
+        start_layer=layer.take(start_pos),
+        end_layer=layer.take(end_pos),
+        start_x=_coords('TouchX', start_pos),
+        start_y=_coords('TouchY', start_pos),
+        end_x=_coords('TouchX', end_pos),
+        end_y=_coords('TouchY', end_pos),
+    )
+    logger.debug(f"플리킹 단위 계산: SWIPE {len(swipe_pos)}개 중 {len(units)}개 단위")
+    return units
+
+
+def session_codes(df: pd.DataFrame) -> np.ndarray:
+    """
+    행별 세션 번호
+
+    Args:
+        df: 데이터프레임
+
+    Returns:
+        np.ndarray: 세션 번호 배열 (세션 컬럼이 없으면 모두 0인 단일 세션)
+    """
+    if SESSION_COLUMN in df.columns:
+        return df[SESSION_COLUMN].to_numpy(dtype=np.int64)
+    return np.zeros(len(df), dtype=np.int64)
+
+
+def session_time_order(df: pd.DataFrame) -> np.ndarray:
+    """
+    (세션, 시각) 순서의 행 위치 (같은 값은 데이터프레임 순서 유지)
+
+    Args:
+        df: Time(ms) 컬럼이 있는 데이터프레임
+
+    Returns:
+        np.ndarray: 정렬된 행 위치 배열
+    """
+    return np.lexsort((df['Time(ms)'].to_numpy(), session_codes(df)))
+
+
+def _session_time_keys(sessions: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """(세션, 시각) 순서를 보존하는 int64 키 (시각은 고유값 순위로 압축)"""
+    unique_times, time_rank = np.unique(times, return_inverse=True)
+    return sessions.astype(np.int64) * len(unique_times) + time_rank.reshape(-1)
@@ -0,0 +1,62 @@
+"""
+레이어 제외 필터 모듈
+제외 키워드를 행이 아닌 고유 레이어 이름(범주) 단위로 평가하고 범주 코드로 펼침
+"""
+
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+
+class LayerExcludeFilter:
+    """키워드별 레이어 이름 일치 결과를 기억하는 범주 단위 제외 필터"""
+
+    def __init__(self):
+        """레이어 제외 필터 초기화"""
+        # 키워드 → {레이어 이름: 일치 여부}
+        self._matches: Dict[str, Dict[str, bool]] = {}
+
+    def keep_mask(self, layer: pd.Series, keywords: Iterable[str]) -> np.ndarray:
+        """
+        키워드가 하나도 포함되지 않은 행 마스크
+
+        str.contains(keyword, case=False)와 같은 규칙(정규식)으로 범주만 검사하므로
+        비용은 행 수가 아닌 레이어 이름 수에 비례합니다.
+
+        Args:
+            layer: Layer Name 컬럼
+            keywords: 제외 키워드들
+
+        Returns:
+            np.ndarray: 유지할 행이면 True인 bool 배열
+
+        Raises:
+            re.error: 키워드가 올바른 정규식이 아닌 경우
+        """
+        if isinstance(layer.dtype, pd.CategoricalDtype):
+            codes = layer.cat.codes.to_numpy()
+            categories = layer.cat.categories
+        else:
+            codes, categories = pd.factorize(layer)
+
+        names = [str(name) for name in categories]
+        excluded = np.zeros(len(names), dtype=bool)
+        for keyword in keywords:
+            excluded |= self._match(keyword, names)
+
+        # 마지막 원소는 이름이 없는 행(코드 -1)용: 어떤 키워드와도 일치하지 않음
+        return np.append(~excluded, True).take(codes)
+
+    def _match(self, keyword: str, names: list) -> np.ndarray:
+        """키워드와 레이어 이름들의 일치 여부 (처음 보는 이름만 검사)"""
+        cached = self._matches.setdefault(keyword, {})
+        missing = [name for name in names if name not in cached]
+        if missing:
+            hits = pd.Index(missing, dtype=object).str.contains(keyword, case=False, regex=True)
+            cached.update(zip(missing, hits.tolist()))
+        return np.fromiter((cached[name] for name in names), dtype=bool, count=len(names))
+
+    def clear(self) -> None:
+        """기억한 일치 결과 삭제"""
+        self._matches.clear()
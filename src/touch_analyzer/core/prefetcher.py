@@ -0,0 +1,139 @@
+"""
+미리 읽기 스케줄러 모듈
+다음에 선택될 가능성이 높은 사용자/Task 조합을 백그라운드에서 캐시에 미리 적재
+"""
+
+import os
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from ..utils.memory_utils import MemoryMonitor
+
+logger = logging.getLogger(__name__)
+
+# CSV 텍스트 대비 파싱/압축된 데이터프레임 크기 비율 (보수적 추정치)
+_PARSED_BYTES_RATIO = 0.5
+
+
+class PrefetchScheduler:
+    """단일 백그라운드 워커로 후보 선택을 차례로 캐시에 적재하는 스케줄러"""
+
+    def __init__(self, data_manager, memory_ceiling_mb: float,
+                 memory_monitor: Optional[MemoryMonitor] = None):
+        """
+        미리 읽기 스케줄러 초기화
+
+        Args:
+            data_manager: 캐시를 채울 데이터 관리자
+            memory_ceiling_mb: 미리 읽기가 채울 수 있는 메모리 캐시 총량 상한 (MB)
+            memory_monitor: 프로세스 메모리가 임계값을 넘으면 미리 읽기를 멈추기 위한 모니터
+        """
+        self.data_manager = data_manager
+        self.memory_ceiling_bytes = int(memory_ceiling_mb * 1024 * 1024)
+        self.memory_monitor = memory_monitor
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._generation = 0  # 새 예약/취소마다 증가, 이전 작업은 다음 확인 시점에 중단
+        self._prefetched = 0
+        self._skipped = 0
+        self._cancelled = 0
+
+    def schedule(self, selections: List[List[str]]) -> None:
+        """
+        후보 선택들을 우선순위 순서대로 미리 읽도록 예약 (이전 예약은 취소)
+
+        Args:
+            selections: 파일 경로 목록들 (앞쪽일수록 먼저 적재)
+        """
+        selections = [list(paths) for paths in selections if paths]
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        if not selections:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self._executor.submit(self._run, generation, selections)
+
+    def cancel(self) -> None:
+        """진행 중이거나 대기 중인 미리 읽기 취소 (사용자 조작 시 호출)"""
+        with self._lock:
+            self._generation += 1
+
+    def shutdown(self) -> None:
+        """워커 종료"""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _is_current(self, generation: int) -> bool:
+        """예약이 아직 유효한지 (이후 취소/재예약이 없었는지)"""
+        with self._lock:
+            return generation == self._generation
+
+    def _run(self, generation: int, selections: List[List[str]]) -> None:
+        """워커 스레드: 후보를 차례로 적재 (파일 하나마다 취소 여부 확인)"""
+        for file_paths in selections:
+            if not self._is_current(generation):
+                self._cancelled += 1
+                return
+            if self.data_manager.is_selection_cached(file_paths):
+                continue
+            if not self._has_headroom(file_paths):
+                self._skipped += 1
+                logger.debug(f"메모리 상한으로 미리 읽기 중단: {len(file_paths)}개 파일")
+                return
+
+            try:
+                # 파일 단위로 먼저 적재해 사용자가 조작하면 바로 멈출 수 있게 함
+                for file_path, _ in self.data_manager.get_uncached_files(file_paths):
+                    if not self._is_current(generation):
+                        self._cancelled += 1
+                        return
+                    self.data_manager.load_files([file_path])
+                if not self._is_current(generation):
+                    self._cancelled += 1
+                    return
+                if self.data_manager.load_and_combine_data(file_paths, report_failures=False) is not None:
+                    self._prefetched += 1
+                    logger.debug(f"미리 읽기 완료: {len(file_paths)}개 파일")
+            except Exception as e:
+                logger.debug(f"미리 읽기 실패: {str(e)}")
+
+    def _has_headroom(self, file_paths: List[str]) -> bool:
+        """
+        후보를 적재해도 메모리 상한을 넘지 않는지 확인
+
+        사용자가 연 데이터를 밀어내지 않도록 캐시 예산 안에 들어갈 때만 적재합니다.
+        """
+        if self.memory_monitor is not None and self.memory_monitor.check_memory_threshold():
+            return False
+
+        file_bytes = sum(size for _, size in self.data_manager.get_uncached_files(file_paths))
+        total_bytes = 0
+        for file_path in file_paths:
+            try:
+                total_bytes += os.path.getsize(file_path)
+            except OSError:
+                continue
+        # 파일별 캐시 + 결합 결과
+        estimate = int((file_bytes + total_bytes) * _PARSED_BYTES_RATIO)
+
+        cache = self.data_manager.cache_manager
+        used = cache.get_memory_usage_estimate()
+        ceiling = self.memory_ceiling_bytes
+        if cache.max_bytes is not None:
+            ceiling = min(ceiling, cache.max_bytes)
+        return used + estimate <= ceiling
+
+    def get_stats(self) -> Dict[str, int]:
+        """미리 읽기 통계 반환"""
+        return {
+            'prefetched': self._prefetched,
+            'skipped': self._skipped,
+            'cancelled': self._cancelled,
+            'memory_ceiling_bytes': self.memory_ceiling_bytes
+        }
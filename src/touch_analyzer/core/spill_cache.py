@@ -0,0 +1,267 @@
+"""
+디스크 스필 캐시 모듈 - 메모리 캐시의 2차 계층
+메모리에서 밀려난 결합 데이터프레임을 컬럼 파일로 저장하고 mmap으로 즉시 복원
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from .column_cache import CACHE_FORMAT_VERSION, META_FILENAME, write_columns, read_columns
+
+logger = logging.getLogger(__name__)
+
+
+class SpillCache:
+    """원본 파일 시그니처로 검증되는 크기 제한 LRU 디스크 캐시"""
+
+    def __init__(self, cache_dir: str, max_bytes: int, tag: str = ""):
+        """
+        스필 캐시 초기화
+
+        Args:
+            cache_dir: 캐시 루트 디렉토리 (하위에 spill/ 생성)
+            max_bytes: 디스크 사용량 상한 (바이트)
+            tag: 파생 컬럼 계산 방식 지문 (다른 항목은 시작 시 제거, 예: 이벤트 분류 규칙)
+        """
+        self.cache_dir = os.path.join(cache_dir, "spill")
+        self.max_bytes = max_bytes
+        self.tag = tag
+        # 항목 디렉토리 이름 → (캐시 키, 크기, 원본 파일 경로들), 오래 사용하지 않은 순서
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._spilled = 0
+        # 메모리 캐시 축출(작업 스레드)과 UI 스레드 조회가 색인을 함께 바꾸므로 보호
+        self._lock = threading.RLock()
+        self._scan()
+
+    def _scan(self) -> None:
+        """기존 항목을 최근 사용 시각 순으로 색인 (재시작 후에도 유지)"""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        found = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                meta = _read_meta(entry.path)
+                if (meta is None or meta.get('version') != CACHE_FORMAT_VERSION
+                        or meta.get('tag', "") != self.tag):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                    continue
+                found.append((entry.stat().st_mtime, entry.name, meta['key'],
+                              _dir_size(entry.path), tuple(meta.get('sources', {}))))
+
+        for _, name, key, size, sources in sorted(found):
+            self._entries[name] = (key, size, sources)
+            self._total_bytes += size
+
+    @staticmethod
+    def _entry_name(key: str) -> str:
+        """캐시 키에 대응하는 항목 디렉토리 이름"""
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:24]
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        스필된 데이터프레임을 mmap으로 복원
+
+        원본 파일 중 하나라도 바뀌었거나 사라졌으면 항목을 버리고 None을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[pd.DataFrame]: 유효한 항목이 있으면 데이터프레임, 없으면 None
+        """
+        name = self._entry_name(key)
+        with self._lock:
+            return self._load(name, key)
+
+    def _load(self, name: str, key: str) -> Optional[pd.DataFrame]:
+        """잠금을 잡은 상태에서 항목 복원"""
+        if name not in self._entries:
+            self._misses += 1
+            return None
+
+        entry_dir = os.path.join(self.cache_dir, name)
+        meta = _read_meta(entry_dir)
+        if meta is None or meta.get('key') != key or not _sources_unchanged(meta.get('sources', {})):
+            self._drop(name)
+            self._misses += 1
+            return None
+
+        try:
+            df = read_columns(entry_dir, meta, mmap=True)
+        except Exception as e:
+            logger.warning(f"스필 캐시 읽기 실패: {str(e)}")
+            self._drop(name)
+            self._misses += 1
+            return None
+
+        # LRU 갱신 (디렉토리 mtime으로 재시작 후에도 순서 유지)
+        self._entries.move_to_end(name)
+        try:
+            os.utime(entry_dir)
+        except OSError:
+            pass
+        self._hits += 1
+        logger.debug(f"스필 캐시 히트: {len(df)} 행")
+        return df
+
+    def store(self, key: str, df: pd.DataFrame, source_paths: List[str]) -> bool:
+        """
+        데이터프레임을 디스크로 스필 (용량 초과 시 오래된 항목부터 제거)
+
+        Args:
+            key: 캐시 키
+            df: 저장할 데이터프레임
+            source_paths: 데이터프레임을 만든 원본 파일 목록 (유효성 검증용)
+
+        Returns:
+            bool: 저장 여부
+        """
+        size = int(df.memory_usage(index=False, deep=False).sum())
+        if size > self.max_bytes:
+            return False
+
+        sources: Dict[str, list] = {}
+        for path in source_paths:
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                return False
+            sources[path] = [file_stat.st_mtime_ns, file_stat.st_size]
+
+        name = self._entry_name(key)
+        with self._lock:
+            return self._store(name, key, df, size, sources)
+
+    def _store(self, name: str, key: str, df: pd.DataFrame, size: int,
+               sources: Dict[str, list]) -> bool:
+        """잠금을 잡은 상태에서 항목 저장"""
+        if name in self._entries:
+            meta = _read_meta(os.path.join(self.cache_dir, name))
+            if meta is not None and meta.get('sources') == sources:
+                # 승격됐다가 다시 밀려난 항목은 다시 쓰지 않음
+                self._entries.move_to_end(name)
+                return True
+            self._drop(name)
+        while self._entries and self._total_bytes + size > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+
+        entry_dir = os.path.join(self.cache_dir, name)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            write_columns(entry_dir, df, {'version': CACHE_FORMAT_VERSION, 'tag': self.tag,
+                                          'key': key, 'sources': sources})
+        except Exception as e:
+            logger.warning(f"스필 캐시 저장 실패: {str(e)}")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return False
+
+        size = _dir_size(entry_dir)
+        self._entries[name] = (key, size, tuple(sources))
+        self._total_bytes += size
+        self._spilled += 1
+        logger.debug(f"디스크로 스필: {len(df)} 행 ({size / 1024 / 1024:.1f} MB)")
+        return True
+
+    def invalidate(self, predicate: Callable[[str], bool]) -> int:
+        """
+        조건에 맞는 키의 항목들 제거
+
+        Args:
+            predicate: 키를 받아 제거 여부를 반환하는 함수
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        with self._lock:
+            names = [name for name, (key, _, _) in self._entries.items() if predicate(key)]
+            for name in names:
+                self._drop(name)
+        return len(names)
+
+    def invalidate_sources(self, file_paths) -> int:
+        """
+        주어진 원본 파일로 만든 항목들 제거
+
+        Args:
+            file_paths: 변경된 원본 파일 경로들
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        targets = set(file_paths)
+        with self._lock:
+            names = [name for name, (_, _, sources) in self._entries.items()
+                     if targets.intersection(sources)]
+            for name in names:
+                self._drop(name)
+        return len(names)
+
+    def clear(self) -> None:
+        """스필 캐시 전체 삭제"""
+        with self._lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _drop(self, name: str) -> None:
+        """항목 디렉토리와 색인 제거 (잠금을 잡은 상태에서 호출)"""
+        _, size, _ = self._entries.pop(name, (None, 0, ()))
+        self._total_bytes -= size
+        shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        """스필 캐시 통계 반환"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'spilled': self._spilled
+            }
+
+
+def _read_meta(entry_dir: str) -> Optional[dict]:
+    """항목 메타데이터 읽기"""
+    try:
+        with open(os.path.join(entry_dir, META_FILENAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _sources_unchanged(sources: Dict[str, list]) -> bool:
+    """원본 파일들의 mtime/크기가 저장 시점과 같은지 확인"""
+    for path, (mtime_ns, size) in sources.items():
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return False
+        if file_stat.st_mtime_ns != mtime_ns or file_stat.st_size != size:
+            return False
+    return True
+
+
+def _dir_size(path: str) -> int:
+    """디렉토리 안 파일 크기 합계"""
+    total = 0
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file():
+                total += entry.stat().st_size
+    return total
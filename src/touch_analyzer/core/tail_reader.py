@@ -0,0 +1,292 @@
+"""
+테일 리더 모듈 - 기록 중인 터치 로그의 증분 읽기
+파일별 바이트 오프셋과 마지막 Count를 기억하여 새로 추가된 행만 파싱
+"""
+
+import io
+import os
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .touch_log_parser import parse_touch_log
+from .event_types import EventClassifier, add_event_columns
+
+logger = logging.getLogger(__name__)
+
+# 마지막 완전한 행을 찾기 위해 파일 끝에서 거꾸로 읽는 블록 크기
+_TAIL_PROBE_BYTES = 4096
+
+
+@dataclass
+class TailState:
+    """파일별 증분 읽기 상태"""
+
+    offset: int             # 다음에 읽을 바이트 위치 (항상 행 경계)
+    last_count: int         # 마지막으로 반영한 Count 값
+    columns: List[str]      # CSV 헤더
+    mtime_ns: int
+    size: int
+    frame: pd.DataFrame     # 마지막으로 합친 누적 데이터프레임
+    inode: int = 0          # 파일 교체(로그 회전) 감지용 (0이면 확인 안 함)
+    # 아직 frame에 합치지 않은 추가분 (frame()을 호출할 때 한 번에 합침)
+    chunks: List[pd.DataFrame] = field(default_factory=list)
+    unsaved: bool = False   # 디스크 캐시에 기록하지 않은 추가분이 있는지 여부
+
+
+class TailReader:
+    """
+    기록 중인 CSV 파일에 추가된 행만 읽어 모아 두는 리더
+
+    추가분은 읽을 때마다 합치지 않고 쌓아 두었다가 frame()으로 누적 데이터프레임이
+    필요할 때 한 번에 합칩니다 (틱마다 전체 프레임을 복사하지 않음).
+    """
+
+    def __init__(self, required_columns: List[str],
+                 classifier: Optional[EventClassifier] = None):
+        """
+        테일 리더 초기화
+
+        Args:
+            required_columns: 유지할 필수 컬럼 목록
+            classifier: 추가된 행의 이벤트 분류기 (None이면 기본 규칙)
+        """
+        self.required_columns = list(required_columns)
+        self.classifier = classifier
+        self._states: Dict[str, TailState] = {}
+        # 실시간 추적 틱(UI 스레드)과 미리 읽기 스레드의 load_files가 함께 사용
+        self._lock = threading.RLock()
+
+    def is_tracking(self, file_path: str) -> bool:
+        """파일을 추적 중인지 여부"""
+        return file_path in self._states
+
+    def tracked_paths(self) -> List[str]:
+        """추적 중인 파일 경로 목록"""
+        with self._lock:
+            return list(self._states)
+
+    def is_current(self, file_path: str, file_stat: os.stat_result) -> bool:
+        """추적 중인 상태가 주어진 파일 상태까지 반영했는지 여부"""
+        state = self._states.get(file_path)
+        return (state is not None
+                and state.mtime_ns == file_stat.st_mtime_ns
+                and state.size == file_stat.st_size)
+
+    def has_unsaved(self, file_path: str) -> bool:
+        """디스크 캐시에 기록하지 않은 추가분이 있는지 여부"""
+        state = self._states.get(file_path)
+        return state is not None and state.unsaved
+
+    def mark_saved(self, file_path: str) -> None:
+        """누적 데이터프레임을 디스크 캐시에 기록했음을 표시"""
+        with self._lock:
+            state = self._states.get(file_path)
+            if state is not None:
+                state.unsaved = False
+
+    def frame(self, file_path: str) -> Optional[pd.DataFrame]:
+        """
+        지금까지 읽은 누적 데이터프레임 (쌓인 추가분은 이때 한 번에 합침)
+
+        Args:
+            file_path: 파일 경로
+
+        Returns:
+            Optional[pd.DataFrame]: 누적 데이터프레임 (추적 중이 아니면 None)
+        """
+        with self._lock:
+            state = self._states.get(file_path)
+            if state is None:
+                return None
+            if state.chunks:
+                state.frame = _append_frames(state.frame, state.chunks)
+                state.chunks = []
+            return state.frame
+
+    def seed(self, file_path: str, df: pd.DataFrame) -> None:
+        """
+        이미 전체 로드된 데이터프레임으로 추적 시작 (재파싱 없이)
+
+        파일이 개행으로 끝나지 않으면 (행 기록 중) 시드를 버리고
+        다음 read()에서 완전한 행까지만 다시 읽습니다.
+
+        Args:
+            file_path: 파일 경로
+            df: 해당 파일 전체를 최적화한 데이터프레임
+        """
+        try:
+            file_stat = os.stat(file_path)
+            with open(file_path, 'rb') as f:
+                columns = _read_header(f)
+                offset, last_line = _last_complete_line(f, file_stat.st_size)
+        except (OSError, ValueError) as e:
+            logger.debug(f"테일 시드 실패: {file_path}, 오류: {str(e)}")
+            return
+
+        if offset != file_stat.st_size:
+            return
+
+        with self._lock:
+            self._states[file_path] = TailState(
+                offset=offset,
+                last_count=_parse_count(last_line),
+                columns=columns,
+                mtime_ns=file_stat.st_mtime_ns,
+                size=file_stat.st_size,
+                frame=df,
+                inode=file_stat.st_ino
+            )
+
+    def read(self, file_path: str) -> int:
+        """
+        마지막 위치 이후 추가된 행만 읽어 추가분으로 쌓기
+
+        파일이 줄어들었거나 교체된 경우 처음부터 다시 읽습니다.
+        비용은 추가된 바이트 수에 비례하고, 누적 데이터프레임은 frame()에서 합칩니다.
+
+        Args:
+            file_path: 파일 경로
+
+        Returns:
+            int: 이번에 추가된 행 수
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+            ValueError: 필수 컬럼이 누락된 경우
+        """
+        with self._lock:
+            return self._read(file_path)
+
+    def _read(self, file_path: str) -> int:
+        """잠금을 잡은 상태에서 추가분 읽기"""
+        if not os.path.exists(file_path):
+            self._states.pop(file_path, None)
+            raise FileNotFoundError(f"파일이 존재하지 않습니다: {file_path}")
+
+        file_stat = os.stat(file_path)
+        state = self._states.get(file_path)
+        if state is not None and self.is_current(file_path, file_stat):
+            return 0
+
+        replaced = state is not None and state.inode and state.inode != file_stat.st_ino
+        if state is None or replaced or file_stat.st_size < state.offset:
+            if state is not None:
+                logger.info(f"파일이 잘리거나 교체되어 처음부터 다시 읽습니다: {file_path}")
+            state = self._start(file_path)
+
+        with open(file_path, 'rb') as f:
+            f.seek(state.offset)
+            chunk = f.read(file_stat.st_size - state.offset)
+
+        # 기록 중인 마지막 행(개행 없음)은 다음 호출로 미룸
+        end = chunk.rfind(b'\n') + 1
+        appended = self._parse_rows(chunk[:end], state)
+        state.offset += end
+        state.mtime_ns = file_stat.st_mtime_ns
+        state.size = file_stat.st_size
+        state.inode = file_stat.st_ino
+
+        if appended is not None and len(appended) > 0:
+            state.chunks.append(appended)
+            state.unsaved = True
+            added = len(appended)
+            logger.debug(f"테일 읽기: {file_path} +{added} 행 (합치지 않은 추가분 {len(state.chunks)}개)")
+        else:
+            added = 0
+
+        self._states[file_path] = state
+        return added
+
+    def forget(self, file_path: str) -> None:
+        """파일 추적 중단"""
+        with self._lock:
+            self._states.pop(file_path, None)
+
+    def clear(self) -> None:
+        """모든 추적 상태 제거"""
+        with self._lock:
+            self._states.clear()
+
+    def _start(self, file_path: str) -> TailState:
+        """헤더만 읽은 빈 상태 생성"""
+        with open(file_path, 'rb') as f:
+            columns = _read_header(f)
+            offset = f.tell()
+
+        missing_columns = [col for col in self.required_columns if col not in columns]
+        if missing_columns:
+            raise ValueError(f"필수 컬럼이 누락되었습니다: {missing_columns}")
+
+        return TailState(offset=offset, last_count=-1, columns=columns,
+                         mtime_ns=0, size=0, frame=pd.DataFrame(columns=self.required_columns))
+
+    def _parse_rows(self, data: bytes, state: TailState) -> Optional[pd.DataFrame]:
+        """추가된 바이트 구간을 파싱하고 이미 반영한 Count 이하 행 제거"""
+        if not data.strip():
+            return None
+
+        has_count = 'Count' in state.columns and 'Count' not in self.required_columns
+        columns = self.required_columns + (['Count'] if has_count else [])
+        df = parse_touch_log(io.BytesIO(data), columns, names=state.columns)
+        if has_count:
+            counts = df['Count']
+            df = df[counts > state.last_count].drop(columns='Count')
+            if len(counts) > 0:
+                state.last_count = max(state.last_count, int(counts.max()))
+
+        return add_event_columns(df.reset_index(drop=True), self.classifier)
+
+
+def _read_header(f) -> List[str]:
+    """파일 첫 줄(헤더)을 컬럼 목록으로 읽기"""
+    header = f.readline()
+    if not header.endswith(b'\n'):
+        raise ValueError("헤더 행이 아직 완성되지 않았습니다")
+    return [name.strip() for name in header.decode('utf-8-sig').rstrip('\r\n').split(',')]
+
+
+def _last_complete_line(f, size: int) -> Tuple[int, bytes]:
+    """
+    파일의 마지막 완전한 행과 그 끝 위치 찾기
+
+    Returns:
+        Tuple[int, bytes]: 마지막 개행 다음 바이트 위치, 마지막 완전한 행
+    """
+    start = max(0, size - _TAIL_PROBE_BYTES)
+    f.seek(start)
+    block = f.read(size - start)
+    end = block.rfind(b'\n')
+    if end < 0:
+        return start, b''
+    lines = block[:end].splitlines()
+    return start + end + 1, (lines[-1] if lines else b'')
+
+
+def _parse_count(line: bytes) -> int:
+    """행의 첫 필드(Count)를 정수로 변환 (실패 시 -1)"""
+    try:
+        return int(line.split(b',', 1)[0])
+    except ValueError:
+        return -1
+
+
+def _append_frames(base: pd.DataFrame, chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """누적 데이터프레임에 쌓인 추가분들을 한 번에 덧붙임 (범주형 컬럼은 범주를 합쳐 유지)"""
+    if len(base) == 0:
+        base, chunks = chunks[0].reset_index(drop=True), chunks[1:]
+    if not chunks:
+        return base
+
+    combined = pd.concat([base] + chunks, ignore_index=True)
+    for name in base.columns:
+        if (isinstance(base[name].dtype, pd.CategoricalDtype)
+                and all(name in chunk.columns for chunk in chunks)
+                and not isinstance(combined[name].dtype, pd.CategoricalDtype)):
+            combined[name] = pd.api.types.union_categoricals(
+                [base[name]] + [chunk[name].astype('category') for chunk in chunks]
+            )
+    return combined
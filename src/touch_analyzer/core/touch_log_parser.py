@@ -0,0 +1,218 @@
+"""
+터치 로그 전용 파서 모듈
+고정 스키마(Count, Time(ms), Time(HH:mm:ss.SSS), Layer Name, TouchX, TouchY) CSV를
+필요한 컬럼만 작은 dtype으로 바로 읽어 후처리 변환을 생략
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 컬럼별 최종 dtype (좌표는 int32로 읽은 뒤 범위 확인 후 int16으로 축소)
+TOUCH_LOG_DTYPES: Dict[str, str] = {
+    'Count': 'int32',
+    'Time(ms)': 'int32',
+    'TouchX': 'int16',
+    'TouchY': 'int16',
+    'Layer Name': 'category',
+}
+
+# 파싱 단계 dtype (C 파서는 int16 범위 초과 값을 조용히 잘라내므로 넓게 읽음)
+_PARSE_DTYPES: Dict[str, str] = {
+    'Count': 'int32',
+    'Time(ms)': 'int32',
+    'TouchX': 'int32',
+    'TouchY': 'int32',
+    'Layer Name': 'category',
+}
+
+
+def parse_touch_log(source, columns: List[str],
+                    names: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    터치 로그 CSV를 지정한 컬럼만 압축 dtype으로 파싱
+
+    숫자 앞뒤 공백은 C 파서 단계에서 처리하고, 빈 값이나 깨진 값이 있으면
+    해당 컬럼만 벡터화된 변환으로 다시 처리한 뒤 그 행을 제거합니다.
+
+    Args:
+        source: 파일 경로 또는 바이너리 버퍼
+        columns: 읽을 컬럼 목록 (스키마에 없는 컬럼은 문자열로 읽음)
+        names: 헤더가 없는 입력일 때 사용할 전체 컬럼 이름
+
+    Returns:
+        pd.DataFrame: columns 순서의 데이터프레임
+
+    Raises:
+        ValueError: 필요한 컬럼이 파일에 없는 경우
+    """
+    read_options = dict(usecols=lambda name: name.strip() in columns,
+                        skipinitialspace=True, engine='c')
+    if names is not None:
+        read_options.update(header=None, names=names)
+
+    typed_options = dict(read_options,
+                         dtype={col: _PARSE_DTYPES[col] for col in columns if col in _PARSE_DTYPES})
+    try:
+        df = pd.read_csv(source, **typed_options)
+    except ValueError as e:
+        if not _is_conversion_error(e):
+            raise
+        # 빈 값/잘못된 숫자가 섞인 파일: 숫자 컬럼을 문자열로 읽어 강제 변환
+        logger.debug(f"고정 dtype 파싱 실패, 관대한 변환으로 재시도: {str(e)}")
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        df = pd.read_csv(source, **dict(read_options, dtype=str))
+        df = _coerce_numeric(df)
+
+    df.columns = [name.strip() for name in df.columns]
+    missing_columns = [col for col in columns if col not in df.columns]
+    if missing_columns:
+        raise ValueError(f"필수 컬럼이 누락되었습니다: {missing_columns}")
+
+    data = {}
+    for col in columns:
+        series = df[col]
+        if col in ('TouchX', 'TouchY'):
+            series = _narrow_int(series, TOUCH_LOG_DTYPES[col])
+        elif col == 'Layer Name':
+            series = _strip_categories(series)
+        data[col] = series
+    return pd.DataFrame(data, copy=False)
+
+
+def parse_touch_log_chunked(source, columns: List[str], chunk_size: int,
+                            names: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    대용량 터치 로그를 청크 단위로 파싱 (최대 메모리 사용량 제한)
+
+    청크마다 숫자 변환과 dtype 축소를 마친 컬럼 배열만 보관하므로,
+    최대 메모리는 최종 압축 컬럼 + 원본 청크 하나 수준으로 유지됩니다.
+
+    Args:
+        source: 파일 경로 또는 바이너리 버퍼
+        columns: 읽을 컬럼 목록
+        chunk_size: 청크당 행 수
+        names: 헤더가 없는 입력일 때 사용할 전체 컬럼 이름
+
+    Returns:
+        pd.DataFrame: columns 순서의 데이터프레임
+
+    Raises:
+        ValueError: 필요한 컬럼이 파일에 없는 경우
+    """
+    read_options = dict(usecols=lambda name: name.strip() in columns,
+                        skipinitialspace=True, engine='c', chunksize=chunk_size,
+                        dtype={col: 'category' for col in columns
+                               if _PARSE_DTYPES.get(col) == 'category'})
+    if names is not None:
+        read_options.update(header=None, names=names)
+
+    parts: Dict[str, list] = {col: [] for col in columns}
+    chunk_count = 0
+    with pd.read_csv(source, **read_options) as reader:
+        for chunk in reader:
+            chunk.columns = [name.strip() for name in chunk.columns]
+            missing_columns = [col for col in columns if col not in chunk.columns]
+            if missing_columns:
+                raise ValueError(f"필수 컬럼이 누락되었습니다: {missing_columns}")
+
+            for col, values in _coerce_chunk(chunk, columns).items():
+                parts[col].append(values)
+            chunk_count += 1
+            del chunk
+
+    if chunk_count == 0:
+        return parse_touch_log(source, columns, names=names)
+
+    data = {}
+    for col in columns:
+        values = parts.pop(col)
+        if values and isinstance(values[0], pd.Series):
+            series = pd.Series(pd.api.types.union_categoricals(values), copy=False)
+            data[col] = _strip_categories(series)
+        else:
+            series = pd.Series(np.concatenate(values), copy=False)
+            if col in ('TouchX', 'TouchY'):
+                series = _narrow_int(series, TOUCH_LOG_DTYPES[col])
+            data[col] = series
+
+    logger.debug(f"청크 파싱 완료: {chunk_count}개 청크, {len(data[columns[0]])} 행")
+    return pd.DataFrame(data, copy=False)
+
+
+def _coerce_chunk(chunk: pd.DataFrame, columns: List[str]) -> Dict[str, object]:
+    """청크의 숫자 컬럼을 파싱 dtype 배열로 변환 (변환 불가 행 제거)"""
+    arrays: Dict[str, object] = {}
+    valid = None
+    for col in columns:
+        series = chunk[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            arrays[col] = series
+            continue
+        if col not in _PARSE_DTYPES:
+            arrays[col] = series.to_numpy()
+            continue
+        if not pd.api.types.is_integer_dtype(series):
+            if not pd.api.types.is_numeric_dtype(series):
+                series = series.astype(str).str.strip()
+            series = pd.to_numeric(series, errors='coerce')
+            mask = series.notna().to_numpy()
+            if not mask.all():
+                valid = mask if valid is None else valid & mask
+        arrays[col] = series.to_numpy()
+
+    if valid is not None:
+        arrays = {col: values[valid] for col, values in arrays.items()}
+    return {col: values.astype(_PARSE_DTYPES[col])
+            if col in _PARSE_DTYPES and not isinstance(values, pd.Series) else values
+            for col, values in arrays.items()}
+
+
+def _is_conversion_error(error: ValueError) -> bool:
+    """고정 dtype 변환 실패인지 (컬럼 누락 등 다른 오류와 구분)"""
+    message = str(error)
+    return ('Integer column has NA' in message
+            or 'invalid literal' in message
+            or 'Unable to parse' in message
+            or 'cannot safely convert' in message)
+
+
+def _coerce_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """숫자 컬럼을 벡터화 변환하고 변환 불가 행 제거"""
+    numeric_columns = [col for col in df.columns
+                       if col.strip() in _PARSE_DTYPES and _PARSE_DTYPES[col.strip()] != 'category']
+    for col in numeric_columns:
+        df[col] = pd.to_numeric(df[col].str.strip(), errors='coerce')
+
+    if numeric_columns:
+        df = df.dropna(subset=numeric_columns).reset_index(drop=True)
+    for col in numeric_columns:
+        df[col] = df[col].astype(_PARSE_DTYPES[col.strip()])
+    for col in df.columns:
+        if _PARSE_DTYPES.get(col.strip()) == 'category':
+            df[col] = df[col].astype('category')
+    return df
+
+
+def _narrow_int(series: pd.Series, dtype) -> pd.Series:
+    """값이 범위 안에 있으면 더 작은 정수 dtype으로 축소"""
+    info = np.iinfo(np.dtype(dtype))
+    if len(series) == 0 or (series.min() >= info.min and series.max() <= info.max):
+        return series.astype(dtype)
+    return series
+
+
+def _strip_categories(series: pd.Series) -> pd.Series:
+    """범주 이름의 앞뒤 공백 제거 (범주 목록만 변경하므로 행 수와 무관)"""
+    categories = series.cat.categories
+    stripped = categories.astype(str).str.strip()
+    if stripped.equals(categories.astype(str)):
+        return series
+    if stripped.is_unique:
+        return series.cat.rename_categories(stripped)
+    return series.astype(str).str.strip().astype('category')
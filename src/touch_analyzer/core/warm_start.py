@@ -0,0 +1,109 @@
+"""
+웜 스타트 저장소 모듈 - 재시작 후 마지막 작업 상태 복원
+마지막 선택(사용자/Task)과 그 선택의 작은 파생 결과를 data_cache/에 저장하고,
+다음 실행에서 선택 지문이 같을 때만 재사용
+"""
+
+import os
+import json
+import pickle
+import shutil
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 저장 형식이 바뀌면 증가시켜 이전 상태를 자동 무효화
+WARM_START_VERSION = 2
+STATE_FILENAME = "state.json"
+DERIVED_FILENAME = "derived.pkl"
+
+
+class WarmStartStore:
+    """선택 지문(카탈로그 파일 ID + mtime + 크기)으로 검증되는 마지막 세션 상태 저장소"""
+
+    def __init__(self, cache_dir: str):
+        """
+        웜 스타트 저장소 초기화
+
+        Args:
+            cache_dir: 캐시 루트 디렉토리 (하위에 warm_start/ 생성)
+        """
+        self.store_dir = os.path.join(cache_dir, "warm_start")
+
+    def save(self, selection: Dict[str, Any], derived: List[Tuple[str, Any]]) -> bool:
+        """
+        마지막 선택과 파생 결과 저장
+
+        Args:
+            selection: 'users', 'tasks', 'files', 'selection_key'를 담은 선택 상태
+            derived: (캐시 키, 값) 목록 - 데이터프레임이 아닌 작은 값만 전달
+
+        Returns:
+            bool: 저장 여부
+        """
+        state = dict(selection, version=WARM_START_VERSION)
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            _atomic_write(os.path.join(self.store_dir, DERIVED_FILENAME),
+                          pickle.dumps(derived, protocol=pickle.HIGHEST_PROTOCOL))
+            _atomic_write(os.path.join(self.store_dir, STATE_FILENAME),
+                          json.dumps(state, ensure_ascii=False).encode('utf-8'))
+        except (OSError, pickle.PicklingError, TypeError) as e:
+            logger.warning(f"웜 스타트 상태 저장 실패: {str(e)}")
+            return False
+
+        logger.info(f"웜 스타트 상태 저장: 파일 {len(selection.get('files', []))}개, "
+                    f"파생 결과 {len(derived)}개")
+        return True
+
+    def load_selection(self) -> Optional[Dict[str, Any]]:
+        """
+        저장된 선택 상태 읽기
+
+        Returns:
+            Optional[Dict[str, Any]]: 선택 상태 (없거나 형식이 다르면 None)
+        """
+        try:
+            with open(os.path.join(self.store_dir, STATE_FILENAME), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if state.get('version') != WARM_START_VERSION:
+            return None
+        return state
+
+    def load_derived(self, selection_key: str) -> List[Tuple[str, Any]]:
+        """
+        선택 지문이 포함된 파생 결과만 읽기
+
+        저장 시점 이후 파일이 바뀌었다면 지문이 달라져 아무것도 반환하지 않습니다.
+
+        Args:
+            selection_key: 현재 파일 상태로 계산한 선택 지문
+
+        Returns:
+            List[Tuple[str, Any]]: (캐시 키, 값) 목록
+        """
+        try:
+            # 이 앱이 직접 쓴 캐시 디렉토리의 파일만 읽음
+            with open(os.path.join(self.store_dir, DERIVED_FILENAME), 'rb') as f:
+                derived = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.debug(f"웜 스타트 파생 결과 읽기 실패: {str(e)}")
+            return []
+
+        return [(key, value) for key, value in derived if selection_key in key]
+
+    def clear(self) -> None:
+        """저장된 상태 삭제"""
+        shutil.rmtree(self.store_dir, ignore_errors=True)
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체 (종료 중 중단되어도 이전 파일 유지)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
@@ -4,17 +4,57 @@
 
 import os
 import gc
+import time
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Tuple
 import weakref
 
 logger = logging.getLogger(__name__)
 
 
+def enable_copy_on_write() -> bool:
+    """
+    pandas Copy-on-Write 모드 활성화 (pandas 3.0부터는 항상 켜져 있음)
+    
+    CoW 모드에서는 얕은 복사본을 수정해도 원본 버퍼가 바뀌지 않으므로
+    캐시된 데이터프레임을 복사 없이 공유할 수 있습니다.
+    
+    Returns:
+        bool: CoW 모드 사용 가능 여부
+    """
+    try:
+        import pandas as pd
+        
+        if int(pd.__version__.split('.')[0]) >= 3:
+            return True
+        pd.set_option('mode.copy_on_write', True)
+        return True
+    except Exception as e:
+        logger.warning(f"Copy-on-Write 모드 활성화 실패: {str(e)}")
+        return False
+
+
+def copy_on_write_enabled() -> bool:
+    """
+    pandas Copy-on-Write 모드가 현재 켜져 있는지 확인 (설정은 바꾸지 않음)
+    
+    Returns:
+        bool: CoW 모드 여부
+    """
+    try:
+        import pandas as pd
+        
+        if int(pd.__version__.split('.')[0]) >= 3:
+            return True
+        return pd.get_option('mode.copy_on_write') is True
+    except Exception:
+        return False
+
+
 class MemoryMonitor:
     """최적화된 메모리 사용량 모니터링 클래스"""
     
-    def __init__(self, enable_monitoring: bool = True, threshold_mb: float = 1000.0):
+    def __init__(self, enable_monitoring: bool = True, threshold_mb: float = 800.0):
         """
         메모리 모니터 초기화
         
@@ -181,6 +221,110 @@ class MemoryMonitor:
         return stats
 
 
+class MemoryPressureController:
+    """RSS가 상한 수위를 넘으면 하한 수위까지 등록된 해제 함수를 순서대로 호출하는 컨트롤러"""
+    
+    def __init__(self, monitor: MemoryMonitor, high_watermark_mb: float,
+                 low_watermark_mb: float, cooldown_seconds: float = 10.0):
+        """
+        메모리 압박 컨트롤러 초기화
+        
+        Args:
+            monitor: RSS를 측정할 메모리 모니터
+            high_watermark_mb: 해제를 시작하는 RSS (MB)
+            low_watermark_mb: 해제를 멈추고 압박 상태를 해제하는 RSS (MB)
+            cooldown_seconds: 연속 해제 사이의 최소 간격 (초, 측정값 흔들림에 의한 반복 해제 방지)
+        """
+        self.monitor = monitor
+        self.high_watermark_mb = high_watermark_mb
+        self.low_watermark_mb = min(low_watermark_mb, high_watermark_mb)
+        self.cooldown_seconds = cooldown_seconds
+        # (우선순위, 이름, 해제 함수) - 해제 함수는 비울 바이트 수를 받아 비운 바이트 수를 반환
+        self._releasers: List[Tuple[int, str, Callable[[int], int]]] = []
+        self._under_pressure = False
+        self._last_release = 0.0
+        self._release_count = 0
+        self._freed_bytes = 0
+    
+    def add_releaser(self, name: str, release: Callable[[int], int], priority: int) -> None:
+        """
+        해제 함수 등록 (우선순위 값이 작을수록 먼저 호출)
+        
+        다시 만들기 쉬운 파생 데이터(그림, 필터 결과)를 앞에, 원본 캐시를 뒤에 둡니다.
+        
+        Args:
+            name: 로그용 이름
+            release: 비울 바이트 수를 받아 실제로 비운 바이트 수를 반환하는 함수
+            priority: 호출 순서
+        """
+        self._releasers.append((priority, name, release))
+        self._releasers.sort(key=lambda item: item[0])
+    
+    def check(self) -> bool:
+        """
+        RSS를 측정하고 필요하면 메모리 해제 (주기적으로 호출)
+        
+        상한을 넘으면 압박 상태가 되고, 하한 아래로 내려갈 때까지 쿨다운 간격으로 해제를 반복합니다.
+        
+        Returns:
+            bool: 이번 호출에서 해제를 수행했는지 여부
+        """
+        memory_mb = self.monitor.get_memory_usage()
+        if memory_mb is None:
+            return False
+        
+        if not self._under_pressure:
+            if memory_mb <= self.high_watermark_mb:
+                return False
+            self._under_pressure = True
+            logger.warning(f"메모리 압박 감지: {memory_mb:.1f} MB > {self.high_watermark_mb:.1f} MB")
+        elif memory_mb <= self.low_watermark_mb:
+            self._under_pressure = False
+            logger.info(f"메모리 압박 해소: {memory_mb:.1f} MB")
+            return False
+        
+        now = time.monotonic()
+        if now - self._last_release < self.cooldown_seconds:
+            return False
+        self._last_release = now
+        self._release(memory_mb)
+        return True
+    
+    def _release(self, memory_mb: float) -> None:
+        """하한 수위까지 필요한 만큼 우선순위 순서로 해제"""
+        target = int((memory_mb - self.low_watermark_mb) * 1024 * 1024)
+        freed = 0
+        for _, name, release in self._releasers:
+            if freed >= target:
+                break
+            try:
+                released = release(target - freed)
+            except Exception as e:
+                logger.warning(f"메모리 해제 실패 ({name}): {str(e)}")
+                continue
+            freed += released
+            if released:
+                logger.debug(f"메모리 해제 ({name}): {released / 1024 / 1024:.1f} MB")
+        
+        gc.collect()
+        self._release_count += 1
+        self._freed_bytes += freed
+        after_mb = self.monitor.get_memory_usage()
+        after_text = f"{after_mb:.1f} MB" if after_mb is not None else "측정 불가"
+        logger.info(f"메모리 압박 해제: {freed / 1024 / 1024:.1f} MB 해제, 현재 {after_text}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """압박 대응 통계 반환"""
+        return {
+            'under_pressure': self._under_pressure,
+            'high_watermark_mb': self.high_watermark_mb,
+            'low_watermark_mb': self.low_watermark_mb,
+            'releases': self._release_count,
+            'freed_bytes': self._freed_bytes,
+            'releasers': [name for _, name, _ in self._releasers]
+        }
+
+
 def cleanup_matplotlib_memory():
     """matplotlib 메모리 정리 - 최적화된 버전"""
     try:
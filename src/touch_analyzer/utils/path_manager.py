@@ -60,6 +60,11 @@ class PathManager:
         """백업 폴더 경로 (backup)"""
         return self._project_root / "backup"
     
+    @property
+    def cache_dir(self) -> Path:
+        """파싱 캐시 폴더 경로 (data_cache)"""
+        return self._project_root / "data_cache"
+    
     @property
     def config_dir(self) -> Path:
         """설정 폴더 경로 (config)"""
@@ -87,6 +92,10 @@ class PathManager:
         """백업 폴더 경로를 문자열로 반환"""
         return str(self.backup_dir)
     
+    def get_cache_dir_str(self) -> str:
+        """파싱 캐시 폴더 경로를 문자열로 반환"""
+        return str(self.cache_dir)
+    
     # 디렉토리 생성 유틸리티 메서드들
     def ensure_data_dir(self) -> str:
         """데이터 폴더가 존재하지 않으면 생성하고 경로 반환"""
@@ -211,6 +220,8 @@ def get_resource_path(relative_path: str) -> str:
         return path_manager.get_output_dir_str()
     elif relative_path == "backup":
         return path_manager.get_backup_dir_str()
+    elif relative_path == "data_cache":
+        return path_manager.get_cache_dir_str()
     else:
         # 기본적으로 프로젝트 루트 기준 상대 경로
         return str(path_manager.project_root / relative_path)